@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import BaseModel
+
+from .llm import OpenAISettings
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT: Final = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW: Final = "24h"
+BATCH_INPUT_NAME = "batch-input.jsonl"
+BATCH_MANIFEST_NAME = "batch-manifest.json"
+# Recovers the request id from a truncated or otherwise unparsable output line.
+_CUSTOM_ID_PATTERN: Final = re.compile(r'"custom_id"\s*:\s*"([^"\\]+)"')
+
+
+class BatchError(Exception):
+    """Raised when a batch job cannot be submitted or collected."""
+
+    exit_code = 4
+
+    def __init__(self, message: str, *, exit_code: int | None = None) -> None:
+        super().__init__(message)
+        if exit_code is not None:
+            self.exit_code = exit_code
+
+
+class BatchPendingError(BatchError):
+    """Raised when a batch job has not finished yet."""
+
+
+@dataclass(frozen=True, slots=True)
+class BatchRequest:
+    """One chat completion to include in a batch job."""
+
+    custom_id: str
+    system_prompt: str
+    user_prompt: str
+
+
+@dataclass(frozen=True, slots=True)
+class BatchEntry:
+    """Where the result for one request should be written once the batch completes."""
+
+    custom_id: str
+    outputs: list[str]
+    focus: list[str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchManifest:
+    """Local record of a submitted batch, stored next to its outputs."""
+
+    batch_id: str
+    command: str
+    entries: list[BatchEntry]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOutcome:
+    """Message content (or the failure reason) for one request of a finished batch."""
+
+    content: str | None
+    error: str | None = None
+
+
+def build_batch_lines(
+    requests: Sequence[BatchRequest],
+    *,
+    model_name: str,
+    temperature: float,
+    output_type: type[BaseModel],
+    schema_name: str,
+    top_p: float | None = None,
+    seed: int | None = None,
+) -> list[dict[str, Any]]:
+    """Return one OpenAI batch input line per request, asking for JSON matching `output_type`."""
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {"name": schema_name, "schema": output_type.model_json_schema()},
+    }
+    lines: list[dict[str, Any]] = []
+    for request in requests:
+        body: dict[str, Any] = {
+            "model": model_name,
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.user_prompt},
+            ],
+            "temperature": temperature,
+            "response_format": response_format,
+        }
+        if top_p is not None:
+            body["top_p"] = top_p
+        if seed is not None:
+            body["seed"] = seed
+        lines.append({"custom_id": request.custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body})
+    return lines
+
+
+def write_batch_input(path: Path, lines: Iterable[dict[str, Any]]) -> None:
+    """Write batch input lines as JSONL."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for line in lines:
+            handle.write(json.dumps(line, ensure_ascii=False))
+            handle.write("\n")
+
+
+def submit_batch(input_path: Path, *, settings: OpenAISettings | None = None, description: str = "scribae") -> str:
+    """Upload a JSONL input file and start a batch job; returns the batch id."""
+    client = _client(settings or OpenAISettings.from_env())
+    try:
+        with input_path.open("rb") as handle:
+            uploaded = client.files.create(file=handle, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+            metadata={"description": description},
+        )
+    except OSError as exc:
+        raise BatchError(f"Unable to read batch input {input_path}: {exc}", exit_code=3) from exc
+    except Exception as exc:
+        raise BatchError(f"Batch submission failed: {exc}") from exc
+    logger.debug("Submitted batch %s from %s", batch.id, input_path)
+    return str(batch.id)
+
+
+def collect_batch(batch_id: str, *, settings: OpenAISettings | None = None) -> dict[str, BatchOutcome]:
+    """Return the outcome of every request in a completed batch, keyed by custom id."""
+    client = _client(settings or OpenAISettings.from_env())
+    try:
+        batch = client.batches.retrieve(batch_id)
+    except Exception as exc:
+        raise BatchError(f"Unable to retrieve batch {batch_id}: {exc}") from exc
+
+    if batch.status in {"validating", "in_progress", "finalizing"}:
+        raise BatchPendingError(f"Batch {batch_id} is still {batch.status}; collect it again later.")
+    if batch.status != "completed":
+        raise BatchError(f"Batch {batch_id} ended with status '{batch.status}'.")
+
+    outcomes: dict[str, BatchOutcome] = {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        try:
+            payload = client.files.content(file_id).text
+        except Exception as exc:
+            raise BatchError(f"Unable to download batch results for {batch_id}: {exc}") from exc
+        outcomes.update(parse_batch_output(payload))
+    return outcomes
+
+
+def parse_batch_output(payload: str) -> dict[str, BatchOutcome]:
+    """Parse OpenAI batch output JSONL into outcomes keyed by custom id."""
+    outcomes: dict[str, BatchOutcome] = {}
+    for raw_line in payload.splitlines():
+        if not raw_line.strip():
+            continue
+        try:
+            line = json.loads(raw_line)
+        except json.JSONDecodeError as exc:
+            line = None
+            problem = f"Malformed batch output line: {exc.msg}."
+        else:
+            problem = "Malformed batch output line: expected a JSON object."
+        if not isinstance(line, dict):
+            match = _CUSTOM_ID_PATTERN.search(raw_line)
+            if match is None:
+                logger.warning("Skipping batch output line without a readable custom_id: %s", problem)
+                continue
+            outcomes[match.group(1)] = BatchOutcome(content=None, error=problem)
+            continue
+        custom_id = str(line.get("custom_id"))
+        error = line.get("error")
+        response = line.get("response") or {}
+        if error:
+            outcomes[custom_id] = BatchOutcome(content=None, error=str(error.get("message") or error))
+            continue
+        if response.get("status_code") != 200:
+            outcomes[custom_id] = BatchOutcome(content=None, error=f"HTTP {response.get('status_code')}")
+            continue
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            outcomes[custom_id] = BatchOutcome(content=None, error="Response contained no message content.")
+            continue
+        outcomes[custom_id] = BatchOutcome(content=content)
+    return outcomes
+
+
+def write_manifest(out_dir: Path, manifest: BatchManifest) -> Path:
+    """Store the manifest that `--batch-collect` uses to place results."""
+    path = out_dir / BATCH_MANIFEST_NAME
+    payload = {
+        "batch_id": manifest.batch_id,
+        "command": manifest.command,
+        "entries": [
+            {"custom_id": entry.custom_id, "outputs": entry.outputs, "focus": entry.focus} for entry in manifest.entries
+        ],
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def read_manifest(out_dir: Path, *, batch_id: str, command: str) -> BatchManifest:
+    """Load the manifest written at submission time and check it belongs to this batch."""
+    path = out_dir / BATCH_MANIFEST_NAME
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        manifest = BatchManifest(
+            batch_id=payload["batch_id"],
+            command=payload["command"],
+            entries=[
+                BatchEntry(custom_id=item["custom_id"], outputs=list(item["outputs"]), focus=item.get("focus"))
+                for item in payload["entries"]
+            ],
+        )
+    except FileNotFoundError as exc:
+        raise BatchError(f"Batch manifest not found: {path}", exit_code=3) from exc
+    except OSError as exc:
+        raise BatchError(f"Unable to read batch manifest: {exc}", exit_code=3) from exc
+    except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        raise BatchError(f"Batch manifest is invalid: {path}", exit_code=3) from exc
+
+    if manifest.batch_id != batch_id or manifest.command != command:
+        raise BatchError(
+            f"{path} belongs to {manifest.command} batch {manifest.batch_id}, not {command} batch {batch_id}.",
+            exit_code=2,
+        )
+    return manifest
+
+
+def _client(settings: OpenAISettings) -> OpenAI:
+    from openai import OpenAI
+
+    return OpenAI(base_url=settings.base_url, api_key=settings.api_key)
+
+
+__all__ = [
+    "BATCH_INPUT_NAME",
+    "BATCH_MANIFEST_NAME",
+    "BatchEntry",
+    "BatchError",
+    "BatchManifest",
+    "BatchOutcome",
+    "BatchPendingError",
+    "BatchRequest",
+    "build_batch_lines",
+    "collect_batch",
+    "parse_batch_output",
+    "read_manifest",
+    "submit_batch",
+    "write_batch_input",
+    "write_manifest",
+]
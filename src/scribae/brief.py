@@ -1,27 +1,49 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
-from pydantic_ai import Agent, NativeOutput, UnexpectedModelBehavior
-from pydantic_ai.settings import ModelSettings
+from pydantic_core import to_json
 
 from .common import current_timestamp, report, slugify
 from .idea import Idea, IdeaList
-from .io_utils import NoteDetails, Reporter, load_note
-from .language import LanguageMismatchError, LanguageResolutionError, ensure_language_output, resolve_output_language
-from .llm import LLM_OUTPUT_RETRIES, LLM_TIMEOUT_SECONDS, OpenAISettings, apply_optional_settings, make_model
+from .io_utils import NoteDetails, Reporter, load_notes
+from .language import (
+    LanguageMismatchError,
+    LanguageResolutionError,
+    ensure_language_output,
+    ensure_language_output_async,
+    resolve_output_language,
+)
+from .llm import (
+    LLM_OUTPUT_RETRIES,
+    LLM_TIMEOUT_SECONDS,
+    OpenAISettings,
+    apply_optional_settings,
+    close_http_client,
+    make_model,
+    register_client_cache,
+    run_sync,
+    with_timeout,
+)
 from .project import ProjectConfig
 from .prompts.brief import SYSTEM_PROMPT, PromptBundle, build_prompt_bundle
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_CONCURRENCY = 4
+
+_AgentKey = tuple[str, str, str, float, float | None, int | None]
+_agent_cache: dict[_AgentKey, Agent[None, SeoBrief]] = register_client_cache({})
+
 __all__ = [
     # re-exports for tests and public API
     "NoteDetails",
@@ -32,10 +54,16 @@ __all__ = [
     "OpenAISettings",
     "load_ideas",
     # functions
+    "load_briefing_note",
     "prepare_context",
+    "prepare_contexts",
     "generate_brief",
+    "generate_briefs_batch",
+    "parse_brief_json",
     "render_json",
+    "render_json_bytes",
     "save_prompt_artifacts",
+    "close_agents",
 ]
 
 
@@ -133,8 +161,35 @@ class SeoBrief(BaseModel):
             raise ValueError("faq must include between 2 and 5 entries")
         return value
 
+    # Plain properties: briefs are mutable models, and a cached join would go stale after an edit
+    # or a model_copy(update=...).
+    @property
+    def secondary_keywords_text(self) -> str:
+        """Secondary keywords joined with commas."""
+        return ", ".join(self.secondary_keywords)
+
+    @property
+    def outline_text(self) -> str:
+        """Outline headings joined with pipes."""
+        return " | ".join(self.outline)
+
+    @property
+    def faq_text(self) -> str:
+        """FAQ entries rendered as `question — answer`, joined with pipes."""
+        return " | ".join(f"{item.question} — {item.answer}" for item in self.faq)
+
+    @property
+    def faq_qa_text(self) -> str:
+        """FAQ entries rendered as `- Q:`/`A:` bullet pairs, one per line."""
+        entries = [
+            f"- Q: {question}\n  A: {answer}"
+            for item in self.faq
+            if (question := item.question.strip()) and (answer := item.answer.strip())
+        ]
+        return "\n".join(entries) if entries else "(no FAQ items provided)"
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BriefingContext:
     """Artifacts required to generate a brief."""
 
@@ -156,8 +211,12 @@ def prepare_context(
     idea: Idea | None = None,
     language_detector: Callable[[str], str] | None = None,
     reporter: Reporter = None,
+    note: NoteDetails | None = None,
 ) -> BriefingContext:
-    """Load note data and build the prompt bundle."""
+    """Load note data and build the prompt bundle.
+
+    Pass `note` when the note at `note_path` has already been loaded (see `prepare_contexts`).
+    """
     if max_chars <= 0:
         raise BriefValidationError("--max-chars must be greater than zero.")
     if idea is not None and ideas_path is not None:
@@ -167,14 +226,8 @@ def prepare_context(
     if ideas_path is None and idea_selector:
         raise BriefValidationError("--idea requires --ideas.")
 
-    try:
-        note = load_note(note_path, max_chars=max_chars)
-    except FileNotFoundError as exc:
-        raise BriefFileError(f"Note file not found: {note_path}") from exc
-    except ValueError as exc:
-        raise BriefFileError(str(exc)) from exc
-    except OSError as exc:  # pragma: no cover - surfaced by CLI
-        raise BriefFileError(f"Unable to read note: {exc}") from exc
+    if note is None:
+        note = load_briefing_note(note_path, max_chars=max_chars)
 
     report(reporter, f"Loaded note '{note.title}' from {note.path}")
 
@@ -222,6 +275,43 @@ def prepare_context(
     )
 
 
+def load_briefing_note(note_path: Path, *, max_chars: int) -> NoteDetails:
+    """Load a single note, reporting read and parse failures as `BriefFileError`."""
+    return _load_notes([note_path], max_chars=max_chars)[0]
+
+
+def prepare_contexts(
+    note_paths: Sequence[Path],
+    *,
+    project: ProjectConfig,
+    max_chars: int,
+    language: str | None = None,
+    ideas_path: Path | None = None,
+    idea_selector: str | None = None,
+    language_detector: Callable[[str], str] | None = None,
+    reporter: Reporter = None,
+) -> list[BriefingContext]:
+    """Build briefing contexts for several notes, reading the note files concurrently."""
+    if max_chars <= 0:
+        raise BriefValidationError("--max-chars must be greater than zero.")
+
+    notes = _load_notes(note_paths, max_chars=max_chars)
+    return [
+        prepare_context(
+            note_path=note_path,
+            project=project,
+            max_chars=max_chars,
+            language=language,
+            ideas_path=ideas_path,
+            idea_selector=idea_selector,
+            language_detector=language_detector,
+            reporter=reporter,
+            note=note,
+        )
+        for note_path, note in zip(note_paths, notes, strict=True)
+    ]
+
+
 def generate_brief(
     context: BriefingContext,
     *,
@@ -261,48 +351,135 @@ def generate_brief(
                 language_detector=language_detector,
             ),
         )
-    except UnexpectedModelBehavior as exc:
-        raise BriefValidationError(
-            "LLM response never satisfied the SeoBrief schema, giving up after repeated retries."
-        ) from exc
-    except LanguageMismatchError as exc:
-        raise BriefValidationError(str(exc)) from exc
-    except LanguageResolutionError as exc:
-        raise BriefValidationError(str(exc)) from exc
-    except TimeoutError as exc:
-        raise BriefLLMError(f"LLM request timed out after {int(timeout_seconds)} seconds.") from exc
     except KeyboardInterrupt:
         raise
-    except Exception as exc:  # pragma: no cover - surfaced to CLI
-        raise BriefLLMError(f"LLM request failed: {exc}") from exc
+    except Exception as exc:
+        raise _as_briefing_error(exc, timeout_seconds=timeout_seconds) from exc
 
     report(reporter, "LLM call complete, structured brief validated.")
     logger.debug("Brief generation completed successfully")
     return brief
 
 
+def generate_briefs_batch(
+    contexts: Sequence[BriefingContext],
+    *,
+    model_name: str,
+    temperature: float,
+    top_p: float | None = None,
+    seed: int | None = None,
+    reporter: Reporter = None,
+    settings: OpenAISettings | None = None,
+    agent: Agent[None, SeoBrief] | None = None,
+    timeout_seconds: float = LLM_TIMEOUT_SECONDS,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    language_detector: Callable[[str], str] | None = None,
+    on_result: Callable[[int, SeoBrief], None] | None = None,
+) -> list[SeoBrief]:
+    """Generate briefs for several contexts concurrently and return them in input order.
+
+    All requests share one agent and one event loop; at most `concurrency` requests are in flight at once.
+    `on_result(index, brief)` is called as soon as each brief validates, so callers can persist it right away.
+    A failed request does not stop the others: once every request has settled, the failures are raised
+    together as one BriefingError.
+    """
+    if concurrency <= 0:
+        raise BriefValidationError("--concurrency must be greater than zero.")
+    if not contexts:
+        return []
+
+    logger.debug("Generating %d briefs with model '%s'", len(contexts), model_name)
+    resolved_settings = settings or OpenAISettings.from_env()
+    llm_agent: Agent[None, SeoBrief] = (
+        _create_agent(model_name, resolved_settings, temperature=temperature, top_p=top_p, seed=seed)
+        if agent is None
+        else agent
+    )
+
+    report(
+        reporter,
+        f"Calling model '{model_name}' via {resolved_settings.base_url} "
+        f"for {len(contexts)} briefs (concurrency={concurrency})",
+    )
+
+    async def _generate_all() -> list[SeoBrief | BaseException]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _generate_one(index: int, context: BriefingContext) -> SeoBrief:
+            async with semaphore:
+                brief = await ensure_language_output_async(
+                    prompt=context.prompts.user_prompt,
+                    expected_language=context.language,
+                    invoke=lambda prompt: _run_agent(llm_agent, prompt, timeout_seconds=timeout_seconds),
+                    extract_text=_brief_language_text,
+                    reporter=reporter,
+                    language_detector=language_detector,
+                )
+            report(reporter, f"Brief ready for '{_context_label(context)}'.")
+            if on_result is not None:
+                on_result(index, cast(SeoBrief, brief))
+            return cast(SeoBrief, brief)
+
+        # Settle every request before reporting failures, so one error neither discards finished briefs
+        # nor leaves sibling requests running on the shared loop.
+        return await asyncio.gather(
+            *(_generate_one(index, context) for index, context in enumerate(contexts)), return_exceptions=True
+        )
+
+    outcomes = run_sync(_generate_all())
+    briefs: list[SeoBrief] = []
+    failures: list[tuple[str, BriefingError]] = []
+    for context, outcome in zip(contexts, outcomes, strict=True):
+        if isinstance(outcome, SeoBrief):
+            briefs.append(outcome)
+        elif isinstance(outcome, Exception):
+            failures.append((_context_label(context), _as_briefing_error(outcome, timeout_seconds=timeout_seconds)))
+        else:
+            raise outcome
+    if failures:
+        first = failures[0][1]
+        details = "\n".join(f"- {label}: {error}" for label, error in failures)
+        raise type(first)(f"{len(failures)} of {len(contexts)} briefs failed:\n{details}", exit_code=first.exit_code)
+
+    report(reporter, f"LLM calls complete, {len(briefs)} structured briefs validated.")
+    logger.debug("Batch brief generation completed successfully")
+    return briefs
+
+
 def render_json(result: SeoBrief) -> str:
     """Return the brief as a JSON string."""
-    return json.dumps(result.model_dump(), indent=2, ensure_ascii=False)
+    return result.model_dump_json(indent=2)
+
+
+def render_json_bytes(result: SeoBrief) -> bytes:
+    """Return the brief as UTF-8 encoded JSON, ready to be written to disk."""
+    return to_json(result, indent=2)
+
+
+def parse_brief_json(content: str | bytes) -> SeoBrief:
+    """Validate model output produced outside the agent (e.g. by a Batch API job)."""
+    try:
+        return SeoBrief.model_validate_json(content)
+    except ValidationError as exc:
+        raise BriefValidationError(f"Model output failed validation: {exc}") from exc
 
 
 def load_ideas(path: Path) -> IdeaList:
     """Load and validate idea JSON from disk."""
     try:
-        payload = path.read_text(encoding="utf-8")
+        payload = path.read_bytes()
     except FileNotFoundError as exc:
         raise BriefFileError(f"Idea file not found: {path}") from exc
     except OSError as exc:
         raise BriefFileError(f"Unable to read idea file: {exc}") from exc
 
+    # Parsing and validation both run in pydantic-core, without an intermediate Python dict.
     try:
-        data = json.loads(payload)
-    except json.JSONDecodeError as exc:
-        raise BriefValidationError(f"Idea file is not valid JSON: {exc}") from exc
-
-    try:
-        return IdeaList.model_validate(data)
+        return IdeaList.model_validate_json(payload)
     except ValidationError as exc:
+        json_errors = [error for error in exc.errors() if error["type"] == "json_invalid"]
+        if json_errors:
+            raise BriefValidationError(f"Idea file is not valid JSON: {json_errors[0]['msg']}") from exc
         raise BriefValidationError(f"Idea file does not match schema: {exc}") from exc
 
 
@@ -328,6 +505,21 @@ def save_prompt_artifacts(
     return prompt_path, note_path
 
 
+def close_agents() -> None:
+    """Drop cached agents and close the HTTP connections they share."""
+    _agent_cache.clear()
+    close_http_client()
+
+
+def _load_notes(note_paths: Sequence[Path], *, max_chars: int) -> list[NoteDetails]:
+    try:
+        return load_notes(note_paths, max_chars=max_chars)
+    except (FileNotFoundError, ValueError) as exc:
+        raise BriefFileError(str(exc)) from exc
+    except OSError as exc:  # pragma: no cover - surfaced by CLI
+        raise BriefFileError(f"Unable to read note: {exc}") from exc
+
+
 def _create_agent(
     model_name: str,
     settings: OpenAISettings,
@@ -336,20 +528,35 @@ def _create_agent(
     top_p: float | None = None,
     seed: int | None = None,
 ) -> Agent[None, SeoBrief]:
-    """Instantiate the Pydantic AI agent for generating briefs."""
+    """Return the Pydantic AI agent for generating briefs, reusing one per configuration."""
+    key: _AgentKey = (model_name, settings.base_url, settings.api_key, temperature, top_p, seed)
+    cached = _agent_cache.get(key)
+    if cached is not None:
+        return cached
+
+    from pydantic_ai import Agent, NativeOutput
+    from pydantic_ai.settings import ModelSettings
+
     model_settings = ModelSettings(temperature=temperature)
     apply_optional_settings(model_settings, top_p=top_p, seed=seed)
     model = make_model(model_name, model_settings=model_settings, settings=settings)
-    return Agent[None, SeoBrief](
+    agent = Agent[None, SeoBrief](
         model=model,
         output_type=NativeOutput(SeoBrief, name="SEO Brief", strict=True),
         instructions=SYSTEM_PROMPT,
         output_retries=LLM_OUTPUT_RETRIES,
     )
+    _agent_cache[key] = agent
+    return agent
 
 
 def _invoke_agent(agent: Agent[None, SeoBrief], prompt: str, *, timeout_seconds: float) -> SeoBrief:
-    """Run the agent with a timeout using asyncio."""
+    """Run the agent with a timeout on the shared event loop."""
+    return run_sync(_run_agent(agent, prompt, timeout_seconds=timeout_seconds))
+
+
+async def _run_agent(agent: Agent[None, SeoBrief], prompt: str, *, timeout_seconds: float) -> SeoBrief:
+    """Await a single agent run with a timeout inside the caller's event loop."""
 
     async def _call() -> SeoBrief:
         run = await agent.run(prompt)
@@ -357,12 +564,33 @@ def _invoke_agent(agent: Agent[None, SeoBrief], prompt: str, *, timeout_seconds:
         if isinstance(output, SeoBrief):
             return output
         if isinstance(output, BaseModel):
-            return SeoBrief.model_validate(output.model_dump())
+            return SeoBrief.model_validate(output, from_attributes=True)
         if isinstance(output, dict):
             return SeoBrief.model_validate(output)
         raise TypeError("LLM output is not a SeoBrief instance")
 
-    return asyncio.run(asyncio.wait_for(_call(), timeout_seconds))
+    return await with_timeout(_call(), timeout_seconds)
+
+
+def _as_briefing_error(exc: Exception, *, timeout_seconds: float) -> BriefingError:
+    """Map a failure raised while generating a brief to the matching BriefingError."""
+    from pydantic_ai import UnexpectedModelBehavior
+
+    if isinstance(exc, BriefingError):
+        return exc
+    if isinstance(exc, UnexpectedModelBehavior):
+        return BriefValidationError(
+            "LLM response never satisfied the SeoBrief schema, giving up after repeated retries."
+        )
+    if isinstance(exc, (LanguageMismatchError, LanguageResolutionError)):
+        return BriefValidationError(str(exc))
+    if isinstance(exc, TimeoutError):
+        return BriefLLMError(f"LLM request timed out after {int(timeout_seconds)} seconds.")
+    return BriefLLMError(f"LLM request failed: {exc}")
+
+
+def _context_label(context: BriefingContext) -> str:
+    return context.idea.title if context.idea is not None else context.note.title
 
 
 def _brief_language_text(brief: SeoBrief) -> str:
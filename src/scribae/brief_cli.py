@@ -1,16 +1,49 @@
 from __future__ import annotations
 
+import os
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 
 from . import brief
-from .brief import BriefingError
+from .batch import (
+    BATCH_INPUT_NAME,
+    BatchEntry,
+    BatchError,
+    BatchManifest,
+    BatchRequest,
+    build_batch_lines,
+    collect_batch,
+    read_manifest,
+    submit_batch,
+    write_batch_input,
+    write_manifest,
+)
+from .brief import DEFAULT_BATCH_CONCURRENCY, BriefFileError, BriefingError
 from .cli_output import echo_info, is_quiet, secho_info
+from .common import Reporter, expand_markdown_paths, slugify
+from .io_utils import NoteDetails
 from .llm import DEFAULT_MODEL_NAME
 from .logging_config import setup_logging
-from .project import load_default_project, load_project
+from .project import ProjectConfig, load_default_project, load_project
+
+
+def _checked_note_path(note: Path) -> Path:
+    """Check --note with one stat instead of Typer's separate exists/dir/readable probes."""
+    try:
+        mode = os.stat(note).st_mode
+    except FileNotFoundError as exc:
+        raise typer.BadParameter(f"File '{note}' does not exist.", param_hint="--note") from exc
+    except OSError as exc:
+        raise typer.BadParameter(f"File '{note}' cannot be accessed: {exc.strerror}.", param_hint="--note") from exc
+    if not stat.S_ISREG(mode):
+        raise typer.BadParameter(f"File '{note}' is not a regular file.", param_hint="--note")
+    if not os.access(note, os.R_OK):
+        raise typer.BadParameter(f"File '{note}' is not readable.", param_hint="--note")
+    return note.resolve()
 
 
 def _validate_output_options(
@@ -19,19 +52,21 @@ def _validate_output_options(
     *,
     dry_run: bool,
     idea_all: bool,
+    batch: bool,
     out_dir: Path | None,
 ) -> None:
     """Ensure mutually exclusive/required output arguments."""
-    if idea_all:
+    if idea_all or batch:
+        flag = "--idea-all" if idea_all else "--batch"
         if dry_run:
-            raise typer.BadParameter("--dry-run cannot be combined with --idea-all.", param_hint="--dry-run")
+            raise typer.BadParameter(f"--dry-run cannot be combined with {flag}.", param_hint="--dry-run")
         if out or json_output:
             raise typer.BadParameter(
-                "--idea-all requires --out-dir and cannot be combined with --out/--json.",
-                param_hint="--idea-all",
+                f"{flag} requires --out-dir and cannot be combined with --out/--json.",
+                param_hint=flag,
             )
         if out_dir is None:
-            raise typer.BadParameter("--idea-all requires --out-dir.", param_hint="--out-dir")
+            raise typer.BadParameter(f"{flag} requires --out-dir.", param_hint="--out-dir")
         return
 
     if dry_run:
@@ -43,7 +78,7 @@ def _validate_output_options(
         return
 
     if out_dir is not None:
-        raise typer.BadParameter("--out-dir can only be used with --idea-all.", param_hint="--out-dir")
+        raise typer.BadParameter("--out-dir can only be used with --idea-all or --batch.", param_hint="--out-dir")
     if out is None and not json_output:
         raise typer.BadParameter(
             "Choose an output destination: use --out FILE or --json.",
@@ -56,23 +91,178 @@ def _validate_output_options(
         )
 
 
+_UNSAFE_SLUG_CHARS = re.compile(r"[^a-z0-9-]+")
+
+
 def _safe_slug(value: str) -> str:
-    sanitized = re.sub(r"[^a-z0-9-]+", "-", value.lower()).strip("-")
+    sanitized = _UNSAFE_SLUG_CHARS.sub("-", value.lower()).strip("-")
     return sanitized or "idea"
 
 
+def _write_batch_briefs(
+    contexts: list[brief.BriefingContext],
+    output_paths: list[Path],
+    *,
+    model: str,
+    temperature: float,
+    top_p: float | None,
+    seed: int | None,
+    concurrency: int,
+    reporter: Reporter,
+) -> None:
+    """Generate all briefs in one concurrent run, writing each to its output path as soon as it is ready."""
+
+    def _write(index: int, result: brief.SeoBrief) -> None:
+        output_path = output_paths[index]
+        try:
+            output_path.write_bytes(brief.render_json_bytes(result) + b"\n")
+        except OSError as exc:
+            raise BriefFileError(f"Unable to write brief to {output_path}: {exc}") from exc
+        echo_info(f"Wrote brief to {output_path}")
+
+    try:
+        brief.generate_briefs_batch(
+            contexts,
+            model_name=model,
+            temperature=temperature,
+            top_p=top_p,
+            seed=seed,
+            concurrency=concurrency,
+            reporter=reporter,
+            on_result=_write,
+        )
+    except KeyboardInterrupt:
+        typer.secho("Cancelled by user.", err=True, fg=typer.colors.YELLOW)
+        raise typer.Exit(130) from None
+    except BriefingError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(exc.exit_code) from exc
+
+
+def _submit_batch_briefs(
+    contexts: list[brief.BriefingContext],
+    output_paths: list[Path],
+    *,
+    out_dir: Path,
+    model: str,
+    temperature: float,
+    top_p: float | None,
+    seed: int | None,
+) -> None:
+    """Write every brief request to a Batch API input file, submit it, and record where results go."""
+    requests = [
+        BatchRequest(
+            custom_id=output_path.stem,
+            system_prompt=context.prompts.system_prompt,
+            user_prompt=context.prompts.user_prompt,
+        )
+        for context, output_path in zip(contexts, output_paths, strict=True)
+    ]
+    lines = build_batch_lines(
+        requests,
+        model_name=model,
+        temperature=temperature,
+        top_p=top_p,
+        seed=seed,
+        output_type=brief.SeoBrief,
+        schema_name="SeoBrief",
+    )
+    entries = [BatchEntry(custom_id=output_path.stem, outputs=[str(output_path)]) for output_path in output_paths]
+    input_path = out_dir / BATCH_INPUT_NAME
+    try:
+        write_batch_input(input_path, lines)
+        batch_id = submit_batch(input_path, description="scribae brief")
+        write_manifest(out_dir, BatchManifest(batch_id=batch_id, command="brief", entries=entries))
+    except OSError as exc:
+        typer.secho(f"Unable to write batch files: {exc}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(3) from exc
+    except BatchError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(exc.exit_code) from exc
+
+    echo_info(f"Submitted {len(requests)} brief requests as batch {batch_id}.", err=True)
+    typer.echo(batch_id)
+
+
+def _collect_batch_briefs(batch_id: str, *, out_dir: Path) -> None:
+    """Write the briefs of a finished batch to the paths recorded at submission time."""
+    try:
+        manifest = read_manifest(out_dir, batch_id=batch_id, command="brief")
+        outcomes = collect_batch(batch_id)
+    except BatchError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(exc.exit_code) from exc
+
+    failures = 0
+    for entry in manifest.entries:
+        outcome = outcomes.get(entry.custom_id)
+        if outcome is None or outcome.content is None:
+            reason = outcome.error if outcome is not None else "no result returned"
+            typer.secho(f"{entry.custom_id}: {reason}", err=True, fg=typer.colors.RED)
+            failures += 1
+            continue
+        try:
+            result = brief.parse_brief_json(outcome.content)
+        except BriefingError as exc:
+            typer.secho(f"{entry.custom_id}: {exc}", err=True, fg=typer.colors.RED)
+            failures += 1
+            continue
+        for output in entry.outputs:
+            output_path = Path(output)
+            try:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_bytes(brief.render_json_bytes(result) + b"\n")
+            except OSError as exc:
+                typer.secho(
+                    f"{entry.custom_id}: Unable to write brief to {output_path}: {exc}", err=True, fg=typer.colors.RED
+                )
+                failures += 1
+                continue
+            echo_info(f"Wrote brief to {output_path}")
+
+    if failures:
+        raise typer.Exit(brief.BriefValidationError.exit_code)
+
+
+def _load_project_config(project: str | None) -> tuple[ProjectConfig, str]:
+    """Load the selected (or default) project and return it with a label for prompt artifacts."""
+    if project:
+        try:
+            project_config = load_project(project)
+            project_label = project
+        except (FileNotFoundError, ValueError, OSError) as exc:
+            typer.secho(str(exc), err=True, fg=typer.colors.RED)
+            raise typer.Exit(5) from exc
+    else:
+        try:
+            project_config, project_source = load_default_project()
+        except (FileNotFoundError, ValueError, OSError) as exc:
+            typer.secho(str(exc), err=True, fg=typer.colors.RED)
+            raise typer.Exit(5) from exc
+        if project_source:
+            project_label = project_source
+        else:
+            project_label = "default"
+            secho_info(
+                "No project provided; using default context (language=en, tone=neutral).",
+                err=True,
+                fg=typer.colors.YELLOW,
+            )
+    return project_config, project_label
+
+
 def brief_command(
-    note: Path = typer.Option(  # noqa: B008
-        ...,
+    note: Path | None = typer.Option(  # noqa: B008
+        None,
         "--note",
         "-n",
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
-        readable=True,
-        resolve_path=True,
         help="Path to the Markdown note.",
     ),
+    batch: str | None = typer.Option(  # noqa: B008
+        None,
+        "--batch",
+        help="Glob pattern (or directory) of Markdown notes to brief in one run; requires --out-dir.",
+    ),
     project: str | None = typer.Option(  # noqa: B008
         None,
         "--project",
@@ -124,6 +314,23 @@ def brief_command(
         "--json",
         help="Print JSON to stdout (no file output).",
     ),
+    concurrency: int = typer.Option(  # noqa: B008
+        DEFAULT_BATCH_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        help="Maximum number of concurrent LLM requests when using --idea-all or --batch.",
+    ),
+    batch_submit: bool = typer.Option(  # noqa: B008
+        False,
+        "--batch-submit",
+        help="With --idea-all or --batch, submit all briefs as one OpenAI Batch API job instead of calling the model.",
+    ),
+    batch_collect: str | None = typer.Option(  # noqa: B008
+        None,
+        "--batch-collect",
+        metavar="BATCH_ID",
+        help="Download a finished --batch-submit job and write its briefs into --out-dir.",
+    ),
     max_chars: int = typer.Option(  # noqa: B008
         6000,
         "--max-chars",
@@ -172,90 +379,132 @@ def brief_command(
 ) -> None:
     """CLI handler for `scribae brief`."""
     setup_logging(verbose=verbose and not is_quiet())
-    _validate_output_options(out, json_output, dry_run=dry_run, idea_all=idea_all, out_dir=out_dir)
+    if batch_collect is not None:
+        if note is not None or batch is not None or batch_submit or dry_run or out is not None or json_output:
+            raise typer.BadParameter(
+                "--batch-collect only takes --out-dir; inputs come from the submitted batch.",
+                param_hint="--batch-collect",
+            )
+        if out_dir is None:
+            raise typer.BadParameter("--batch-collect requires --out-dir.", param_hint="--out-dir")
+        _collect_batch_briefs(batch_collect, out_dir=out_dir.expanduser())
+        return
+
+    if (note is None) == (batch is None):
+        raise typer.BadParameter("Provide exactly one of --note or --batch.", param_hint="--note/--batch")
+    if note is not None:
+        note = _checked_note_path(note)
+    if batch is not None and idea_all:
+        raise typer.BadParameter("--batch cannot be combined with --idea-all.", param_hint="--batch")
+    _validate_output_options(
+        out,
+        json_output,
+        dry_run=dry_run,
+        idea_all=idea_all,
+        batch=batch is not None,
+        out_dir=out_dir,
+    )
+    if batch_submit and not (idea_all or batch is not None):
+        raise typer.BadParameter("--batch-submit requires --idea-all or --batch.", param_hint="--batch-submit")
     if (idea or idea_all) and ideas is None:
         raise typer.BadParameter("--ideas is required when selecting ideas.", param_hint="--ideas")
     if idea_all and idea:
         raise typer.BadParameter("--idea-all cannot be combined with --idea.", param_hint="--idea-all")
 
-    if idea_all and save_prompt is not None:
-        raise typer.BadParameter("--idea-all cannot be combined with --save-prompt.", param_hint="--idea-all")
+    if (idea_all or batch is not None) and save_prompt is not None:
+        flag = "--idea-all" if idea_all else "--batch"
+        raise typer.BadParameter(f"{flag} cannot be combined with --save-prompt.", param_hint=flag)
 
     reporter = (lambda msg: typer.secho(msg, err=True)) if verbose and not is_quiet() else None
 
-    if project:
-        try:
-            project_config = load_project(project)
-            project_label = project
-        except (FileNotFoundError, ValueError, OSError) as exc:
-            typer.secho(str(exc), err=True, fg=typer.colors.RED)
-            raise typer.Exit(5) from exc
-    else:
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # The note and the project file are independent, so read the note while the project loads.
+        pending_note = pool.submit(brief.load_briefing_note, note, max_chars=max_chars) if note is not None else None
+        project_config, project_label = _load_project_config(project)
+
+    note_details: NoteDetails | None = None
+    if pending_note is not None:
         try:
-            project_config, project_source = load_default_project()
-        except (FileNotFoundError, ValueError, OSError) as exc:
+            note_details = pending_note.result()
+        except BriefingError as exc:
             typer.secho(str(exc), err=True, fg=typer.colors.RED)
-            raise typer.Exit(5) from exc
-        if project_source:
-            project_label = project_source
-        else:
-            project_label = "default"
-            secho_info(
-                "No project provided; using default context (language=en, tone=neutral).",
-                err=True,
-                fg=typer.colors.YELLOW,
-            )
+            raise typer.Exit(exc.exit_code) from exc
 
     ideas_path = ideas.expanduser() if ideas else None
     out_dir_path = out_dir.expanduser() if out_dir else None
 
-    if idea_all:
-        assert ideas_path is not None
+    if idea_all or batch is not None:
         assert out_dir_path is not None
+        contexts: list[brief.BriefingContext] = []
+        output_paths: list[Path] = []
         try:
-            idea_list = brief.load_ideas(ideas_path)
-        except BriefingError as exc:
-            typer.secho(str(exc), err=True, fg=typer.colors.RED)
-            raise typer.Exit(exc.exit_code) from exc
-
-        out_dir_path.mkdir(parents=True, exist_ok=True)
-        for idx, idea_item in enumerate(idea_list.ideas, start=1):
-            try:
-                context = brief.prepare_context(
-                    note_path=note,
+            if idea_all:
+                assert note is not None
+                assert ideas_path is not None
+                idea_list = brief.load_ideas(ideas_path)
+                for idx, idea_item in enumerate(idea_list.ideas, start=1):
+                    contexts.append(
+                        brief.prepare_context(
+                            note_path=note,
+                            project=project_config,
+                            max_chars=max_chars,
+                            language=language,
+                            idea=idea_item,
+                            reporter=reporter,
+                            note=note_details,
+                        )
+                    )
+                    output_paths.append(out_dir_path / f"{idx:02d}-{_safe_slug(idea_item.id)}.json")
+            else:
+                assert batch is not None
+                note_paths = expand_markdown_paths(batch)
+                if not note_paths:
+                    typer.secho(f"No notes matched --batch {batch}.", err=True, fg=typer.colors.RED)
+                    raise typer.Exit(3)
+                contexts = brief.prepare_contexts(
+                    note_paths,
                     project=project_config,
                     max_chars=max_chars,
                     language=language,
-                    idea=idea_item,
+                    ideas_path=ideas_path,
+                    idea_selector=idea,
                     reporter=reporter,
                 )
-            except BriefingError as exc:
-                typer.secho(str(exc), err=True, fg=typer.colors.RED)
-                raise typer.Exit(exc.exit_code) from exc
+                output_paths = [
+                    out_dir_path / f"{idx:02d}-{slugify(note_path.stem) or 'note'}.json"
+                    for idx, note_path in enumerate(note_paths, start=1)
+                ]
+        except BriefingError as exc:
+            typer.secho(str(exc), err=True, fg=typer.colors.RED)
+            raise typer.Exit(exc.exit_code) from exc
 
-            try:
-                result = brief.generate_brief(
-                    context,
-                    model_name=model,
-                    temperature=temperature,
-                    top_p=top_p,
-                    seed=seed,
-                    reporter=reporter,
-                )
-            except KeyboardInterrupt:
-                typer.secho("Cancelled by user.", err=True, fg=typer.colors.YELLOW)
-                raise typer.Exit(130) from None
-            except BriefingError as exc:
-                typer.secho(str(exc), err=True, fg=typer.colors.RED)
-                raise typer.Exit(exc.exit_code) from exc
-
-            json_payload = brief.render_json(result)
-            slug = _safe_slug(idea_item.id)
-            output_path = out_dir_path / f"{idx:02d}-{slug}.json"
-            output_path.write_text(json_payload + "\n", encoding="utf-8")
-            echo_info(f"Wrote brief to {output_path}")
+        out_dir_path.mkdir(parents=True, exist_ok=True)
+        if batch_submit:
+            _submit_batch_briefs(
+                contexts,
+                output_paths,
+                out_dir=out_dir_path,
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                seed=seed,
+            )
+            return
+
+        _write_batch_briefs(
+            contexts,
+            output_paths,
+            model=model,
+            temperature=temperature,
+            top_p=top_p,
+            seed=seed,
+            concurrency=concurrency,
+            reporter=reporter,
+        )
         return
 
+    assert note is not None
+
     try:
         context = brief.prepare_context(
             note_path=note,
@@ -265,6 +514,7 @@ def brief_command(
             ideas_path=ideas_path,
             idea_selector=idea,
             reporter=reporter,
+            note=note_details,
         )
     except BriefingError as exc:
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
@@ -301,15 +551,13 @@ def brief_command(
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
         raise typer.Exit(exc.exit_code) from exc
 
-    json_payload = brief.render_json(result)
-
     if out is not None:
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(json_payload + "\n", encoding="utf-8")
+        out.write_bytes(brief.render_json_bytes(result) + b"\n")
         echo_info(f"Wrote brief to {out}")
         return
 
-    typer.echo(json_payload)
+    typer.echo(brief.render_json(result))
 
 
 __all__ = ["brief_command"]
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import glob
+import os
 import re
 from collections.abc import Callable
 from datetime import datetime
+from pathlib import Path
 
 Reporter = Callable[[str], None] | None
 
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
 
 def slugify(value: str) -> str:
-    lowered = value.lower()
-    return re.sub(r"[^a-z0-9]+", "-", lowered).strip("-")
+    return _SLUG_SEPARATORS.sub("-", value.lower()).strip("-")
 
 
 def report(reporter: Reporter, message: str) -> None:
@@ -21,4 +25,13 @@ def current_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d-%H%M%S")
 
 
-__all__ = ["Reporter", "current_timestamp", "report", "slugify"]
+def expand_markdown_paths(pattern: str) -> list[Path]:
+    """Resolve a glob pattern or directory to a sorted list of Markdown files."""
+    expanded = os.path.expanduser(pattern)
+    if os.path.isdir(expanded):
+        expanded = os.path.join(expanded, "*.md")
+    paths = sorted(Path(match).resolve() for match in glob.glob(expanded, recursive=True))
+    return [path for path in paths if path.is_file()]
+
+
+__all__ = ["Reporter", "current_timestamp", "expand_markdown_paths", "report", "slugify"]
@@ -1,37 +1,109 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import io
 import logging
 import re
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, TextIO, cast
 
-import emoji
-import frontmatter
 import yaml
 from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
-from pydantic_ai import Agent, NativeOutput, UnexpectedModelBehavior
-from pydantic_ai.settings import ModelSettings
+from pydantic_core import to_json
 
-from .brief import SeoBrief
+from .brief import DEFAULT_BATCH_CONCURRENCY, SeoBrief
 from .common import report
 from .io_utils import NoteDetails, Reporter, load_note, truncate
-from .language import LanguageMismatchError, LanguageResolutionError, ensure_language_output, resolve_output_language
-from .llm import LLM_OUTPUT_RETRIES, LLM_TIMEOUT_SECONDS, OpenAISettings, apply_optional_settings, make_model
+from .language import (
+    LanguageMismatchError,
+    LanguageResolutionError,
+    ensure_language_output,
+    ensure_language_output_async,
+    resolve_output_language,
+)
+from .llm import (
+    LLM_OUTPUT_RETRIES,
+    LLM_TIMEOUT_SECONDS,
+    OpenAISettings,
+    RateLimiter,
+    apply_optional_settings,
+    close_http_client,
+    make_model,
+    register_client_cache,
+    run_sync,
+    with_timeout,
+)
 from .project import ProjectConfig
 from .prompts.feedback import FEEDBACK_SYSTEM_PROMPT, FeedbackPromptBundle, build_feedback_prompt_bundle
 from .prompts.feedback_categories import CATEGORY_DEFINITIONS
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
+_AgentKey = tuple[str, str, str, float, float | None, int | None]
+_agent_cache: dict[_AgentKey, Agent[None, FeedbackReport]] = register_client_cache({})
+
+_HEADING_RE = re.compile(r"^(#{1,3})\s+(.*)$")
+_SECTION_RANGE_RE = re.compile(r"(\d+)\.\.(\d+)")
+
+_NONE_NOTED_ITEM = "- None noted.\n"
+
+# Characters whose meaning depends on their neighbours: joiners and variation selectors (ZWJ also shapes
+# Indic scripts), the keycap (its base is an ASCII digit, '#' or '*'), tag characters and regional
+# indicators (only a pair is a flag). Strings containing any of them go through the emoji tokenizer.
+_EMOJI_CONTEXT_CHARS = (
+    frozenset("\u200d\ufe0e\ufe0f\u20e3")
+    | frozenset(map(chr, range(0xE0020, 0xE0080)))
+    | frozenset(map(chr, range(0x1F1E6, 0x1F200)))
+)
+
 
 def strip_emojis(value: str) -> str:
     """Remove emoji characters from a string and clean up extra whitespace."""
-    result = emoji.replace_emoji(value, replace=" ")
-    return " ".join(result.split())
+    if value.isascii():
+        return " ".join(value.split())
+    if not _EMOJI_CONTEXT_CHARS.isdisjoint(value):
+        import emoji
+
+        return " ".join(emoji.replace_emoji(value, replace=" ").split())
+    return " ".join(value.translate(_emoji_translation()).split())
+
+
+@lru_cache(maxsize=1)
+def _emoji_translation() -> dict[int, str]:
+    """Build the `str.translate` table once, on the first string that needs it.
+
+    Every remaining emoji code point becomes a space. Walking ``emoji.EMOJI_DATA`` takes a few
+    milliseconds, which CLI commands that never strip emojis should not pay at import time.
+    """
+    import emoji
+
+    return {
+        ord(char): " "
+        for key in emoji.EMOJI_DATA
+        for char in key
+        if not char.isascii() and char not in _EMOJI_CONTEXT_CHARS
+    }
+
+
+def _clean_str_list(value: Any, *, strip_emoji: bool) -> list[str]:
+    """Coerce a model list field to stripped, non-empty strings (optionally emoji-free)."""
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, list):
+        raise TypeError("value must be a list")
+    # Model output is almost always a list of strings already; only coerce when it is not.
+    if not all(type(item) is str for item in value):
+        value = [str(item) for item in value]
+    if strip_emoji:
+        return [cleaned for cleaned in map(strip_emojis, value) if cleaned]
+    return [stripped for stripped in (item.strip() for item in value) if stripped]
 
 
 class FeedbackError(Exception):
@@ -109,11 +181,7 @@ class FeedbackSummary(BaseModel):
     @field_validator("issues", "strengths", mode="before")
     @classmethod
     def _normalize_list(cls, value: Any) -> list[str]:
-        if isinstance(value, str):
-            value = [value]
-        if not isinstance(value, list):
-            raise TypeError("value must be a list")
-        return [stripped for item in value if (stripped := strip_emojis(str(item)))]
+        return _clean_str_list(value, strip_emoji=True)
 
 
 class BriefAlignment(BaseModel):
@@ -146,11 +214,7 @@ class BriefAlignment(BaseModel):
     )
     @classmethod
     def _normalize_list(cls, value: Any) -> list[str]:
-        if isinstance(value, str):
-            value = [value]
-        if not isinstance(value, list):
-            raise TypeError("value must be a list")
-        return [str(item).strip() for item in value if str(item).strip()]
+        return _clean_str_list(value, strip_emoji=False)
 
 
 class SectionNote(BaseModel):
@@ -167,11 +231,7 @@ class SectionNote(BaseModel):
     @field_validator("notes", mode="before")
     @classmethod
     def _normalize_list(cls, value: Any) -> list[str]:
-        if isinstance(value, str):
-            value = [value]
-        if not isinstance(value, list):
-            raise TypeError("value must be a list")
-        return [str(item).strip() for item in value if str(item).strip()]
+        return _clean_str_list(value, strip_emoji=False)
 
 
 class FeedbackReport(BaseModel):
@@ -189,11 +249,7 @@ class FeedbackReport(BaseModel):
     @field_validator("evidence_gaps", "checklist", mode="before")
     @classmethod
     def _normalize_list(cls, value: Any) -> list[str]:
-        if isinstance(value, str):
-            value = [value]
-        if not isinstance(value, list):
-            raise TypeError("value must be a list")
-        return [stripped for item in value if (stripped := strip_emojis(str(item)))]
+        return _clean_str_list(value, strip_emoji=True)
 
 
 class FeedbackFormat(str):
@@ -201,10 +257,12 @@ class FeedbackFormat(str):
     JSON = "json"
     BOTH = "both"
 
+    ALLOWED: frozenset[str] = frozenset({MARKDOWN, JSON, BOTH})
+
     @classmethod
     def from_raw(cls, value: str) -> FeedbackFormat:
         lowered = value.lower().strip()
-        if lowered not in {cls.MARKDOWN, cls.JSON, cls.BOTH}:
+        if lowered not in cls.ALLOWED:
             raise FeedbackValidationError("--format must be md, json, or both.")
         return cls(lowered)
 
@@ -223,15 +281,14 @@ class FeedbackFocus(str):
         parts = [item.strip() for item in value.split(",") if item.strip()]
         if not parts:
             raise FeedbackValidationError("--focus must include at least one category.")
-        normalized: list[str] = []
+        normalized: dict[str, None] = {}
         for part in parts:
             lowered = part.lower()
             if lowered not in cls.ALLOWED:
                 allowed_list = ", ".join(sorted(cls.ALLOWED))
                 raise FeedbackValidationError(f"--focus must be one of: {allowed_list}.")
-            if lowered not in normalized:
-                normalized.append(lowered)
-        return normalized
+            normalized[lowered] = None
+        return list(normalized)
 
 
 @dataclass(frozen=True)
@@ -244,8 +301,7 @@ class BodySection:
 @dataclass(frozen=True)
 class BodyDocument:
     path: Path
-    content: str
-    excerpt: str
+    text: str
     frontmatter: dict[str, Any]
     truncated: bool
 
@@ -261,6 +317,7 @@ class FeedbackContext:
     selected_outline: list[str]
     selected_sections: list[BodySection]
     section_range: tuple[int, int] | None
+    compact_schema: bool = False
 
 
 PromptBundle = FeedbackPromptBundle
@@ -280,14 +337,22 @@ def prepare_context(
     max_note_chars: int = 6000,
     language_detector: Callable[[str], str] | None = None,
     reporter: Reporter = None,
+    brief: SeoBrief | None = None,
+    note: NoteDetails | None = None,
+    compact_schema: bool = False,
 ) -> FeedbackContext:
-    """Load inputs and prepare the feedback context."""
+    """Load inputs and prepare the feedback context.
+
+    Pass an already loaded `brief`/`note` to skip re-reading files shared by several drafts.
+    """
     if max_body_chars <= 0 or max_note_chars <= 0:
         raise FeedbackValidationError("Max chars must be greater than zero.")
 
     body = _load_body(body_path, max_chars=max_body_chars)
-    brief = _load_brief(brief_path)
-    note = _load_note(note_path, max_chars=max_note_chars) if note_path else None
+    if brief is None:
+        brief = _load_brief(brief_path)
+    if note is None and note_path:
+        note = _load_note(note_path, max_chars=max_note_chars)
 
     report(reporter, f"Loaded draft '{body.path.name}' and brief '{brief.title}'.")
     if note is not None:
@@ -298,7 +363,7 @@ def prepare_context(
             flag_language=language,
             project_language=project.get("language"),
             metadata=body.frontmatter,
-            text=body.content,
+            text=body.text,
             language_detector=language_detector,
         )
     except LanguageResolutionError as exc:
@@ -310,7 +375,7 @@ def prepare_context(
     )
 
     selected_outline = _select_outline(brief, section_range=section_range)
-    sections = _split_body_sections(body.content)
+    sections = _split_body_sections(body.text)
     selected_sections = _select_body_sections(sections, section_range=section_range)
 
     return FeedbackContext(
@@ -323,13 +388,65 @@ def prepare_context(
         selected_outline=selected_outline,
         selected_sections=selected_sections,
         section_range=section_range,
+        compact_schema=compact_schema,
     )
 
 
+def prepare_contexts(
+    body_paths: Sequence[Path],
+    *,
+    brief_path: Path,
+    project: ProjectConfig,
+    note_path: Path | None = None,
+    language: str | None = None,
+    focus: list[str] | None = None,
+    section_range: tuple[int, int] | None = None,
+    max_body_chars: int = 12000,
+    max_note_chars: int = 6000,
+    language_detector: Callable[[str], str] | None = None,
+    reporter: Reporter = None,
+    compact_schema: bool = False,
+) -> list[FeedbackContext]:
+    """Build feedback contexts for several drafts, parsing the shared brief and note only once."""
+    if max_body_chars <= 0 or max_note_chars <= 0:
+        raise FeedbackValidationError("Max chars must be greater than zero.")
+
+    brief = _load_brief(brief_path)
+    note = _load_note(note_path, max_chars=max_note_chars) if note_path else None
+    return [
+        prepare_context(
+            body_path=body_path,
+            brief_path=brief_path,
+            project=project,
+            note_path=note_path,
+            language=language,
+            focus=focus,
+            section_range=section_range,
+            max_body_chars=max_body_chars,
+            max_note_chars=max_note_chars,
+            language_detector=language_detector,
+            reporter=reporter,
+            brief=brief,
+            note=note,
+            compact_schema=compact_schema,
+        )
+        for body_path in body_paths
+    ]
+
+
 def build_prompt_bundle(context: FeedbackContext) -> FeedbackPromptBundle:
     return build_feedback_prompt_bundle(_prompt_context(context))
 
 
+def parse_report_json(content: str | bytes, focus: list[str] | None = None) -> FeedbackReport:
+    """Validate model output produced outside the agent (e.g. by a Batch API job)."""
+    try:
+        report = FeedbackReport.model_validate_json(content)
+    except ValidationError as exc:
+        raise FeedbackValidationError(f"Model output failed validation: {exc}") from exc
+    return _normalize_finding_categories(report, focus)
+
+
 def render_dry_run_prompt(context: FeedbackContext) -> str:
     prompts = build_prompt_bundle(context)
     return prompts.user_prompt
@@ -351,13 +468,7 @@ def generate_feedback_report(
     """Generate the structured feedback report via the LLM."""
     logger.debug("Generating feedback report with model '%s'", model_name)
     prompts = prompts or build_prompt_bundle(context)
-
-    resolved_settings = OpenAISettings.from_env()
-    llm_agent: Agent[None, FeedbackReport] = (
-        agent if agent is not None else _create_agent(model_name, temperature=temperature, top_p=top_p, seed=seed)
-    )
-
-    report(reporter, f"Calling model '{model_name}' via {resolved_settings.base_url}")
+    llm_agent = _resolve_agent(agent, model_name, temperature=temperature, top_p=top_p, seed=seed, reporter=reporter)
 
     try:
         result = cast(
@@ -371,18 +482,10 @@ def generate_feedback_report(
                 language_detector=language_detector,
             ),
         )
-    except UnexpectedModelBehavior as exc:
-        raise FeedbackValidationError(f"Model returned unexpected output: {exc}") from exc
-    except LanguageMismatchError as exc:
-        raise FeedbackValidationError(str(exc)) from exc
-    except LanguageResolutionError as exc:
-        raise FeedbackValidationError(str(exc)) from exc
-    except TimeoutError as exc:
-        raise FeedbackLLMError(f"LLM request timed out after {int(timeout_seconds)} seconds.") from exc
-    except FeedbackError:
+    except KeyboardInterrupt:
         raise
-    except Exception as exc:  # pragma: no cover - surfaced to CLI
-        raise FeedbackLLMError(f"LLM request failed: {exc}") from exc
+    except Exception as exc:
+        raise _as_feedback_error(exc, timeout_seconds=timeout_seconds) from exc
 
     # Remap any out-of-scope categories to "other"
     result = _normalize_finding_categories(result, context.focus)
@@ -390,62 +493,249 @@ def generate_feedback_report(
     return result
 
 
+async def generate_feedback_report_async(
+    context: FeedbackContext,
+    *,
+    model_name: str,
+    temperature: float,
+    top_p: float | None = None,
+    seed: int | None = None,
+    reporter: Reporter = None,
+    agent: Agent[None, FeedbackReport] | None = None,
+    prompts: PromptBundle | None = None,
+    timeout_seconds: float = LLM_TIMEOUT_SECONDS,
+    language_detector: Callable[[str], str] | None = None,
+) -> FeedbackReport:
+    """Async variant of `generate_feedback_report` for callers already running an event loop."""
+    logger.debug("Generating feedback report with model '%s'", model_name)
+    prompts = prompts or build_prompt_bundle(context)
+    llm_agent = _resolve_agent(agent, model_name, temperature=temperature, top_p=top_p, seed=seed, reporter=reporter)
+
+    try:
+        result = cast(
+            FeedbackReport,
+            await ensure_language_output_async(
+                prompt=prompts.user_prompt,
+                expected_language=context.language,
+                invoke=lambda prompt: _run_agent(llm_agent, prompt, timeout_seconds=timeout_seconds),
+                extract_text=_feedback_language_text,
+                reporter=reporter,
+                language_detector=language_detector,
+            ),
+        )
+    except Exception as exc:
+        raise _as_feedback_error(exc, timeout_seconds=timeout_seconds) from exc
+
+    result = _normalize_finding_categories(result, context.focus)
+    logger.debug("Feedback report generation completed successfully")
+    return result
+
+
+def generate_feedback_reports_batch(
+    contexts: Sequence[FeedbackContext],
+    *,
+    model_name: str,
+    temperature: float,
+    top_p: float | None = None,
+    seed: int | None = None,
+    reporter: Reporter = None,
+    agent: Agent[None, FeedbackReport] | None = None,
+    timeout_seconds: float = LLM_TIMEOUT_SECONDS,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    requests_per_minute: int | None = None,
+    language_detector: Callable[[str], str] | None = None,
+    on_result: Callable[[int, FeedbackReport], None] | None = None,
+) -> list[FeedbackReport]:
+    """Generate feedback reports for several drafts concurrently and return them in input order.
+
+    See `generate_feedback_reports_async` for how `on_result` and failed requests are handled.
+    """
+    if concurrency <= 0:
+        raise FeedbackValidationError("--concurrency must be greater than zero.")
+    if requests_per_minute is not None and requests_per_minute <= 0:
+        raise FeedbackValidationError("--rpm must be greater than zero.")
+    if not contexts:
+        return []
+
+    try:
+        reports = run_sync(
+            generate_feedback_reports_async(
+                contexts,
+                model_name=model_name,
+                temperature=temperature,
+                top_p=top_p,
+                seed=seed,
+                reporter=reporter,
+                agent=agent,
+                timeout_seconds=timeout_seconds,
+                concurrency=concurrency,
+                requests_per_minute=requests_per_minute,
+                language_detector=language_detector,
+                on_result=on_result,
+            )
+        )
+    except KeyboardInterrupt:
+        raise
+    except Exception as exc:
+        raise _as_feedback_error(exc, timeout_seconds=timeout_seconds) from exc
+
+    report(reporter, f"LLM calls complete, {len(reports)} feedback reports validated.")
+    return reports
+
+
+async def generate_feedback_reports_async(
+    contexts: Sequence[FeedbackContext],
+    *,
+    model_name: str,
+    temperature: float,
+    top_p: float | None = None,
+    seed: int | None = None,
+    reporter: Reporter = None,
+    agent: Agent[None, FeedbackReport] | None = None,
+    timeout_seconds: float = LLM_TIMEOUT_SECONDS,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    requests_per_minute: int | None = None,
+    language_detector: Callable[[str], str] | None = None,
+    on_result: Callable[[int, FeedbackReport], None] | None = None,
+) -> list[FeedbackReport]:
+    """Async batch variant: all drafts share one agent, with at most `concurrency` requests in flight.
+
+    When `requests_per_minute` is set, request starts (language retries included) are also spaced
+    to stay under the endpoint's rate limit. `on_result(index, report)` is called as soon as each
+    report validates. A failed request does not stop the others: once every request has settled,
+    the failures are raised together as one FeedbackError.
+    """
+    if concurrency <= 0:
+        raise FeedbackValidationError("--concurrency must be greater than zero.")
+    if requests_per_minute is not None and requests_per_minute <= 0:
+        raise FeedbackValidationError("--rpm must be greater than zero.")
+    if not contexts:
+        return []
+
+    logger.debug("Generating %d feedback reports with model '%s'", len(contexts), model_name)
+    resolved_settings = OpenAISettings.from_env()
+    llm_agent = (
+        agent
+        if agent is not None
+        else _create_agent(model_name, resolved_settings, temperature=temperature, top_p=top_p, seed=seed)
+    )
+    report(
+        reporter,
+        f"Calling model '{model_name}' via {resolved_settings.base_url} "
+        f"for {len(contexts)} drafts (concurrency={concurrency})",
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(requests_per_minute) if requests_per_minute is not None else None
+
+    async def _invoke(prompt: str) -> FeedbackReport:
+        if limiter is not None:
+            await limiter.acquire()
+        return await _run_agent(llm_agent, prompt, timeout_seconds=timeout_seconds)
+
+    async def _generate_one(index: int, context: FeedbackContext) -> FeedbackReport:
+        async with semaphore:
+            result = await ensure_language_output_async(
+                prompt=build_prompt_bundle(context).user_prompt,
+                expected_language=context.language,
+                invoke=_invoke,
+                extract_text=_feedback_language_text,
+                reporter=reporter,
+                language_detector=language_detector,
+            )
+        report(reporter, f"Feedback ready for '{context.body.path.name}'.")
+        result = _normalize_finding_categories(cast(FeedbackReport, result), context.focus)
+        if on_result is not None:
+            on_result(index, result)
+        return result
+
+    # Settle every request before reporting failures, so one error neither discards finished reports
+    # nor leaves sibling requests running on the caller's loop.
+    outcomes = await asyncio.gather(
+        *(_generate_one(index, context) for index, context in enumerate(contexts)), return_exceptions=True
+    )
+    reports: list[FeedbackReport] = []
+    failures: list[tuple[str, FeedbackError]] = []
+    for context, outcome in zip(contexts, outcomes, strict=True):
+        if isinstance(outcome, FeedbackReport):
+            reports.append(outcome)
+        elif isinstance(outcome, Exception):
+            error = _as_feedback_error(outcome, timeout_seconds=timeout_seconds)
+            failures.append((context.body.path.name, error))
+        else:
+            raise outcome
+    if failures:
+        first = failures[0][1]
+        details = "\n".join(f"- {label}: {error}" for label, error in failures)
+        raise type(first)(f"{len(failures)} of {len(contexts)} drafts failed:\n{details}", exit_code=first.exit_code)
+
+    logger.debug("Batch feedback generation completed successfully")
+    return reports
+
+
 def render_json(report: FeedbackReport) -> str:
-    return json.dumps(report.model_dump(), indent=2, ensure_ascii=False)
+    return report.model_dump_json(indent=2)
+
+
+def render_json_bytes(report: FeedbackReport) -> bytes:
+    """Return the report as UTF-8 encoded JSON, ready to be written to disk."""
+    return to_json(report, indent=2)
 
 
 def render_markdown(report: FeedbackReport) -> str:
-    sections: list[str] = ["# Feedback Report", "", "## Summary", "", "### Top issues"]
-    sections.extend(_render_list(report.summary.issues))
-    sections.append("")
-    sections.append("### Strengths")
-    sections.extend(_render_list(report.summary.strengths))
-    sections.append("")
-    sections.append("## Brief alignment")
-    sections.append("")
-    sections.append(f"- Intent: {report.brief_alignment.intent}")
-    sections.append(f"- Outline covered: {', '.join(report.brief_alignment.outline_covered) or 'None noted'}")
-    sections.append(f"- Outline missing: {', '.join(report.brief_alignment.outline_missing) or 'None noted'}")
-    sections.append(f"- Keywords covered: {', '.join(report.brief_alignment.keywords_covered) or 'None noted'}")
-    sections.append(f"- Keywords missing: {', '.join(report.brief_alignment.keywords_missing) or 'None noted'}")
-    sections.append(f"- FAQ covered: {', '.join(report.brief_alignment.faq_covered) or 'None noted'}")
-    sections.append(f"- FAQ missing: {', '.join(report.brief_alignment.faq_missing) or 'None noted'}")
-    sections.append("")
-    sections.append("## Section notes")
-    sections.append("")
+    buffer = io.StringIO()
+    write_markdown(report, buffer)
+    return buffer.getvalue()
+
+
+def write_markdown(report: FeedbackReport, stream: TextIO) -> None:
+    """Write the Markdown report section by section to a text stream (e.g. the output file).
+
+    List fields are stripped by validation, so the last line already ends in exactly one newline.
+    """
+    write = stream.write
+    alignment = report.brief_alignment
+
+    write("# Feedback Report\n\n## Summary\n\n### Top issues\n")
+    _write_list(write, report.summary.issues)
+    write("\n### Strengths\n")
+    _write_list(write, report.summary.strengths)
+
+    write("\n## Brief alignment\n\n")
+    write(f"- Intent: {alignment.intent}\n")
+    write(f"- Outline covered: {_join_or_none(alignment.outline_covered)}\n")
+    write(f"- Outline missing: {_join_or_none(alignment.outline_missing)}\n")
+    write(f"- Keywords covered: {_join_or_none(alignment.keywords_covered)}\n")
+    write(f"- Keywords missing: {_join_or_none(alignment.keywords_missing)}\n")
+    write(f"- FAQ covered: {_join_or_none(alignment.faq_covered)}\n")
+    write(f"- FAQ missing: {_join_or_none(alignment.faq_missing)}\n")
+
+    write("\n## Section notes\n\n")
     if report.section_notes:
         for item in report.section_notes:
-            sections.append(f"### {item.heading}")
-            sections.extend(_render_list(item.notes))
-            sections.append("")
+            write(f"### {item.heading}\n")
+            _write_list(write, item.notes)
+            write("\n")
     else:
-        sections.extend(_render_list([]))
-        sections.append("")
+        write(_NONE_NOTED_ITEM)
+        write("\n")
 
-    sections.append("## Evidence gaps")
-    sections.append("")
-    sections.extend(_render_list(report.evidence_gaps))
-    sections.append("")
+    write("## Evidence gaps\n\n")
+    _write_list(write, report.evidence_gaps)
 
-    sections.append("## Findings")
-    sections.append("")
+    write("\n## Findings\n\n")
     if report.findings:
         for finding in report.findings:
             location = _format_location(finding.location)
-            sections.append(f"- **{finding.severity.upper()}** [{finding.category}] {finding.message}{location}")
+            write(f"- **{finding.severity.upper()}** [{finding.category}] {finding.message}{location}\n")
     else:
-        sections.extend(_render_list([]))
-    sections.append("")
+        write(_NONE_NOTED_ITEM)
 
-    sections.append("## Checklist")
-    sections.append("")
+    write("\n## Checklist\n\n")
     if report.checklist:
-        sections.extend([f"- [ ] {item}" for item in report.checklist])
+        for check in report.checklist:
+            write(f"- [ ] {check}\n")
     else:
-        sections.extend(_render_list([]))
-    sections.append("")
-
-    return "\n".join(sections).rstrip() + "\n"
+        write(_NONE_NOTED_ITEM)
 
 
 def save_prompt_artifacts(
@@ -462,13 +752,19 @@ def save_prompt_artifacts(
     prompt_path.write_text(prompt_payload, encoding="utf-8")
 
     if response is not None and response_path is not None:
-        response_path.write_text(render_json(response) + "\n", encoding="utf-8")
+        response_path.write_bytes(render_json_bytes(response) + b"\n")
 
     return prompt_path, response_path
 
 
+def close_agents() -> None:
+    """Drop cached agents and close the HTTP connections they share."""
+    _agent_cache.clear()
+    close_http_client()
+
+
 def parse_section_range(value: str) -> tuple[int, int]:
-    match = re.fullmatch(r"(\d+)\.\.(\d+)", value.strip())
+    match = _SECTION_RANGE_RE.fullmatch(value.strip())
     if not match:
         raise FeedbackValidationError("--section must use the format N..M (e.g., 2..4).")
     start, end = int(match.group(1)), int(match.group(2))
@@ -492,6 +788,7 @@ def _prompt_context(context: FeedbackContext) -> _FeedbackPromptContext:
         focus=context.focus,
         selected_outline=context.selected_outline,
         selected_sections=selected_sections,
+        compact_schema=context.compact_schema,
     )
 
 
@@ -505,48 +802,105 @@ class _FeedbackPromptContext:
     focus: list[str] | None
     selected_outline: list[str]
     selected_sections: list[dict[str, str]]
+    compact_schema: bool
 
 
 def _create_agent(
     model_name: str,
+    settings: OpenAISettings,
     *,
     temperature: float,
     top_p: float | None = None,
     seed: int | None = None,
 ) -> Agent[None, FeedbackReport]:
+    """Return the Pydantic AI agent for feedback reports, reusing one per configuration."""
+    key: _AgentKey = (model_name, settings.base_url, settings.api_key, temperature, top_p, seed)
+    cached = _agent_cache.get(key)
+    if cached is not None:
+        return cached
+
+    from pydantic_ai import Agent, NativeOutput
+    from pydantic_ai.settings import ModelSettings
+
     model_settings = ModelSettings(temperature=temperature)
     apply_optional_settings(model_settings, top_p=top_p, seed=seed)
-    model = make_model(model_name, model_settings=model_settings)
-    return Agent[None, FeedbackReport](
+    model = make_model(model_name, model_settings=model_settings, settings=settings)
+    agent = Agent[None, FeedbackReport](
         model=model,
         output_type=NativeOutput(FeedbackReport, name="FeedbackReport", strict=True),
         instructions=SYSTEM_PROMPT,
         output_retries=LLM_OUTPUT_RETRIES,
     )
+    _agent_cache[key] = agent
+    return agent
+
+
+def _resolve_agent(
+    agent: Agent[None, FeedbackReport] | None,
+    model_name: str,
+    *,
+    temperature: float,
+    top_p: float | None,
+    seed: int | None,
+    reporter: Reporter,
+) -> Agent[None, FeedbackReport]:
+    resolved_settings = OpenAISettings.from_env()
+    llm_agent = (
+        agent
+        if agent is not None
+        else _create_agent(model_name, resolved_settings, temperature=temperature, top_p=top_p, seed=seed)
+    )
+    report(reporter, f"Calling model '{model_name}' via {resolved_settings.base_url}")
+    return llm_agent
 
 
 def _invoke_agent(agent: Agent[None, FeedbackReport], prompt: str, *, timeout_seconds: float) -> FeedbackReport:
+    """Run the agent with a timeout on the shared event loop."""
+    return run_sync(_run_agent(agent, prompt, timeout_seconds=timeout_seconds))
+
+
+async def _run_agent(agent: Agent[None, FeedbackReport], prompt: str, *, timeout_seconds: float) -> FeedbackReport:
+    """Await a single agent run with a timeout inside the caller's event loop."""
+
     async def _call() -> FeedbackReport:
         run = await agent.run(prompt)
         output = getattr(run, "output", None)
         if isinstance(output, FeedbackReport):
             return output
         if isinstance(output, BaseModel):
-            return FeedbackReport.model_validate(output.model_dump())
+            return FeedbackReport.model_validate(output, from_attributes=True)
         if isinstance(output, dict):
             return FeedbackReport.model_validate(output)
         raise TypeError("LLM output is not a FeedbackReport instance")
 
-    return asyncio.run(asyncio.wait_for(_call(), timeout_seconds))
+    return await with_timeout(_call(), timeout_seconds)
+
+
+def _as_feedback_error(exc: Exception, *, timeout_seconds: float) -> FeedbackError:
+    """Map a failure raised while generating feedback to the matching FeedbackError."""
+    from pydantic_ai import UnexpectedModelBehavior
+
+    if isinstance(exc, FeedbackError):
+        return exc
+    if isinstance(exc, UnexpectedModelBehavior):
+        return FeedbackValidationError(f"Model returned unexpected output: {exc}")
+    if isinstance(exc, (LanguageMismatchError, LanguageResolutionError)):
+        return FeedbackValidationError(str(exc))
+    if isinstance(exc, TimeoutError):
+        return FeedbackLLMError(f"LLM request timed out after {int(timeout_seconds)} seconds.")
+    return FeedbackLLMError(f"LLM request failed: {exc}")
 
 
 def _feedback_language_text(report: FeedbackReport) -> str:
-    issue_text = " ".join(report.summary.issues)
-    strength_text = " ".join(report.summary.strengths)
-    findings = " ".join([finding.message for finding in report.findings])
-    checklist = " ".join(report.checklist)
-    section_notes = " ".join([" ".join(item.notes) for item in report.section_notes])
-    return "\n".join([issue_text, strength_text, findings, checklist, section_notes]).strip()
+    return " ".join(
+        chain(
+            report.summary.issues,
+            report.summary.strengths,
+            (finding.message for finding in report.findings),
+            report.checklist,
+            (note for item in report.section_notes for note in item.notes),
+        )
+    ).strip()
 
 
 def _normalize_finding_categories(report: FeedbackReport, focus: list[str] | None) -> FeedbackReport:
@@ -582,6 +936,8 @@ def _normalize_finding_categories(report: FeedbackReport, focus: list[str] | Non
 
 
 def _load_body(body_path: Path, *, max_chars: int) -> BodyDocument:
+    import frontmatter
+
     try:
         post = frontmatter.load(body_path)
     except FileNotFoundError as exc:
@@ -592,12 +948,10 @@ def _load_body(body_path: Path, *, max_chars: int) -> BodyDocument:
         raise FeedbackFileError(f"Unable to parse draft {body_path}: {exc}") from exc
 
     metadata = dict(post.metadata or {})
-    content = post.content.strip()
-    excerpt, truncated = truncate(content, max_chars)
+    text, truncated = truncate(post.content.strip(), max_chars)
     return BodyDocument(
         path=body_path,
-        content=excerpt,
-        excerpt=excerpt,
+        text=text,
         frontmatter=metadata,
         truncated=truncated,
     )
@@ -605,20 +959,19 @@ def _load_body(body_path: Path, *, max_chars: int) -> BodyDocument:
 
 def _load_brief(path: Path) -> SeoBrief:
     try:
-        text = path.read_text(encoding="utf-8")
+        payload = path.read_bytes()
     except FileNotFoundError as exc:
         raise FeedbackBriefError(f"Brief JSON not found: {path}") from exc
     except OSError as exc:  # pragma: no cover - surfaced by CLI
         raise FeedbackBriefError(f"Unable to read brief: {exc}") from exc
 
+    # Parsing and validation both run in pydantic-core, without an intermediate Python dict.
     try:
-        payload = json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise FeedbackBriefError(f"Brief file is not valid JSON: {exc}") from exc
-
-    try:
-        return SeoBrief.model_validate(payload)
+        return SeoBrief.model_validate_json(payload)
     except ValidationError as exc:
+        json_errors = [error for error in exc.errors() if error["type"] == "json_invalid"]
+        if json_errors:
+            raise FeedbackBriefError(f"Brief file is not valid JSON: {json_errors[0]['msg']}") from exc
         raise FeedbackBriefError(f"Brief JSON failed validation: {exc}") from exc
 
 
@@ -644,14 +997,13 @@ def _select_outline(brief: SeoBrief, *, section_range: tuple[int, int] | None) -
         if not (1 <= start <= total and 1 <= end <= total and start <= end):
             raise FeedbackValidationError(f"Section range {start}..{end} is invalid for {total} outline items.")
 
-    selected = [brief.outline[idx - 1].strip() for idx in range(start, end + 1) if brief.outline[idx - 1].strip()]
+    selected = [stripped for item in brief.outline[start - 1 : end] if (stripped := item.strip())]
     if not selected:
         raise FeedbackValidationError("No outline sections selected.")
     return selected
 
 
 def _split_body_sections(body: str) -> list[BodySection]:
-    heading_pattern = re.compile(r"^(#{1,3})\s+(.*)$")
     sections: list[BodySection] = []
     current_heading: str | None = None
     current_lines: list[str] = []
@@ -664,8 +1016,9 @@ def _split_body_sections(body: str) -> list[BodySection]:
         sections.append(BodySection(heading=heading, content=content, index=len(sections) + 1))
 
     for line in body.splitlines():
-        match = heading_pattern.match(line.strip())
-        if match:
+        # Only lines starting with '#' can be headings; prose lines skip the regex entirely.
+        stripped = line.lstrip()
+        if stripped.startswith("#") and (match := _HEADING_RE.match(stripped.rstrip())):
             _flush()
             current_heading = match.group(2).strip() or "Untitled"
             current_lines = []
@@ -692,10 +1045,16 @@ def _select_body_sections(
     return selected or list(sections)
 
 
-def _render_list(items: Sequence[str]) -> list[str]:
+def _write_list(write: Callable[[str], object], items: Sequence[str]) -> None:
     if not items:
-        return ["- None noted."]
-    return [f"- {item}" for item in items]
+        write(_NONE_NOTED_ITEM)
+        return
+    for item in items:
+        write(f"- {item}\n")
+
+
+def _join_or_none(items: Sequence[str]) -> str:
+    return ", ".join(items) if items else "None noted"
 
 
 def _format_location(location: FeedbackLocation | None) -> str:
@@ -703,12 +1062,13 @@ def _format_location(location: FeedbackLocation | None) -> str:
         return ""
     heading = location.heading
     paragraph = location.paragraph_index
-    details: list[str] = []
+    if heading and paragraph is not None:
+        return f" (heading: {heading}; paragraph: {paragraph})"
     if heading:
-        details.append(f"heading: {heading}")
+        return f" (heading: {heading})"
     if paragraph is not None:
-        details.append(f"paragraph: {paragraph}")
-    return f" ({'; '.join(details)})" if details else ""
+        return f" (paragraph: {paragraph})"
+    return ""
 
 
 __all__ = [
@@ -727,12 +1087,20 @@ __all__ = [
     "FeedbackBriefError",
     "SectionNote",
     "build_prompt_bundle",
+    "close_agents",
     "generate_feedback_report",
+    "generate_feedback_report_async",
+    "generate_feedback_reports_async",
+    "generate_feedback_reports_batch",
+    "parse_report_json",
     "parse_section_range",
     "prepare_context",
+    "prepare_contexts",
     "render_dry_run_prompt",
     "render_json",
+    "render_json_bytes",
     "render_markdown",
     "save_prompt_artifacts",
     "strip_emojis",
+    "write_markdown",
 ]
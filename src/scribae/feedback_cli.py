@@ -2,11 +2,29 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import click
 import typer
+from click.core import ParameterSource
 
+from .batch import (
+    BATCH_INPUT_NAME,
+    BatchEntry,
+    BatchError,
+    BatchManifest,
+    BatchRequest,
+    build_batch_lines,
+    collect_batch,
+    read_manifest,
+    submit_batch,
+    write_batch_input,
+    write_manifest,
+)
+from .brief import DEFAULT_BATCH_CONCURRENCY
 from .cli_output import echo_info, is_quiet, secho_info
+from .common import Reporter, expand_markdown_paths, slugify
 from .feedback import (
     FeedbackBriefError,
+    FeedbackContext,
     FeedbackError,
     FeedbackFileError,
     FeedbackFocus,
@@ -15,12 +33,15 @@ from .feedback import (
     FeedbackValidationError,
     build_prompt_bundle,
     generate_feedback_report,
+    generate_feedback_reports_batch,
+    parse_report_json,
     parse_section_range,
     prepare_context,
-    render_dry_run_prompt,
-    render_json,
+    prepare_contexts,
+    render_json_bytes,
     render_markdown,
     save_prompt_artifacts,
+    write_markdown,
 )
 from .llm import DEFAULT_MODEL_NAME
 from .logging_config import setup_logging
@@ -28,23 +49,26 @@ from .project import load_default_project, load_project
 
 
 def feedback_command(
-    body: Path = typer.Option(  # noqa: B008
-        ...,
+    body: Path | None = typer.Option(  # noqa: B008
+        None,
         "--body",
         "-b",
-        resolve_path=True,
         help="Path to the Markdown draft to review.",
     ),
-    brief: Path = typer.Option(  # noqa: B008
-        ...,
+    batch: str | None = typer.Option(  # noqa: B008
+        None,
+        "--batch",
+        help="Glob pattern or directory of Markdown drafts to review in one run (requires --out-dir).",
+    ),
+    brief: Path | None = typer.Option(  # noqa: B008
+        None,
         "--brief",
-        help="Path to the SeoBrief JSON output from `scribae brief`.",
+        help="Path to the SeoBrief JSON output from `scribae brief` (required unless --batch-collect).",
     ),
     note: Path | None = typer.Option(  # noqa: B008
         None,
         "--note",
         "-n",
-        resolve_path=True,
         help="Optional source note for grounding and fact checks.",
     ),
     section: str | None = typer.Option(  # noqa: B008
@@ -55,7 +79,10 @@ def feedback_command(
     focus: str | None = typer.Option(  # noqa: B008
         None,
         "--focus",
-        help="Narrow the review scope (comma-separated): seo|structure|clarity|style|evidence.",
+        help=(
+            "Narrow the review scope (comma-separated): seo|structure|clarity|style|evidence. "
+            "Several focuses are reviewed together in one request, so prefer --focus seo,style over separate runs."
+        ),
     ),
     output_format: str = typer.Option(  # noqa: B008
         FeedbackFormat.MARKDOWN,
@@ -68,14 +95,35 @@ def feedback_command(
         None,
         "--out",
         "-o",
-        resolve_path=True,
         help="Write output to this file (stdout if omitted).",
     ),
     out_dir: Path | None = typer.Option(  # noqa: B008
         None,
         "--out-dir",
-        resolve_path=True,
-        help="Directory to write outputs when using --format both.",
+        help="Directory to write outputs when using --format both or --batch.",
+    ),
+    concurrency: int = typer.Option(  # noqa: B008
+        DEFAULT_BATCH_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        help="Maximum number of concurrent LLM requests when using --batch.",
+    ),
+    rpm: int | None = typer.Option(  # noqa: B008
+        None,
+        "--rpm",
+        min=1,
+        help="Maximum LLM requests started per minute when using --batch (default: unlimited).",
+    ),
+    batch_submit: bool = typer.Option(  # noqa: B008
+        False,
+        "--batch-submit",
+        help="With --batch, submit all reviews as one OpenAI Batch API job instead of calling the model directly.",
+    ),
+    batch_collect: str | None = typer.Option(  # noqa: B008
+        None,
+        "--batch-collect",
+        metavar="BATCH_ID",
+        help="Download a finished --batch-submit job and write its reports into --out-dir.",
     ),
     project: str | None = typer.Option(  # noqa: B008
         None,
@@ -114,6 +162,11 @@ def feedback_command(
         "--seed",
         help="Random seed for reproducible outputs. For full determinism, combine with --temperature 0.",
     ),
+    compact_schema: bool = typer.Option(  # noqa: B008
+        False,
+        "--compact-schema",
+        help="Replace the schema example in the prompt with a short summary (the model still gets the full schema).",
+    ),
     dry_run: bool = typer.Option(  # noqa: B008
         False,
         "--dry-run",
@@ -125,7 +178,6 @@ def feedback_command(
         file_okay=False,
         dir_okay=True,
         exists=False,
-        resolve_path=True,
         help="Directory for saving prompt/response artifacts.",
     ),
     verbose: bool = typer.Option(  # noqa: B008
@@ -141,6 +193,9 @@ def feedback_command(
       scribae feedback --body draft.md --brief brief.json
       scribae feedback --body draft.md --brief brief.json --format json --out feedback.json
       scribae feedback --body draft.md --brief brief.json --section 1..3 --focus seo
+      scribae feedback --batch "drafts/*.md" --brief brief.json --out-dir feedback/
+      scribae feedback --batch "drafts/*.md" --brief brief.json --out-dir feedback/ --batch-submit
+      scribae feedback --batch-collect batch_abc123 --out-dir feedback/
     """
     setup_logging(verbose=verbose and not is_quiet())
     reporter = (lambda msg: typer.secho(msg, err=True)) if verbose and not is_quiet() else None
@@ -151,10 +206,41 @@ def feedback_command(
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
         raise typer.Exit(exc.exit_code) from exc
 
+    if batch_collect is not None:
+        if body is not None or batch is not None or batch_submit or dry_run or out is not None:
+            raise typer.BadParameter(
+                "--batch-collect only takes --out-dir; inputs and output paths come from the submitted batch.",
+                param_hint="--batch-collect",
+            )
+        if _option_given("output_format"):
+            raise typer.BadParameter(
+                "--format cannot be combined with --batch-collect; reports use the format chosen at submission.",
+                param_hint="--format",
+            )
+        if out_dir is None:
+            raise typer.BadParameter("--batch-collect requires --out-dir.", param_hint="--out-dir")
+        _collect_batch_reports(batch_collect, out_dir=out_dir.expanduser())
+        return
+
+    if (body is None) == (batch is None):
+        raise typer.BadParameter("Provide exactly one of --body or --batch.", param_hint="--body/--batch")
+    if brief is None:
+        raise typer.BadParameter("Missing option '--brief'.", param_hint="--brief")
+    if batch_submit and batch is None:
+        raise typer.BadParameter("--batch-submit requires --batch.", param_hint="--batch-submit")
+
     if dry_run and (out is not None or out_dir is not None or save_prompt is not None):
         raise typer.BadParameter("--dry-run cannot be combined with output options.", param_hint="--dry-run")
 
-    if fmt == FeedbackFormat.BOTH:
+    if batch is not None:
+        if dry_run or save_prompt is not None:
+            flag = "--dry-run" if dry_run else "--save-prompt"
+            raise typer.BadParameter(f"{flag} cannot be combined with --batch.", param_hint=flag)
+        if out is not None or out_dir is None:
+            raise typer.BadParameter(
+                "--batch requires --out-dir and cannot be combined with --out.", param_hint="--batch"
+            )
+    elif fmt == FeedbackFormat.BOTH:
         if out is not None and out_dir is not None:
             raise typer.BadParameter("Use --out or --out-dir, not both, with --format both.")
         if out is None and out_dir is None:
@@ -195,16 +281,70 @@ def feedback_command(
             typer.secho(str(exc), err=True, fg=typer.colors.RED)
             raise typer.Exit(exc.exit_code) from exc
 
+    if batch is not None:
+        assert out_dir is not None
+        # Absolute, so manifest paths stay valid when --batch-collect runs from another directory.
+        out_dir = out_dir.expanduser().resolve()
+        body_paths = expand_markdown_paths(batch)
+        if not body_paths:
+            typer.secho(f"No drafts matched --batch {batch}.", err=True, fg=typer.colors.RED)
+            raise typer.Exit(3)
+        try:
+            contexts = prepare_contexts(
+                body_paths,
+                brief_path=brief.expanduser(),
+                note_path=_resolve(note),
+                project=project_config,
+                language=language,
+                focus=focus_value,
+                section_range=section_range,
+                reporter=reporter,
+                compact_schema=compact_schema,
+            )
+        except FeedbackError as exc:
+            typer.secho(str(exc), err=True, fg=typer.colors.RED)
+            raise typer.Exit(exc.exit_code) from exc
+
+        if batch_submit:
+            _submit_batch_reports(
+                contexts,
+                body_paths,
+                fmt=fmt,
+                out_dir=out_dir,
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                seed=seed,
+            )
+            return
+
+        _write_batch_reports(
+            contexts,
+            body_paths,
+            fmt=fmt,
+            out_dir=out_dir,
+            model=model,
+            temperature=temperature,
+            top_p=top_p,
+            seed=seed,
+            concurrency=concurrency,
+            requests_per_minute=rpm,
+            reporter=reporter,
+        )
+        return
+
+    assert body is not None
     try:
         context = prepare_context(
-            body_path=body.expanduser(),
+            body_path=body.expanduser().resolve(),
             brief_path=brief.expanduser(),
-            note_path=note.expanduser() if note else None,
+            note_path=_resolve(note),
             project=project_config,
             language=language,
             focus=focus_value,
             section_range=section_range,
             reporter=reporter,
+            compact_schema=compact_schema,
         )
     except (FeedbackBriefError, FeedbackFileError, FeedbackValidationError, FeedbackError) as exc:
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
@@ -213,7 +353,7 @@ def feedback_command(
     prompts = build_prompt_bundle(context)
 
     if dry_run:
-        typer.echo(render_dry_run_prompt(context))
+        typer.echo(prompts.user_prompt)
         return
 
     try:
@@ -235,12 +375,172 @@ def feedback_command(
 
     if save_prompt is not None:
         try:
-            save_prompt_artifacts(prompts, destination=save_prompt, response=report)
+            save_prompt_artifacts(prompts, destination=save_prompt.expanduser().resolve(), response=report)
         except OSError as exc:
             typer.secho(f"Unable to save prompt artifacts: {exc}", err=True, fg=typer.colors.RED)
             raise typer.Exit(3) from exc
 
-    _write_outputs(report, fmt=fmt, out=out, out_dir=out_dir)
+    _write_outputs(report, fmt=fmt, out=_resolve(out), out_dir=out_dir.expanduser() if out_dir else None)
+
+
+def _option_given(name: str) -> bool:
+    """Return whether an option was set explicitly rather than left at its default."""
+    context = click.get_current_context(silent=True)
+    if context is None:
+        return False
+    source = context.get_parameter_source(name)
+    return source is not None and source != ParameterSource.DEFAULT
+
+
+def _resolve(path: Path | None) -> Path | None:
+    """Resolve a path option once, and only when the command actually uses it."""
+    return path.expanduser().resolve() if path is not None else None
+
+
+def _write_batch_reports(
+    contexts: list[FeedbackContext],
+    body_paths: list[Path],
+    *,
+    fmt: FeedbackFormat,
+    out_dir: Path,
+    model: str,
+    temperature: float,
+    top_p: float | None,
+    seed: int | None,
+    concurrency: int,
+    requests_per_minute: int | None,
+    reporter: Reporter,
+) -> None:
+    """Review all drafts in one concurrent run, writing each report to out_dir as soon as it is ready."""
+    output_paths = _batch_output_paths(body_paths, fmt=fmt, out_dir=out_dir)
+
+    def _write(index: int, report: FeedbackReport) -> None:
+        try:
+            _write_report_files(report, output_paths[index])
+        except OSError as exc:
+            raise FeedbackFileError(f"Unable to write feedback for {body_paths[index].name}: {exc}") from exc
+
+    try:
+        generate_feedback_reports_batch(
+            contexts,
+            model_name=model,
+            temperature=temperature,
+            top_p=top_p,
+            seed=seed,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            reporter=reporter,
+            on_result=_write,
+        )
+    except KeyboardInterrupt:
+        typer.secho("Cancelled by user.", err=True, fg=typer.colors.YELLOW)
+        raise typer.Exit(130) from None
+    except FeedbackError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(exc.exit_code) from exc
+
+
+def _submit_batch_reports(
+    contexts: list[FeedbackContext],
+    body_paths: list[Path],
+    *,
+    fmt: FeedbackFormat,
+    out_dir: Path,
+    model: str,
+    temperature: float,
+    top_p: float | None,
+    seed: int | None,
+) -> None:
+    """Write every review request to a Batch API input file, submit it, and record where results go."""
+    output_paths = _batch_output_paths(body_paths, fmt=fmt, out_dir=out_dir)
+    requests: list[BatchRequest] = []
+    entries: list[BatchEntry] = []
+    for context, paths in zip(contexts, output_paths, strict=True):
+        prompts = build_prompt_bundle(context)
+        custom_id = paths[0].stem
+        requests.append(
+            BatchRequest(custom_id=custom_id, system_prompt=prompts.system_prompt, user_prompt=prompts.user_prompt)
+        )
+        entries.append(BatchEntry(custom_id=custom_id, outputs=[str(path) for path in paths], focus=context.focus))
+
+    lines = build_batch_lines(
+        requests,
+        model_name=model,
+        temperature=temperature,
+        top_p=top_p,
+        seed=seed,
+        output_type=FeedbackReport,
+        schema_name="FeedbackReport",
+    )
+    input_path = out_dir / BATCH_INPUT_NAME
+    try:
+        write_batch_input(input_path, lines)
+        batch_id = submit_batch(input_path, description="scribae feedback")
+        write_manifest(out_dir, BatchManifest(batch_id=batch_id, command="feedback", entries=entries))
+    except OSError as exc:
+        typer.secho(f"Unable to write batch files: {exc}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(3) from exc
+    except BatchError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(exc.exit_code) from exc
+
+    echo_info(f"Submitted {len(requests)} feedback requests as batch {batch_id}.", err=True)
+    typer.echo(batch_id)
+
+
+def _collect_batch_reports(batch_id: str, *, out_dir: Path) -> None:
+    """Write the reports of a finished batch to the paths recorded at submission time."""
+    try:
+        manifest = read_manifest(out_dir, batch_id=batch_id, command="feedback")
+        outcomes = collect_batch(batch_id)
+    except BatchError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(exc.exit_code) from exc
+
+    failures = 0
+    for entry in manifest.entries:
+        outcome = outcomes.get(entry.custom_id)
+        if outcome is None or outcome.content is None:
+            reason = outcome.error if outcome is not None else "no result returned"
+            typer.secho(f"{entry.custom_id}: {reason}", err=True, fg=typer.colors.RED)
+            failures += 1
+            continue
+        try:
+            report = parse_report_json(outcome.content, entry.focus)
+        except FeedbackValidationError as exc:
+            typer.secho(f"{entry.custom_id}: {exc}", err=True, fg=typer.colors.RED)
+            failures += 1
+            continue
+        try:
+            _write_report_files(report, [Path(output) for output in entry.outputs])
+        except OSError as exc:
+            typer.secho(f"{entry.custom_id}: Unable to write feedback report: {exc}", err=True, fg=typer.colors.RED)
+            failures += 1
+
+    if failures:
+        raise typer.Exit(FeedbackValidationError.exit_code)
+
+
+def _batch_output_paths(body_paths: list[Path], *, fmt: FeedbackFormat, out_dir: Path) -> list[list[Path]]:
+    suffixes = {FeedbackFormat.MARKDOWN: [".md"], FeedbackFormat.JSON: [".json"]}.get(fmt, [".md", ".json"])
+    return [
+        [out_dir / f"{idx:02d}-{slugify(body_path.stem) or 'draft'}{suffix}" for suffix in suffixes]
+        for idx, body_path in enumerate(body_paths, start=1)
+    ]
+
+
+def _write_report_files(report: FeedbackReport, paths: list[Path]) -> None:
+    """Write one report to its sibling output files with a single mkdir and status write."""
+    paths[0].parent.mkdir(parents=True, exist_ok=True)
+    written: list[str] = []
+    for path in paths:
+        if path.suffix == ".json":
+            _write_json_bytes(path, render_json_bytes(report))
+            written.append(f"Wrote feedback JSON to {path}")
+        else:
+            _write_markdown_file(path, report)
+            written.append(f"Wrote feedback Markdown to {path}")
+    echo_info("\n".join(written))
 
 
 def _write_outputs(
@@ -251,17 +551,25 @@ def _write_outputs(
     out_dir: Path | None,
 ) -> None:
     if fmt == FeedbackFormat.JSON:
-        payload = render_json(report)
-        _write_single_output(payload, out, label="feedback JSON")
+        if out is None:
+            # click writes bytes straight to the binary stdout buffer, skipping a str round trip.
+            typer.echo(render_json_bytes(report), nl=False)
+            return
+        out.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_bytes(out, render_json_bytes(report))
+        echo_info(f"Wrote feedback JSON to {out}")
         return
 
     if fmt == FeedbackFormat.MARKDOWN:
-        payload = render_markdown(report)
-        _write_single_output(payload, out, label="feedback Markdown")
+        if out is None:
+            typer.echo(render_markdown(report), nl=False)
+            return
+        out.parent.mkdir(parents=True, exist_ok=True)
+        _write_markdown_file(out, report)
+        echo_info(f"Wrote feedback Markdown to {out}")
         return
 
-    md_payload = render_markdown(report)
-    json_payload = render_json(report)
+    json_payload = render_json_bytes(report)
 
     if out_dir is not None:
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -277,19 +585,22 @@ def _write_outputs(
             json_path = out.with_suffix(out.suffix + ".json")
 
     md_path.parent.mkdir(parents=True, exist_ok=True)
-    md_path.write_text(md_payload, encoding="utf-8")
-    json_path.write_text(json_payload + "\n", encoding="utf-8")
-    echo_info(f"Wrote feedback Markdown to {md_path}")
-    echo_info(f"Wrote feedback JSON to {json_path}")
+    _write_markdown_file(md_path, report)
+    _write_json_bytes(json_path, json_payload)
+    echo_info(f"Wrote feedback Markdown to {md_path}\nWrote feedback JSON to {json_path}")
 
 
-def _write_single_output(payload: str, out: Path | None, *, label: str) -> None:
-    if out is None:
-        typer.echo(payload, nl=False)
-        return
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(payload + ("" if payload.endswith("\n") else "\n"), encoding="utf-8")
-    echo_info(f"Wrote {label} to {out}")
+def _write_markdown_file(path: Path, report: FeedbackReport) -> None:
+    """Render the Markdown report straight into the file rather than into an intermediate string."""
+    with path.open("w", encoding="utf-8") as handle:
+        write_markdown(report, handle)
+
+
+def _write_json_bytes(path: Path, payload: bytes) -> None:
+    """Write a JSON payload plus trailing newline without copying it to append the newline."""
+    with path.open("wb") as handle:
+        handle.write(payload)
+        handle.write(b"\n")
 
 
 __all__ = ["feedback_command"]
@@ -1,16 +1,12 @@
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from pydantic_ai import Agent, NativeOutput, UnexpectedModelBehavior
-from pydantic_ai.settings import ModelSettings
 
 from .common import current_timestamp, report, slugify
 from .io_utils import NoteDetails, Reporter, load_note
@@ -21,10 +17,15 @@ from .llm import (
     OpenAISettings,
     apply_optional_settings,
     make_model,
+    run_sync,
+    with_timeout,
 )
 from .project import ProjectConfig
 from .prompts.idea import IDEA_SYSTEM_PROMPT, IdeaPromptBundle, build_idea_prompt_bundle
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,6 +154,8 @@ def generate_ideas(
     language_detector: Callable[[str], str] | None = None,
 ) -> IdeaList:
     """Run the LLM call and return validated ideas."""
+    from pydantic_ai import UnexpectedModelBehavior
+
     logger.debug("Generating ideas with model '%s'", model_name)
 
     resolved_settings = settings or OpenAISettings.from_env()
@@ -199,7 +202,7 @@ def generate_ideas(
 def render_json(result: IdeaList) -> str:
     """Return the ideas as a JSON string."""
 
-    return json.dumps(result.model_dump(), indent=2, ensure_ascii=False)
+    return result.model_dump_json(indent=2)
 
 
 def save_prompt_artifacts(
@@ -234,6 +237,9 @@ def _create_agent(
     seed: int | None = None,
 ) -> Agent[None, IdeaList]:
     """Instantiate the Pydantic AI agent for generating ideas."""
+    from pydantic_ai import Agent, NativeOutput
+    from pydantic_ai.settings import ModelSettings
+
     model_settings = ModelSettings(temperature=temperature)
     apply_optional_settings(model_settings, top_p=top_p, seed=seed)
     model = make_model(model_name, model_settings=model_settings, settings=settings)
@@ -250,7 +256,7 @@ def _idea_language_text(ideas: IdeaList) -> str:
 
 
 def _invoke_agent(agent: Agent[None, IdeaList], prompt: str, *, timeout_seconds: float) -> IdeaList:
-    """Run the agent with a timeout using asyncio."""
+    """Run the agent with a timeout on the shared event loop."""
 
     async def _call() -> IdeaList:
         run = await agent.run(prompt)
@@ -265,7 +271,7 @@ def _invoke_agent(agent: Agent[None, IdeaList], prompt: str, *, timeout_seconds:
             return IdeaList.model_validate(output)
         raise TypeError("LLM output is not an IdeaList instance")
 
-    return asyncio.run(asyncio.wait_for(_call(), timeout_seconds))
+    return run_sync(with_timeout(_call(), timeout_seconds))
 
 
 __all__ = [
@@ -8,6 +8,11 @@ import yaml
 
 from .project import ProjectConfig, default_project
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+
 
 class InitError(Exception):
     """Raised when initialization cannot proceed."""
@@ -43,15 +48,15 @@ def _confirm_overwrite(path: Path, *, force: bool) -> None:
 
 
 def _prompt_text(label: str, description: str, example: str, *, default: str, show_default: bool = True) -> str:
-    typer.echo("")
-    typer.secho(label, fg=typer.colors.CYAN, bold=True)
-    typer.echo(description)
-    typer.secho(f"Example: {example}", fg=typer.colors.MAGENTA)
+    # One write per field; click still strips the styling when stdout is not a terminal.
+    heading = typer.style(label, fg=typer.colors.CYAN, bold=True)
+    hint = typer.style(f"Example: {example}", fg=typer.colors.MAGENTA)
+    typer.echo(f"\n{heading}\n{description}\n{hint}")
     return cast(str, typer.prompt("Value", default=default, show_default=show_default))
 
 
 def _split_list(value: str) -> list[str]:
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in map(str.strip, value.split(",")) if item]
 
 
 def _collect_project_config() -> ProjectConfig:
@@ -130,8 +135,8 @@ def _render_yaml(config: ProjectConfig) -> str:
     }
     if config["allowed_tags"] is not None:
         payload["allowed_tags"] = config["allowed_tags"]
-    rendered = yaml.safe_dump(payload, sort_keys=False, allow_unicode=True)
-    return cast(str, rendered).strip() + "\n"
+    rendered = yaml.dump(payload, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
+    return rendered.strip() + "\n"
 
 
 def init_command(
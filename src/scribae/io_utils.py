@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+import codecs
+import json
+import mmap
+import os
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import frontmatter
 import yaml
 
 from .common import Reporter
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-@dataclass(frozen=True)
+DEFAULT_READ_WORKERS = 16
+
+# Notes at least this large are memory-mapped so only the body prefix we keep is decoded.
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+
+_FRONTMATTER_BOUNDARY = re.compile(r"^-{3,}[ \t]*$", re.MULTILINE)
+_FRONTMATTER_BOUNDARY_BYTES = re.compile(rb"^-{3,}[ \t]*\r?$", re.MULTILINE)
+# JSON front matter opens with a line holding only "{" and closes at the next "{" or "}" line.
+_JSON_FRONTMATTER_BOUNDARY = re.compile(r"^(?:\{|\})$", re.MULTILINE)
+_JSON_FRONTMATTER_BOUNDARY_BYTES = re.compile(rb"^(?:\{|\})\r?$", re.MULTILINE)
+_LEADING_WHITESPACE_BYTES = re.compile(rb"\s*")
+
+
+@dataclass(frozen=True, slots=True)
 class NoteDetails:
     """Normalized representation of a Markdown note and its metadata."""
 
@@ -32,7 +56,7 @@ def load_note(note_path: Path, *, max_chars: int) -> NoteDetails:
         raise ValueError("--max-chars must be greater than zero.")
 
     try:
-        post = frontmatter.load(note_path)
+        metadata, truncated_body, truncated = _read_note(note_path, max_chars=max_chars)
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"Note file not found: {note_path}") from exc
     except OSError as exc:  # pragma: no cover - surfaced to CLI
@@ -40,13 +64,10 @@ def load_note(note_path: Path, *, max_chars: int) -> NoteDetails:
     except (yaml.YAMLError, TypeError, ValueError) as exc:  # pragma: no cover - parsing errors
         raise ValueError(f"Unable to parse note {note_path}: {exc}") from exc
 
-    metadata = dict(post.metadata or {})
-    body = post.content.strip()
-    truncated_body, truncated = truncate(body, max_chars)
-
-    note_title = (
+    # Normalized once here so prompt builders receive already trimmed text on every rebuild.
+    note_title = str(
         metadata.get("title") or metadata.get("name") or note_path.stem.replace("_", " ").replace("-", " ").title()
-    )
+    ).strip()
 
     return NoteDetails(
         path=note_path,
@@ -58,6 +79,97 @@ def load_note(note_path: Path, *, max_chars: int) -> NoteDetails:
     )
 
 
+def load_notes(
+    note_paths: Sequence[Path], *, max_chars: int, max_workers: int = DEFAULT_READ_WORKERS
+) -> list[NoteDetails]:
+    """Load several notes, overlapping their file reads on a thread pool.
+
+    Results keep the input order; the first failing note raises the same errors as `load_note`.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be greater than zero.")
+    if len(note_paths) <= 1:
+        return [load_note(path, max_chars=max_chars) for path in note_paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(note_paths))) as pool:
+        return list(pool.map(partial(load_note, max_chars=max_chars), note_paths))
+
+
+def _read_note(note_path: Path, *, max_chars: int) -> tuple[dict[str, Any], str, bool]:
+    """Return front matter, truncated body, and truncation flag for a note file."""
+    with note_path.open(encoding="utf-8") as handle:
+        if os.fstat(handle.fileno()).st_size < _MMAP_THRESHOLD_BYTES:
+            metadata, body = _split_frontmatter(handle.read())
+            truncated_body, truncated = truncate(body, max_chars)
+            return metadata, truncated_body, truncated
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            metadata, body_start = _split_frontmatter_mapped(mapped)
+            # UTF-8 needs at most 4 bytes per character, so this window holds more than max_chars characters
+            # unless the body is shorter; decoding stops at the last complete character in the window.
+            window = mapped[body_start : body_start + (max_chars + 1) * 4]
+            prefix = _normalize_newlines(codecs.getincrementaldecoder("utf-8")().decode(window, final=False)).strip()
+            if body_start + len(window) < len(mapped) and len(prefix) > max_chars:
+                return metadata, truncate(prefix, max_chars)[0], True
+            body = _normalize_newlines(mapped[body_start:].decode("utf-8")).strip()
+    truncated_body, truncated = truncate(body, max_chars)
+    return metadata, truncated_body, truncated
+
+
+def _normalize_newlines(text: str) -> str:
+    """Apply the universal-newline translation that text-mode reads do for the small-note path."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _split_frontmatter_mapped(mapped: mmap.mmap) -> tuple[dict[str, Any], int]:
+    """Byte-level `_split_frontmatter` for mapped files; returns metadata and the body offset."""
+    leading = _LEADING_WHITESPACE_BYTES.match(mapped)
+    start = leading.end() if leading else 0
+    boundary = _FRONTMATTER_BOUNDARY_BYTES
+    opening = boundary.match(mapped, start)
+    if opening is None:
+        boundary = _JSON_FRONTMATTER_BOUNDARY_BYTES
+        opening = boundary.match(mapped, start)
+    if opening is None:
+        return {}, start
+    closing = boundary.search(mapped, opening.end())
+    if closing is None:
+        return {}, start
+
+    raw = mapped[opening.end() : closing.start()].decode("utf-8")
+    metadata = _parse_frontmatter(raw, json_block=boundary is _JSON_FRONTMATTER_BOUNDARY_BYTES)
+    return metadata, closing.end()
+
+
+def _split_frontmatter(text: str) -> tuple[dict[str, Any], str]:
+    """Split a leading YAML (``---``) or JSON (``{`` ... ``}``) front matter block from the Markdown body.
+
+    Mirrors python-frontmatter without TOML: text without a complete block is returned as the body
+    and non-mapping front matter is ignored.
+    """
+    text = text.strip()
+    boundary = _FRONTMATTER_BOUNDARY
+    opening = boundary.match(text)
+    if opening is None:
+        boundary = _JSON_FRONTMATTER_BOUNDARY
+        opening = boundary.match(text)
+    if opening is None:
+        return {}, text
+    closing = boundary.search(text, opening.end())
+    if closing is None:
+        return {}, text
+
+    metadata = _parse_frontmatter(
+        text[opening.end() : closing.start()], json_block=boundary is _JSON_FRONTMATTER_BOUNDARY
+    )
+    return metadata, text[closing.end() :].strip()
+
+
+def _parse_frontmatter(raw: str, *, json_block: bool) -> dict[str, Any]:
+    """Load a front matter block; JSON blocks are re-wrapped in the braces their boundaries consumed."""
+    data = json.loads("{" + raw + "}") if json_block else yaml.load(raw, Loader=_SafeLoader)
+    return dict(data) if isinstance(data, dict) else {}
+
+
 def truncate(value: str, max_chars: int) -> tuple[str, bool]:
     """Return a truncated string and flag if truncation occurred.
 
@@ -74,4 +186,4 @@ def truncate(value: str, max_chars: int) -> tuple[str, bool]:
     return value[: max_chars - 1].rstrip() + " …", True
 
 
-__all__ = ["NoteDetails", "Reporter", "load_note", "truncate"]
+__all__ = ["DEFAULT_READ_WORKERS", "NoteDetails", "Reporter", "load_note", "load_notes", "truncate"]
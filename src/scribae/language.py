@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+import re
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from .common import report
 
+# lingua is as accurate on a kilobyte of prose as on five, and scoring cost grows with the sample.
+_DETECTION_SAMPLE_CHARS = 1_024
+# ASCII alone also fits Dutch, Indonesian, Swahili, ...; English prose virtually always has "the".
+_ENGLISH_MARKER_RE = re.compile(r"\bthe\b", re.IGNORECASE)
+
 
 class LanguageResolutionError(Exception):
     """Raised when the output language cannot be determined."""
@@ -106,6 +113,30 @@ def ensure_language_output(
     return second_result
 
 
+async def ensure_language_output_async(
+    *,
+    prompt: str,
+    expected_language: str,
+    invoke: Callable[[str], Awaitable[Any]],
+    extract_text: Callable[[Any], str],
+    reporter: Callable[[str], None] | None = None,
+    language_detector: Callable[[str], str] | None = None,
+) -> Any:
+    """Async variant of `ensure_language_output` for callers running inside an event loop."""
+
+    first_result = await invoke(prompt)
+    try:
+        _validate_language(extract_text(first_result), expected_language, language_detector=language_detector)
+        return first_result
+    except LanguageMismatchError as first_error:
+        report(reporter, str(first_error) + " Retrying with language correction.")
+
+    corrective_prompt = _append_language_correction(prompt, expected_language)
+    second_result = await invoke(corrective_prompt)
+    _validate_language(extract_text(second_result), expected_language, language_detector=language_detector)
+    return second_result
+
+
 def _append_language_correction(prompt: str, expected_language: str) -> str:
     correction = (
         f"\n\n[LANGUAGE CORRECTION]\nRegenerate the full response strictly in language code '{expected_language}'."
@@ -119,6 +150,8 @@ def _validate_language(
     *,
     language_detector: Callable[[str], str] | None = None,
 ) -> None:
+    if language_detector is None and _is_plain_english(text, expected_language):
+        return
     detected = _detect_language(text, language_detector)
     if detected is None:
         raise LanguageResolutionError("Unable to detect language from model output.")
@@ -126,18 +159,35 @@ def _validate_language(
         raise LanguageMismatchError(expected_language, detected)
 
 
+def _is_plain_english(text: str, expected_language: str) -> bool:
+    """Return True when English output is evident without running the detector."""
+    if normalize_language(expected_language) != "en":
+        return False
+    sample = text[:_DETECTION_SAMPLE_CHARS]
+    return sample.isascii() and _ENGLISH_MARKER_RE.search(sample) is not None
+
+
 def _detect_language(text: str, language_detector: Callable[[str], str] | None) -> str | None:
-    sample = text[:5_000]
-    detector = language_detector or _default_language_detector()
+    sample = text[:_DETECTION_SAMPLE_CHARS]
     try:
-        return normalize_language(detector(sample))
+        if language_detector is not None:
+            return normalize_language(language_detector(sample))
+        return _detect_with_default(_default_language_detector(), sample)
     except LanguageResolutionError:
         raise
     except (AttributeError, TypeError, ValueError, RuntimeError) as exc:
         raise LanguageResolutionError(f"Language detection failed: {exc}") from exc
 
 
+@lru_cache(maxsize=256)
+def _detect_with_default(detector: Callable[[str], str], sample: str) -> str:
+    """Memoize default-detector results, e.g. for `brief --idea-all` resolving one note once per idea."""
+    return normalize_language(detector(sample))
+
+
+@lru_cache(maxsize=1)
 def _default_language_detector() -> Callable[[str], str]:
+    """Build the lingua detector once per process; each build loads every language model it needs."""
     try:
         from lingua import LanguageDetectorBuilder
     except ImportError as exc:  # pragma: no cover - defensive fallback
@@ -182,6 +232,7 @@ __all__ = [
     "LanguageMismatchError",
     "detect_language",
     "ensure_language_output",
+    "ensure_language_output_async",
     "normalize_language",
     "resolve_output_language",
 ]
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import os
+import sys
+from collections.abc import Coroutine
+from contextlib import suppress
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openai import OpenAIProvider
-from pydantic_ai.settings import ModelSettings
+if TYPE_CHECKING:
+    import httpx
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+    from pydantic_ai.settings import ModelSettings
 
 DEFAULT_MODEL_NAME = "ministral-3:8b"
 DEFAULT_BASE_URL = "http://localhost:11434/v1"
 DEFAULT_API_KEY = "no-key"
 LLM_OUTPUT_RETRIES = 2
 LLM_TIMEOUT_SECONDS = 300.0
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
 
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+_event_loop: asyncio.AbstractEventLoop | None = None
+_http_client: httpx.AsyncClient | None = None
+_providers: dict[tuple[str, str], OpenAIProvider] = {}
+_models: dict[tuple[str, str, str, tuple[tuple[str, Any], ...]], OpenAIChatModel] = {}
+# Caches of objects built on the shared HTTP client; all of them are dropped together with the client.
+_client_caches: list[dict[Any, Any]] = [_providers, _models]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class OpenAISettings:
     """Resolved OpenAI-compatible endpoint configuration."""
 
@@ -32,10 +52,147 @@ class OpenAISettings:
 def make_model(
     model_name: str, *, model_settings: ModelSettings, settings: OpenAISettings | None = None
 ) -> OpenAIChatModel:
-    """Return an OpenAI-compatible model configured for local/remote endpoints."""
+    """Return an OpenAI-compatible model configured for local/remote endpoints.
+
+    Models are cached per model name, endpoint and settings, so commands that build a fresh agent
+    per call still share one model (and its provider's connection pool) within a process.
+    """
+    from pydantic_ai.models.openai import OpenAIChatModel
+
     resolved_settings = settings or OpenAISettings.from_env()
-    provider = OpenAIProvider(base_url=resolved_settings.base_url, api_key=resolved_settings.api_key)
-    return OpenAIChatModel(model_name, provider=provider, settings=model_settings)
+    provider = _provider_for(resolved_settings)
+    key = (model_name, resolved_settings.base_url, resolved_settings.api_key, tuple(sorted(model_settings.items())))
+    try:
+        model = _models.get(key)
+    except TypeError:  # unhashable setting values (e.g. extra_body) are not worth caching
+        return OpenAIChatModel(model_name, provider=provider, settings=model_settings)
+    if model is None:
+        model = OpenAIChatModel(model_name, provider=provider, settings=model_settings.copy())
+        _models[key] = model
+    return model
+
+
+def _provider_for(settings: OpenAISettings) -> OpenAIProvider:
+    """Return the provider for an endpoint, building its OpenAI client only once."""
+    from pydantic_ai.providers.openai import OpenAIProvider
+
+    http_client = shared_http_client()
+    key = (settings.base_url, settings.api_key)
+    provider = _providers.get(key)
+    if provider is None:
+        provider = OpenAIProvider(base_url=settings.base_url, api_key=settings.api_key, http_client=http_client)
+        _providers[key] = provider
+    return provider
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Return the HTTP client shared by all models, keeping connections warm between requests."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        from pydantic_ai.models import get_user_agent
+
+        _clear_client_caches()
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout=LLM_TIMEOUT_SECONDS, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            headers={"User-Agent": get_user_agent()},
+        )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections, if one was created."""
+    global _http_client
+    client, _http_client = _http_client, None
+    _clear_client_caches()
+    if client is None or client.is_closed:
+        return
+    run_sync(client.aclose())
+
+
+def register_client_cache(cache: dict[_K, _V]) -> dict[_K, _V]:
+    """Register a cache of objects bound to the shared HTTP client (e.g. agents) and return it.
+
+    Registered caches are cleared whenever the client is closed or replaced, so no cached object
+    outlives the connection pool it was built on.
+    """
+    _client_caches.append(cache)
+    return cache
+
+
+def _clear_client_caches() -> None:
+    for cache in _client_caches:
+        cache.clear()
+
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion on Scribae's persistent event loop.
+
+    Unlike `asyncio.run`, the loop survives between calls, so cached models keep their
+    HTTP connection pools alive instead of rebuilding them (and their TLS sessions) per request.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        atexit.register(_close_event_loop, _event_loop)
+    task = _event_loop.create_task(coro)
+    try:
+        return _event_loop.run_until_complete(task)
+    except BaseException:
+        if not task.done():
+            task.cancel()
+            with suppress(BaseException):
+                _event_loop.run_until_complete(task)
+        raise
+
+
+async def with_timeout(coro: Coroutine[Any, Any, _T], timeout_seconds: float) -> _T:
+    """Await a coroutine in the current task, raising the builtin TimeoutError past the deadline.
+
+    `asyncio.timeout` (Python 3.11+) cancels in place instead of wrapping the coroutine in a
+    separate task the way `asyncio.wait_for` does on older interpreters.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.timeout(timeout_seconds):
+            return await coro
+    try:  # pragma: no cover - Python 3.10 only
+        return await asyncio.wait_for(coro, timeout_seconds)
+    except asyncio.TimeoutError as exc:  # pragma: no cover - distinct from TimeoutError before 3.11
+        raise TimeoutError from exc
+
+
+class RateLimiter:
+    """Space request starts evenly so at most `per_minute` begin in any minute.
+
+    Callers await `acquire()` right before each request; it never holds a lock across the sleep,
+    so it composes with a semaphore that bounds how many requests are in flight.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        if per_minute <= 0:
+            raise ValueError("per_minute must be greater than zero.")
+        self._interval = 60.0 / per_minute
+        self._next_start: float | None = None
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        start = now if self._next_start is None else max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def _close_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    if loop.is_closed():
+        return
+    with suppress(RuntimeError):
+        close_http_client()
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
 
 
 def apply_optional_settings(
@@ -57,11 +214,19 @@ def apply_optional_settings(
 
 __all__ = [
     "OpenAISettings",
+    "RateLimiter",
     "DEFAULT_MODEL_NAME",
     "DEFAULT_BASE_URL",
     "DEFAULT_API_KEY",
     "LLM_OUTPUT_RETRIES",
     "LLM_TIMEOUT_SECONDS",
+    "HTTP_MAX_KEEPALIVE_CONNECTIONS",
+    "HTTP_KEEPALIVE_EXPIRY_SECONDS",
     "apply_optional_settings",
+    "close_http_client",
     "make_model",
+    "register_client_cache",
+    "run_sync",
+    "shared_http_client",
+    "with_timeout",
 ]
@@ -4,23 +4,40 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import Any
 
 _LOGGER_NAME = "scribae"
 
+# (verbose, log file, stderr stream) of the last configuration and the handlers it installed.
+_configured: tuple[tuple[bool, Path | None, Any], tuple[logging.Handler, ...]] | None = None
+
 
 def setup_logging(*, verbose: bool = False, log_file: Path | None = None) -> logging.Logger:
     """Configure Scribae logger handlers and level.
 
     Calling this function repeatedly is safe; existing handlers are replaced so
-    duplicate records are not emitted.
+    duplicate records are not emitted, and a call matching the current configuration
+    is a no-op. The log file is only opened once a record is written to it.
     """
+    global _configured
 
     logger = logging.getLogger(_LOGGER_NAME)
+    resolved_log_file = log_file
+    if resolved_log_file is None:
+        raw_log_file = os.environ.get("SCRIBAE_LOG_FILE")
+        if raw_log_file:
+            resolved_log_file = Path(raw_log_file).expanduser()
+
+    key = (verbose, resolved_log_file, sys.stderr)
+    if _configured is not None and _configured[0] == key and tuple(logger.handlers) == _configured[1]:
+        return logger
+
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
     logger.propagate = False
 
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
+        handler.close()
 
     formatter = logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
 
@@ -29,19 +46,14 @@ def setup_logging(*, verbose: bool = False, log_file: Path | None = None) -> log
     stream_handler.setLevel(logging.DEBUG if verbose else logging.WARNING)
     logger.addHandler(stream_handler)
 
-    resolved_log_file = log_file
-    if resolved_log_file is None:
-        raw_log_file = os.environ.get("SCRIBAE_LOG_FILE")
-        if raw_log_file:
-            resolved_log_file = Path(raw_log_file).expanduser()
-
     if resolved_log_file is not None:
         resolved_log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(resolved_log_file, encoding="utf-8")
+        file_handler = logging.FileHandler(resolved_log_file, encoding="utf-8", delay=True)
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
         logger.addHandler(file_handler)
 
+    _configured = (key, tuple(logger.handlers))
     return logger
 
 
@@ -1,22 +1,73 @@
 from __future__ import annotations
 
+import importlib
 import os
 
 import click
 import typer
+from typer.core import TyperGroup
 
-from .brief_cli import brief_command
-from .feedback_cli import feedback_command
-from .idea_cli import idea_command
-from .init_cli import init_command
 from .logging_config import setup_logging
-from .meta_cli import meta_command
-from .refine_cli import refine_command
-from .translate_cli import translate_command
-from .version_cli import version_command
-from .write_cli import write_command
+
+# name -> (module, command function, help). Modules are imported only when their command is resolved,
+# so e.g. `scribae version` does not load the brief/feedback/translate stacks.
+_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "idea": ("idea_cli", "idea_command", "Brainstorm article ideas from a note with project-aware guidance."),
+    "init": ("init_cli", "init_command", "Create a scribae.yaml config via a guided questionnaire."),
+    "brief": (
+        "brief_cli",
+        "brief_command",
+        "Generate a validated SEO brief (keywords, outline, FAQ, metadata) from a note.",
+    ),
+    "write": ("write_cli", "write_command", "Draft an article from a note + SeoBrief JSON."),
+    "feedback": (
+        "feedback_cli",
+        "feedback_command",
+        "Review a draft against a brief to surface improvements without rewriting.",
+    ),
+    "refine": ("refine_cli", "refine_command", "Refine a draft using a validated SEO brief."),
+    "meta": ("meta_cli", "meta_command", "Create publication metadata/frontmatter for a finished draft."),
+    "translate": (
+        "translate_cli",
+        "translate_command",
+        "Translate Markdown while preserving formatting (MT + post-edit).",
+    ),
+    "version": ("version_cli", "version_command", "Print the Scribae version."),
+}
+
+
+class _LazyCommandGroup(TyperGroup):
+    """Root command group that builds each subcommand from its module on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        loaded = super().list_commands(ctx)
+        return [*loaded, *(name for name in _COMMANDS if name not in loaded)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in _COMMANDS and cmd_name not in self.commands:
+            self.add_command(_load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        if args and args[0] not in self.commands and args[0] not in _COMMANDS:
+            # Unknown name: load everything so the "Did you mean ...?" suggestion sees every command.
+            for name in _COMMANDS:
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, args)
+
+
+def _load_command(name: str) -> click.Command:
+    module_name, attr, help_text = _COMMANDS[name]
+    module = importlib.import_module(f".{module_name}", __package__)
+    command_app = typer.Typer(add_completion=False)
+    command_app.command(name, help=help_text)(getattr(module, attr))
+    return typer.main.get_command(command_app)
+
 
 app = typer.Typer(
+    cls=_LazyCommandGroup,
     help=(
         "Scribae — turn local Markdown notes into ideas, SEO briefs, drafts, metadata, and translations "
         "using LLMs via OpenAI-compatible APIs while keeping the human in the loop."
@@ -51,23 +102,6 @@ def app_callback(
             context.color = False
 
 
-app.command("idea", help="Brainstorm article ideas from a note with project-aware guidance.")(idea_command)
-app.command("init", help="Create a scribae.yaml config via a guided questionnaire.")(init_command)
-app.command(
-    "brief",
-    help="Generate a validated SEO brief (keywords, outline, FAQ, metadata) from a note.",
-)(brief_command)
-app.command("write", help="Draft an article from a note + SeoBrief JSON.")(write_command)
-app.command(
-    "feedback",
-    help="Review a draft against a brief to surface improvements without rewriting.",
-)(feedback_command)
-app.command("refine", help="Refine a draft using a validated SEO brief.")(refine_command)
-app.command("meta", help="Create publication metadata/frontmatter for a finished draft.")(meta_command)
-app.command("translate", help="Translate Markdown while preserving formatting (MT + post-edit).")(translate_command)
-app.command("version", help="Print the Scribae version.")(version_command)
-
-
 def main() -> None:
     """Entrypoint used by `python -m scribae.main`."""
     app()
@@ -3,22 +3,34 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
-import frontmatter
 import yaml
 from pydantic import BaseModel, ConfigDict, ValidationError, constr, field_validator
-from pydantic_ai import Agent, NativeOutput, UnexpectedModelBehavior
-from pydantic_ai.settings import ModelSettings
 
-from .brief import SeoBrief
+from .brief import DEFAULT_BATCH_CONCURRENCY, SeoBrief
 from .common import report, slugify
 from .io_utils import Reporter, truncate
-from .language import LanguageMismatchError, LanguageResolutionError, ensure_language_output, resolve_output_language
-from .llm import LLM_OUTPUT_RETRIES, LLM_TIMEOUT_SECONDS, OpenAISettings, apply_optional_settings, make_model
+from .language import (
+    LanguageMismatchError,
+    LanguageResolutionError,
+    ensure_language_output,
+    ensure_language_output_async,
+    resolve_output_language,
+)
+from .llm import (
+    LLM_OUTPUT_RETRIES,
+    LLM_TIMEOUT_SECONDS,
+    OpenAISettings,
+    apply_optional_settings,
+    make_model,
+    run_sync,
+    with_timeout,
+)
 from .project import ProjectConfig
 from .prompts.meta import (
     META_SYSTEM_PROMPT,
@@ -26,6 +38,15 @@ from .prompts.meta import (
     MetaPromptBundle,
     build_meta_prompt_bundle,
 )
+from .response_cache import ResponseCache, cache_key
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -173,13 +194,23 @@ def prepare_context(
     language: str | None = None,
     language_detector: Callable[[str], str] | None = None,
     reporter: Reporter = None,
+    brief: SeoBrief | None = None,
 ) -> MetaContext:
-    """Load inputs and prepare the metadata context."""
+    """Load inputs and prepare the metadata context.
+
+    Pass an already loaded `brief` to skip re-reading a brief shared by several drafts.
+    """
     if max_chars <= 0:
         raise MetaValidationError("--max-chars must be greater than zero.")
 
-    body = _load_body(body_path, max_chars=max_chars)
-    brief = _load_brief(brief_path) if brief_path else None
+    if brief is None and brief_path:
+        # Body and brief are independent reads; overlap them instead of paying both latencies in turn.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            brief_future = pool.submit(_load_brief, brief_path)
+            body = _load_body(body_path, max_chars=max_chars)
+            brief = brief_future.result()
+    else:
+        body = _load_body(body_path, max_chars=max_chars)
 
     report(reporter, f"Loaded body from {body.path.name} ({'truncated' if body.truncated else 'full'}).")
     current_meta, fabricated_fields = _build_seed_meta(body, brief=brief, project=project, overwrite=overwrite)
@@ -213,6 +244,45 @@ def prepare_context(
     )
 
 
+def prepare_contexts(
+    body_paths: Sequence[Path],
+    *,
+    brief_path: Path | None,
+    project: ProjectConfig,
+    overwrite: OverwriteMode,
+    max_chars: int,
+    language: str | None = None,
+    language_detector: Callable[[str], str] | None = None,
+    reporter: Reporter = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[MetaContext]:
+    """Build metadata contexts for several drafts, reading bodies concurrently and the shared brief once."""
+    if max_chars <= 0:
+        raise MetaValidationError("--max-chars must be greater than zero.")
+    if concurrency <= 0:
+        raise MetaValidationError("--concurrency must be greater than zero.")
+    if not body_paths:
+        return []
+
+    brief = _load_brief(brief_path)
+
+    def _prepare(body_path: Path) -> MetaContext:
+        return prepare_context(
+            body_path=body_path,
+            brief_path=brief_path,
+            project=project,
+            overwrite=overwrite,
+            max_chars=max_chars,
+            language=language,
+            language_detector=language_detector,
+            reporter=reporter,
+            brief=brief,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(body_paths))) as pool:
+        return list(pool.map(_prepare, body_paths))
+
+
 def build_prompt_bundle(context: MetaContext) -> MetaPromptBundle:
     """Render the system and user prompts for the metadata agent."""
 
@@ -238,17 +308,21 @@ def generate_metadata(
     timeout_seconds: float = LLM_TIMEOUT_SECONDS,
     force_llm_on_missing: bool = True,
     language_detector: Callable[[str], str] | None = None,
+    cache: ResponseCache | None = None,
+    on_token: Callable[[str], None] | None = None,
 ) -> ArticleMeta:
-    """Generate final article metadata, calling the LLM when needed."""
+    """Generate final article metadata, calling the LLM when needed.
+
+    With a `cache`, an identical prompt/model/sampling combination reuses the stored model response.
+    With `on_token`, the response is streamed and each raw text chunk is passed on as it arrives;
+    the assembled output is still validated against `ArticleMeta` once the stream ends.
+    """
     logger.debug("Generating metadata with overwrite mode '%s'", context.overwrite)
     prompts = prompts or build_prompt_bundle(context)
     needs_llm, reason = _needs_llm(context, force_llm_on_missing=force_llm_on_missing)
 
     if not needs_llm:
-        try:
-            return _finalize_article_meta(context.current_meta, body=context.body, project=context.project)
-        except ValidationError as exc:
-            raise MetaValidationError(f"Metadata validation failed: {exc}") from exc
+        return _metadata_without_llm(context)
 
     resolved_settings = OpenAISettings.from_env()
     llm_agent: Agent[None, ArticleMeta] = (
@@ -260,48 +334,157 @@ def generate_metadata(
         f"Calling model '{model_name}' via {resolved_settings.base_url}" + (f" (reason: {reason})" if reason else ""),
     )
 
+    def _call_model(prompt: str) -> ArticleMeta:
+        if on_token is not None:
+            return _stream_agent(llm_agent, prompt, timeout_seconds=timeout_seconds, on_token=on_token)
+        return _invoke_agent(llm_agent, prompt, timeout_seconds=timeout_seconds)
+
+    def _invoke(prompt: str) -> ArticleMeta:
+        if cache is None:
+            return _call_model(prompt)
+        key = cache_key(
+            model_name=model_name,
+            base_url=resolved_settings.base_url,
+            temperature=temperature,
+            system_prompt=prompts.system_prompt,
+            user_prompt=prompt,
+            top_p=top_p,
+            seed=seed,
+        )
+        cached = _cached_meta(cache, key, reporter=reporter)
+        if cached is not None:
+            return cached
+        meta = _call_model(prompt)
+        cache.put(key, render_json(meta))
+        return meta
+
     try:
         meta = cast(
             ArticleMeta,
             ensure_language_output(
                 prompt=prompts.user_prompt,
                 expected_language=context.language,
-                invoke=lambda prompt: _invoke_agent(llm_agent, prompt, timeout_seconds=timeout_seconds),
+                invoke=_invoke,
                 extract_text=_meta_language_text,
                 reporter=reporter,
                 language_detector=language_detector,
             ),
         )
-    except UnexpectedModelBehavior as exc:
-        raise MetaValidationError(
-            "LLM response never satisfied the ArticleMeta schema, giving up after repeated retries."
-        ) from exc
-    except LanguageMismatchError as exc:
-        raise MetaValidationError(str(exc)) from exc
-    except LanguageResolutionError as exc:
-        raise MetaValidationError(str(exc)) from exc
-    except TimeoutError as exc:
-        raise MetaLLMError(f"LLM request timed out after {int(timeout_seconds)} seconds.") from exc
     except KeyboardInterrupt:
         raise
-    except Exception as exc:  # pragma: no cover - surfaced to CLI
-        raise MetaLLMError(f"LLM request failed: {exc}") from exc
+    except Exception as exc:
+        raise _as_meta_error(exc, timeout_seconds=timeout_seconds) from exc
 
-    merged = meta
-    if context.overwrite == OverwriteMode.MISSING:
-        merged = _preserve_existing_fields(meta, context.current_meta)
+    logger.debug("Metadata generation completed successfully")
+    return _merge_llm_meta(meta, context)
 
-    if merged.reading_time is None:
-        merged.reading_time = context.body.reading_time
-    merged.tags = _apply_allowed_tags(merged.tags, context.project.get("allowed_tags"))
 
-    logger.debug("Metadata generation completed successfully")
-    return merged
+def generate_metadata_batch(
+    contexts: Sequence[MetaContext],
+    *,
+    model_name: str,
+    temperature: float,
+    top_p: float | None = None,
+    seed: int | None = None,
+    reporter: Reporter = None,
+    timeout_seconds: float = LLM_TIMEOUT_SECONDS,
+    force_llm_on_missing: bool = True,
+    language_detector: Callable[[str], str] | None = None,
+    cache: ResponseCache | None = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    on_result: Callable[[int, ArticleMeta], None] | None = None,
+) -> list[ArticleMeta]:
+    """Generate metadata for several drafts concurrently and return it in input order.
+
+    All requests share one agent and Scribae's event loop; at most `concurrency` are in flight at once.
+    `on_result(index, meta)` is called as soon as each draft's metadata is ready. A failed request does
+    not stop the others: once every request has settled, the failures are raised together as one MetaError.
+    """
+    if concurrency <= 0:
+        raise MetaValidationError("--concurrency must be greater than zero.")
+    if not contexts:
+        return []
+
+    resolved_settings = OpenAISettings.from_env()
+    llm_agent = _create_agent(model_name, temperature, top_p=top_p, seed=seed)
+    report(
+        reporter,
+        f"Calling model '{model_name}' via {resolved_settings.base_url} "
+        f"for {len(contexts)} drafts (concurrency={concurrency})",
+    )
+
+    async def _generate_all() -> list[ArticleMeta | BaseException]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _generate_one(index: int, context: MetaContext) -> ArticleMeta:
+            needs_llm, _ = _needs_llm(context, force_llm_on_missing=force_llm_on_missing)
+            if not needs_llm:
+                meta = _metadata_without_llm(context)
+            else:
+                prompts = build_prompt_bundle(context)
+
+                async def _invoke(prompt: str) -> ArticleMeta:
+                    if cache is None:
+                        return await _run_agent(llm_agent, prompt, timeout_seconds=timeout_seconds)
+                    key = cache_key(
+                        model_name=model_name,
+                        base_url=resolved_settings.base_url,
+                        temperature=temperature,
+                        system_prompt=prompts.system_prompt,
+                        user_prompt=prompt,
+                        top_p=top_p,
+                        seed=seed,
+                    )
+                    cached = _cached_meta(cache, key, reporter=reporter)
+                    if cached is not None:
+                        return cached
+                    result = await _run_agent(llm_agent, prompt, timeout_seconds=timeout_seconds)
+                    cache.put(key, render_json(result))
+                    return result
+
+                async with semaphore:
+                    result = await ensure_language_output_async(
+                        prompt=prompts.user_prompt,
+                        expected_language=context.language,
+                        invoke=_invoke,
+                        extract_text=_meta_language_text,
+                        reporter=reporter,
+                        language_detector=language_detector,
+                    )
+                meta = _merge_llm_meta(cast(ArticleMeta, result), context)
+            report(reporter, f"Metadata ready for '{context.body.path.name}'.")
+            if on_result is not None:
+                on_result(index, meta)
+            return meta
+
+        # Settle every request before reporting failures, so one error neither discards finished metadata
+        # nor leaves sibling requests running on the shared loop.
+        return await asyncio.gather(
+            *(_generate_one(index, context) for index, context in enumerate(contexts)), return_exceptions=True
+        )
+
+    outcomes = run_sync(_generate_all())
+    results: list[ArticleMeta] = []
+    failures: list[tuple[str, MetaError]] = []
+    for context, outcome in zip(contexts, outcomes, strict=True):
+        if isinstance(outcome, ArticleMeta):
+            results.append(outcome)
+        elif isinstance(outcome, Exception):
+            failures.append((context.body.path.name, _as_meta_error(outcome, timeout_seconds=timeout_seconds)))
+        else:
+            raise outcome
+    if failures:
+        first = failures[0][1]
+        details = "\n".join(f"- {label}: {error}" for label, error in failures)
+        raise type(first)(f"{len(failures)} of {len(contexts)} drafts failed:\n{details}", exit_code=first.exit_code)
+
+    report(reporter, f"Metadata generated for {len(results)} drafts.")
+    return results
 
 
 def render_json(meta: ArticleMeta) -> str:
     """Serialize ArticleMeta to formatted JSON."""
-    return json.dumps(meta.model_dump(), indent=2, ensure_ascii=False)
+    return meta.model_dump_json(indent=2)
 
 
 def render_frontmatter(
@@ -312,7 +495,7 @@ def render_frontmatter(
 ) -> tuple[str, dict[str, Any]]:
     """Merge ArticleMeta into front matter and return YAML string plus merged dict."""
     merged = _merge_frontmatter(meta, original, overwrite=overwrite)
-    yaml_body = yaml.safe_dump(merged, sort_keys=False, allow_unicode=True).strip()
+    yaml_body = yaml.dump(merged, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True).strip()
     payload = f"---\n{yaml_body}\n---\n"
     return payload, merged
 
@@ -338,6 +521,8 @@ def save_prompt_artifacts(
 
 
 def _load_body(body_path: Path, *, max_chars: int) -> BodyDocument:
+    import frontmatter
+
     try:
         post = frontmatter.load(body_path)
     except FileNotFoundError as exc:
@@ -446,6 +631,37 @@ def _apply_allowed_tags(tags: list[str], allowed: list[str] | None) -> list[str]
     return filtered or tags
 
 
+def _metadata_without_llm(context: MetaContext) -> ArticleMeta:
+    try:
+        return _finalize_article_meta(context.current_meta, body=context.body, project=context.project)
+    except ValidationError as exc:
+        raise MetaValidationError(f"Metadata validation failed: {exc}") from exc
+
+
+def _merge_llm_meta(meta: ArticleMeta, context: MetaContext) -> ArticleMeta:
+    merged = meta
+    if context.overwrite == OverwriteMode.MISSING:
+        merged = _preserve_existing_fields(meta, context.current_meta)
+
+    if merged.reading_time is None:
+        merged.reading_time = context.body.reading_time
+    merged.tags = _apply_allowed_tags(merged.tags, context.project.get("allowed_tags"))
+    return merged
+
+
+def _cached_meta(cache: ResponseCache, key: str, *, reporter: Reporter) -> ArticleMeta | None:
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    try:
+        meta = ArticleMeta.model_validate_json(cached)
+    except ValidationError:
+        logger.debug("Ignoring invalid cached metadata response %s", key)
+        return None
+    report(reporter, "Reusing cached model response.")
+    return meta
+
+
 def _needs_llm(context: MetaContext, *, force_llm_on_missing: bool) -> tuple[bool, str | None]:
     if context.overwrite == OverwriteMode.NONE:
         return False, "overwrite=none skips LLM"
@@ -528,6 +744,9 @@ def _create_agent(
     top_p: float | None = None,
     seed: int | None = None,
 ) -> Agent[None, ArticleMeta]:
+    from pydantic_ai import Agent, NativeOutput
+    from pydantic_ai.settings import ModelSettings
+
     model_settings = ModelSettings(temperature=temperature)
     apply_optional_settings(model_settings, top_p=top_p, seed=seed)
     model = make_model(model_name, model_settings=model_settings)
@@ -540,20 +759,69 @@ def _create_agent(
 
 
 def _invoke_agent(agent: Agent[None, ArticleMeta], prompt: str, *, timeout_seconds: float) -> ArticleMeta:
-    """Run the agent with a timeout using asyncio."""
+    """Run the agent with a timeout on the shared event loop."""
+    return run_sync(_run_agent(agent, prompt, timeout_seconds=timeout_seconds))
+
+
+async def _run_agent(agent: Agent[None, ArticleMeta], prompt: str, *, timeout_seconds: float) -> ArticleMeta:
+    """Await a single agent run with a timeout inside the caller's event loop."""
 
     async def _call() -> ArticleMeta:
         run = await agent.run(prompt)
-        output = getattr(run, "output", None)
-        if isinstance(output, ArticleMeta):
-            return output
-        if isinstance(output, BaseModel):
-            return ArticleMeta.model_validate(output.model_dump())
-        if isinstance(output, dict):
-            return ArticleMeta.model_validate(output)
-        raise TypeError("LLM output is not an ArticleMeta instance")
+        return _coerce_output(getattr(run, "output", None))
+
+    return await with_timeout(_call(), timeout_seconds)
+
+
+def _stream_agent(
+    agent: Agent[None, ArticleMeta],
+    prompt: str,
+    *,
+    timeout_seconds: float,
+    on_token: Callable[[str], None],
+) -> ArticleMeta:
+    """Run the agent in streaming mode, forwarding new response text before validating the full output."""
+    from pydantic_ai.messages import TextPart
+
+    async def _call() -> ArticleMeta:
+        emitted = 0
+        async with agent.run_stream(prompt) as run:
+            async for response, _ in run.stream_responses(debounce_by=None):
+                text = "".join(part.content for part in response.parts if isinstance(part, TextPart))
+                if len(text) > emitted:
+                    on_token(text[emitted:])
+                    emitted = len(text)
+            output = await run.get_output()
+        return _coerce_output(output)
+
+    return run_sync(with_timeout(_call(), timeout_seconds))
+
+
+def _as_meta_error(exc: Exception, *, timeout_seconds: float) -> MetaError:
+    """Map a failure raised while generating metadata to the matching MetaError."""
+    from pydantic_ai import UnexpectedModelBehavior
+
+    if isinstance(exc, MetaError):
+        return exc
+    if isinstance(exc, UnexpectedModelBehavior):
+        return MetaValidationError(
+            "LLM response never satisfied the ArticleMeta schema, giving up after repeated retries."
+        )
+    if isinstance(exc, (LanguageMismatchError, LanguageResolutionError)):
+        return MetaValidationError(str(exc))
+    if isinstance(exc, TimeoutError):
+        return MetaLLMError(f"LLM request timed out after {int(timeout_seconds)} seconds.")
+    return MetaLLMError(f"LLM request failed: {exc}")
+
 
-    return asyncio.run(asyncio.wait_for(_call(), timeout_seconds))
+def _coerce_output(output: object) -> ArticleMeta:
+    if isinstance(output, ArticleMeta):
+        return output
+    if isinstance(output, BaseModel):
+        return ArticleMeta.model_validate(output.model_dump())
+    if isinstance(output, dict):
+        return ArticleMeta.model_validate(output)
+    raise TypeError("LLM output is not an ArticleMeta instance")
 
 
 def _meta_language_text(meta: ArticleMeta) -> str:
@@ -650,7 +918,9 @@ __all__ = [
     "PromptBundle",
     "build_prompt_bundle",
     "generate_metadata",
+    "generate_metadata_batch",
     "prepare_context",
+    "prepare_contexts",
     "render_dry_run_prompt",
     "render_frontmatter",
     "render_json",
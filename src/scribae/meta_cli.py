@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import typer
 
+from .brief import DEFAULT_BATCH_CONCURRENCY
 from .cli_output import echo_info, is_quiet, secho_info
+from .common import expand_markdown_paths, slugify
 from .llm import DEFAULT_MODEL_NAME
 from .logging_config import setup_logging
 from .meta import (
@@ -19,23 +24,40 @@ from .meta import (
     OverwriteMode,
     build_prompt_bundle,
     generate_metadata,
+    generate_metadata_batch,
     prepare_context,
-    render_dry_run_prompt,
+    prepare_contexts,
     render_frontmatter,
     render_json,
     save_prompt_artifacts,
 )
 from .project import load_default_project, load_project
+from .response_cache import DEFAULT_CACHE_TTL_SECONDS, ResponseCache, default_cache_dir
 
 
 def meta_command(
-    body: Path = typer.Option(  # noqa: B008
-        ...,
+    body: Path | None = typer.Option(  # noqa: B008
+        None,
         "--body",
         "-b",
-        resolve_path=True,
         help="Path to the Markdown body produced by `scribae write`.",
     ),
+    batch: str | None = typer.Option(  # noqa: B008
+        None,
+        "--batch",
+        help="Glob pattern or directory of Markdown bodies to process in one run (requires --out-dir).",
+    ),
+    out_dir: Path | None = typer.Option(  # noqa: B008
+        None,
+        "--out-dir",
+        help="Directory for the per-body outputs of --batch.",
+    ),
+    concurrency: int = typer.Option(  # noqa: B008
+        DEFAULT_BATCH_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        help="Maximum number of concurrent LLM requests when using --batch.",
+    ),
     brief: Path | None = typer.Option(  # noqa: B008
         None,
         "--brief",
@@ -108,7 +130,6 @@ def meta_command(
         file_okay=False,
         dir_okay=True,
         exists=False,
-        resolve_path=True,
         help="Directory for saving prompt/response artifacts.",
     ),
     verbose: bool = typer.Option(  # noqa: B008
@@ -126,11 +147,26 @@ def meta_command(
         None,
         "--out",
         "-o",
-        resolve_path=True,
         help="Write output to this file (required).",
     ),
+    no_cache: bool = typer.Option(  # noqa: B008
+        False,
+        "--no-cache",
+        help="Always call the model instead of reusing a cached response for an identical request.",
+    ),
+    cache_ttl: int = typer.Option(  # noqa: B008
+        DEFAULT_CACHE_TTL_SECONDS // 60,
+        "--cache-ttl",
+        min=0,
+        help="Minutes a cached model response stays valid (0 disables the cache).",
+    ),
 ) -> None:
-    """CLI handler for `scribae meta`."""
+    """CLI handler for `scribae meta`.
+
+    Examples:
+      scribae meta --body draft.md --brief brief.json --out meta.json
+      scribae meta --batch "drafts/*.md" --format frontmatter --out-dir meta/
+    """
     setup_logging(verbose=verbose and not is_quiet())
     reporter = (lambda msg: typer.secho(msg, err=True)) if verbose and not is_quiet() else None
 
@@ -141,7 +177,19 @@ def meta_command(
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
         raise typer.Exit(2) from exc
 
-    if not dry_run and out is None:
+    if (body is None) == (batch is None):
+        raise typer.BadParameter("Provide exactly one of --body or --batch.", param_hint="--body/--batch")
+    if batch is not None:
+        if dry_run or save_prompt is not None:
+            flag = "--dry-run" if dry_run else "--save-prompt"
+            raise typer.BadParameter(f"{flag} cannot be combined with --batch.", param_hint=flag)
+        if out is not None or out_dir is None:
+            raise typer.BadParameter(
+                "--batch requires --out-dir and cannot be combined with --out.", param_hint="--batch"
+            )
+    elif out_dir is not None:
+        raise typer.BadParameter("--out-dir is only used with --batch; use --out.", param_hint="--out-dir")
+    elif not dry_run and out is None:
         raise typer.BadParameter("Choose an output destination with --out.", param_hint="--out")
 
     if project:
@@ -163,8 +211,65 @@ def meta_command(
                 fg=typer.colors.YELLOW,
             )
 
-    body_path = body.expanduser()
     brief_path = brief.expanduser() if brief else None
+    cache = None if no_cache or cache_ttl == 0 else ResponseCache(default_cache_dir(), cache_ttl * 60)
+
+    if batch is not None:
+        assert out_dir is not None
+        body_paths = expand_markdown_paths(batch)
+        if not body_paths:
+            typer.secho(f"No bodies matched --batch {batch}.", err=True, fg=typer.colors.RED)
+            raise typer.Exit(3)
+        out_dir = out_dir.expanduser()
+        suffix = ".frontmatter.yaml" if fmt == OutputFormat.FRONTMATTER else ".json"
+        try:
+            contexts = prepare_contexts(
+                body_paths,
+                brief_path=brief_path,
+                project=project_config,
+                overwrite=overwrite_mode,
+                max_chars=max_chars,
+                language=language,
+                reporter=reporter,
+                concurrency=concurrency,
+            )
+
+            def _write(index: int, meta: ArticleMeta) -> None:
+                context = contexts[index]
+                stem = f"{index + 1:02d}-{slugify(context.body.path.stem) or 'draft'}"
+                try:
+                    _write_outputs(
+                        meta,
+                        fmt=fmt,
+                        out=out_dir / f"{stem}{suffix}",
+                        original_frontmatter=context.body.frontmatter,
+                        overwrite=overwrite_mode,
+                    )
+                except OSError as exc:
+                    raise MetaFileError(f"Unable to write metadata for {context.body.path.name}: {exc}") from exc
+
+            generate_metadata_batch(
+                contexts,
+                model_name=model,
+                temperature=temperature,
+                top_p=top_p,
+                seed=seed,
+                reporter=reporter,
+                force_llm_on_missing=force_llm_on_missing,
+                cache=cache,
+                concurrency=concurrency,
+                on_result=_write,
+            )
+        except KeyboardInterrupt:
+            typer.secho("Cancelled by user.", err=True, fg=typer.colors.YELLOW)
+            raise typer.Exit(130) from None
+        except MetaError as exc:
+            typer.secho(str(exc), err=True, fg=typer.colors.RED)
+            raise typer.Exit(exc.exit_code) from exc
+        return
+
+    assert body is not None
+    body_path = body.expanduser().resolve()
 
     try:
         context = prepare_context(
@@ -189,20 +294,23 @@ def meta_command(
     prompts = build_prompt_bundle(context)
 
     if dry_run:
-        typer.echo(render_dry_run_prompt(context))
+        typer.echo(prompts.user_prompt)
         return
 
     try:
-        meta = generate_metadata(
-            context,
-            model_name=model,
-            temperature=temperature,
-            top_p=top_p,
-            seed=seed,
-            reporter=reporter,
-            prompts=prompts,
-            force_llm_on_missing=force_llm_on_missing,
-        )
+        with _stderr_token_stream() as on_token:
+            meta = generate_metadata(
+                context,
+                model_name=model,
+                temperature=temperature,
+                top_p=top_p,
+                seed=seed,
+                reporter=reporter,
+                prompts=prompts,
+                force_llm_on_missing=force_llm_on_missing,
+                cache=cache,
+                on_token=on_token,
+            )
     except KeyboardInterrupt:
         typer.secho("Cancelled by user.", err=True, fg=typer.colors.YELLOW)
         raise typer.Exit(130) from None
@@ -224,12 +332,44 @@ def meta_command(
 
     if save_prompt is not None:
         try:
-            save_prompt_artifacts(prompts, destination=save_prompt, response=meta)
+            save_prompt_artifacts(prompts, destination=save_prompt.expanduser().resolve(), response=meta)
         except OSError as exc:
             typer.secho(f"Unable to save prompt artifacts: {exc}", err=True, fg=typer.colors.RED)
             raise typer.Exit(3) from exc
 
-    _write_outputs(meta, fmt=fmt, out=out, original_frontmatter=context.body.frontmatter, overwrite=overwrite_mode)
+    # Output paths are resolved only here, so --dry-run and early failures never touch them.
+    assert out is not None  # guarded by the option checks above
+    _write_outputs(
+        meta,
+        fmt=fmt,
+        out=out.expanduser().resolve(),
+        original_frontmatter=context.body.frontmatter,
+        overwrite=overwrite_mode,
+    )
+
+
+@contextmanager
+def _stderr_token_stream() -> Iterator[Callable[[str], None] | None]:
+    """Yield a callback echoing streamed response text to an interactive stderr, ending the line on exit.
+
+    Yields None (no streaming) with --quiet or when stderr is not a terminal.
+    """
+    if is_quiet() or not sys.stderr.isatty():
+        yield None
+        return
+
+    written = False
+
+    def _echo(chunk: str) -> None:
+        nonlocal written
+        typer.echo(chunk, err=True, nl=False)
+        written = True
+
+    try:
+        yield _echo
+    finally:
+        if written:
+            typer.echo(err=True)
 
 
 def _write_outputs(
@@ -241,11 +381,13 @@ def _write_outputs(
     overwrite: OverwriteMode,
 ) -> None:
     assert out is not None  # guarded by caller
+    # Both outputs land next to each other, so one mkdir covers them.
+    out.parent.mkdir(parents=True, exist_ok=True)
 
     if fmt in (OutputFormat.JSON, OutputFormat.BOTH):
-        payload = render_json(meta)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(payload + "\n", encoding="utf-8")
+        with out.open("w", encoding="utf-8") as handle:
+            handle.write(render_json(meta))
+            handle.write("\n")
         echo_info(f"Wrote metadata JSON to {out}")
 
     if fmt in (OutputFormat.FRONTMATTER, OutputFormat.BOTH):
@@ -255,6 +397,5 @@ def _write_outputs(
             overwrite=overwrite,
         )
         path = out if fmt == OutputFormat.FRONTMATTER else out.with_suffix(out.suffix + ".frontmatter.yaml")
-        path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(frontmatter_text, encoding="utf-8")
         echo_info(f"Wrote frontmatter to {path}")
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class ProjectConfig(TypedDict):
     """Structured metadata describing a Scribae project."""
@@ -29,10 +35,17 @@ DEFAULT_PROJECT: ProjectConfig = {
     "allowed_tags": None,
 }
 
+_STRING_KEYS = ("site_name", "domain", "audience", "tone", "language")
+
 
 def default_project() -> ProjectConfig:
     """Return a copy of the default project configuration."""
-    return _merge_with_defaults({})
+    return _copy_config(_DEFAULT_CONFIG)
+
+
+def keywords_text(project: ProjectConfig) -> str:
+    """Return the project keywords as the comma-separated prompt string, or "none" when empty."""
+    return _join_keywords(tuple(project.get("keywords") or ()))
 
 
 def load_default_project(base_dir: Path | None = None) -> tuple[ProjectConfig, str | None]:
@@ -53,13 +66,25 @@ def load_project(name: str, *, base_dir: Path | None = None) -> ProjectConfig:
     """Load a project YAML file and normalize its structure."""
     path = _resolve_project_path(name, base_dir=base_dir)
 
+    try:
+        stat = path.stat()
+    except OSError as exc:  # pragma: no cover - surfaced by CLI
+        raise OSError(f"Unable to read project config {path}: {exc}") from exc
+
+    config = _parse_project(path.absolute(), stat.st_mtime_ns, stat.st_size)
+    return _copy_config(config)
+
+
+@lru_cache(maxsize=16)
+def _parse_project(path: Path, mtime_ns: int, size: int) -> ProjectConfig:
+    """Parse a project file; keyed on its mtime and size so edits are picked up within one process."""
     try:
         text = path.read_text(encoding="utf-8")
     except OSError as exc:  # pragma: no cover - surfaced by CLI
         raise OSError(f"Unable to read project config {path}: {exc}") from exc
 
     try:
-        raw_data = yaml.safe_load(text) or {}
+        raw_data = yaml.load(text, Loader=_SafeLoader) or {}
     except yaml.YAMLError as exc:
         raise ValueError(f"Invalid YAML in {path}: {exc}") from exc
 
@@ -69,6 +94,21 @@ def load_project(name: str, *, base_dir: Path | None = None) -> ProjectConfig:
     return _merge_with_defaults(raw_data)
 
 
+@lru_cache(maxsize=64)
+def _join_keywords(keywords: tuple[str, ...]) -> str:
+    # Every prompt builder renders the same keyword list once per section; join it once per distinct list.
+    return ", ".join(keywords) or "none"
+
+
+def _copy_config(config: ProjectConfig) -> ProjectConfig:
+    """Return a copy whose lists can be mutated without touching the cached config."""
+    copied = config.copy()
+    copied["keywords"] = list(config["keywords"])
+    if config["allowed_tags"] is not None:
+        copied["allowed_tags"] = list(config["allowed_tags"])
+    return copied
+
+
 def _resolve_project_path(name: str, *, base_dir: Path | None = None) -> Path:
     candidate = Path(name)
     if candidate.is_file():
@@ -90,23 +130,13 @@ def _resolve_project_path(name: str, *, base_dir: Path | None = None) -> Path:
 
 
 def _merge_with_defaults(data: Mapping[str, Any]) -> ProjectConfig:
+    # keywords/allowed_tags are rebuilt by their normalizers, so the shallow merge never shares default lists.
     merged: dict[str, Any] = {
-        "site_name": DEFAULT_PROJECT["site_name"],
-        "domain": DEFAULT_PROJECT["domain"],
-        "audience": DEFAULT_PROJECT["audience"],
-        "tone": DEFAULT_PROJECT["tone"],
-        "keywords": list(DEFAULT_PROJECT["keywords"]),
-        "language": DEFAULT_PROJECT["language"],
-        "allowed_tags": DEFAULT_PROJECT["allowed_tags"],
+        **DEFAULT_PROJECT,
+        **{key: str(value).strip() for key in _STRING_KEYS if (value := data.get(key)) is not None},
     }
-
-    for key in ("site_name", "domain", "audience", "tone", "language"):
-        if (value := data.get(key)) is not None:
-            merged[key] = str(value).strip()
-
-    keywords_value = data.get("keywords", merged["keywords"])
-    merged["keywords"] = _normalize_keywords(keywords_value)
-    merged["allowed_tags"] = _normalize_allowed_tags(data.get("allowed_tags", merged["allowed_tags"]))
+    merged["keywords"] = _normalize_keywords(data.get("keywords", DEFAULT_PROJECT["keywords"]))
+    merged["allowed_tags"] = _normalize_allowed_tags(data.get("allowed_tags", DEFAULT_PROJECT["allowed_tags"]))
 
     return cast(ProjectConfig, merged)
 
@@ -136,3 +166,7 @@ def _normalize_allowed_tags(value: Any) -> list[str] | None:
 
     cleaned = [item for item in candidates if item]
     return cleaned or None
+
+
+# Normalized once at import; default_project() hands out copies.
+_DEFAULT_CONFIG = _merge_with_defaults({})
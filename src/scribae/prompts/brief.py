@@ -4,7 +4,9 @@ import textwrap
 from dataclasses import dataclass
 
 from scribae.idea import Idea
-from scribae.project import ProjectConfig
+from scribae.project import ProjectConfig, keywords_text
+
+from .templating import compile_template
 
 SYSTEM_PROMPT = textwrap.dedent(
     """\
@@ -57,8 +59,64 @@ SCHEMA_EXAMPLE = textwrap.dedent(
     """
 ).strip()
 
+USER_PROMPT_TEMPLATE = textwrap.dedent(
+    """\
+    [PROJECT CONTEXT]
+    Site: {site_name} ({domain})
+    Audience: {audience}
+    Tone: {tone}
+    FocusKeywords: {keywords}
+    Language: {language}
+    Output directive: write the entire brief in language code '{language}'.
+
+    [TASK]
+    Create an SEO brief for an article derived strictly from the note below.
+    Return JSON matching the SeoBrief schema exactly.
+    Expand the outline to cover 6–10 sections.
+    Provide 2–5 FAQ entries, each containing a question and answer (aim for 3).
+
+    {idea_block}
+    {idea_guidance}
+
+    [FAQ RULES]
+    - Every FAQ item must be an object with "question" and "answer" strings.
+    - Keep answers substantive (1–3 sentences) and never leave them blank or null.
+    - If the FAQ array would break these rules, fix it before responding.
+
+    [NOTE TITLE]
+    {note_title}
+
+    [NOTE CONTENT]
+    {note_content}
+
+    [SCHEMA EXAMPLE]
+    {schema_example}
+
+    Re-check: JSON only. FAQ array contains 2–5 question/answer objects, no exceptions.
+    """
+).strip()
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
+
+IDEA_BLOCK_TEMPLATE = textwrap.dedent(
+    """\
+    [IDEA]
+    Id: {idea.id}
+    Title: {idea.title}
+    Description: {idea.description}
+    Why: {idea.why}
+    """
+).strip()
+
+IDEA_GUIDANCE = textwrap.dedent(
+    """\
+    [IDEA GUIDANCE]
+    Use the idea above as the anchor for title, h1, angle, search intent, and outline.
+    Keep the brief faithful to the idea's description and rationale.
+    """
+).strip()
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptBundle:
     """Container for the system and user prompts."""
 
@@ -89,65 +147,14 @@ def build_user_prompt(
     idea: Idea | None = None,
 ) -> str:
     """Assemble the structured user prompt with project context."""
-    keywords = ", ".join(project["keywords"]) if project["keywords"] else "none"
+    keywords = keywords_text(project)
     idea_block = ""
     idea_guidance = ""
     if idea is not None:
-        idea_block = textwrap.dedent(
-            f"""\
-            [IDEA]
-            Id: {idea.id}
-            Title: {idea.title}
-            Description: {idea.description}
-            Why: {idea.why}
-            """
-        ).strip()
-        idea_guidance = textwrap.dedent(
-            """\
-            [IDEA GUIDANCE]
-            Use the idea above as the anchor for title, h1, angle, search intent, and outline.
-            Keep the brief faithful to the idea's description and rationale.
-            """
-        ).strip()
-
-    template = textwrap.dedent(
-        """\
-        [PROJECT CONTEXT]
-        Site: {site_name} ({domain})
-        Audience: {audience}
-        Tone: {tone}
-        FocusKeywords: {keywords}
-        Language: {language}
-        Output directive: write the entire brief in language code '{language}'.
-
-        [TASK]
-        Create an SEO brief for an article derived strictly from the note below.
-        Return JSON matching the SeoBrief schema exactly.
-        Expand the outline to cover 6–10 sections.
-        Provide 2–5 FAQ entries, each containing a question and answer (aim for 3).
-
-        {idea_block}
-        {idea_guidance}
-
-        [FAQ RULES]
-        - Every FAQ item must be an object with "question" and "answer" strings.
-        - Keep answers substantive (1–3 sentences) and never leave them blank or null.
-        - If the FAQ array would break these rules, fix it before responding.
-
-        [NOTE TITLE]
-        {note_title}
-
-        [NOTE CONTENT]
-        {note_content}
-
-        [SCHEMA EXAMPLE]
-        {schema_example}
-
-        Re-check: JSON only. FAQ array contains 2–5 question/answer objects, no exceptions.
-        """
-    ).strip()
-
-    return template.format(
+        idea_block = IDEA_BLOCK_TEMPLATE.format(idea=idea)
+        idea_guidance = IDEA_GUIDANCE
+
+    return _render_user_prompt(
         site_name=project["site_name"],
         domain=project["domain"],
         audience=project["audience"],
@@ -165,6 +172,7 @@ def build_user_prompt(
 __all__ = [
     "SYSTEM_PROMPT",
     "SCHEMA_EXAMPLE",
+    "USER_PROMPT_TEMPLATE",
     "PromptBundle",
     "build_prompt_bundle",
     "build_user_prompt",
@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import json
 import textwrap
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Protocol
 
+from pydantic_core import to_json
+
 from scribae.brief import SeoBrief
-from scribae.project import ProjectConfig
+from scribae.project import ProjectConfig, keywords_text
 
 from .feedback_categories import CATEGORY_DEFINITIONS
+from .templating import compile_template
 
 
 class FeedbackPromptBody(Protocol):
     @property
-    def excerpt(self) -> str: ...
+    def text(self) -> str: ...
 
 
 class FeedbackPromptContext(Protocol):
@@ -41,8 +46,11 @@ class FeedbackPromptContext(Protocol):
     @property
     def selected_sections(self) -> list[dict[str, str]]: ...
 
+    @property
+    def compact_schema(self) -> bool: ...
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeedbackPromptBundle:
     system_prompt: str
     user_prompt: str
@@ -69,8 +77,16 @@ FEEDBACK_SYSTEM_PROMPT = textwrap.dedent(
     """
 ).strip()
 
+# Static sections come first and per-draft content last, so consecutive requests share the longest
+# possible prefix and hit the provider's automatic prompt cache.
 FEEDBACK_USER_PROMPT_TEMPLATE = textwrap.dedent(
     """\
+    [REQUIRED JSON SCHEMA]
+    {schema_json}
+
+    [FOCUS CATEGORY DEFINITIONS]
+    {category_definitions}
+
     [PROJECT CONTEXT]
     Site: {site_name} ({domain})
     Audience: {audience}
@@ -93,31 +109,82 @@ FEEDBACK_USER_PROMPT_TEMPLATE = textwrap.dedent(
     {sections_under_review_line}
     Note: Use "other" only for high severity issues that fall outside the focused categories.
 
-    [FOCUS CATEGORY DEFINITIONS]
-    {category_definitions}
+    [SOURCE NOTE]
+    {note_excerpt}
 
     [DRAFT SECTIONS]
     The following sections are extracted from the draft for review:
     {draft_sections_json}
 
-    [SOURCE NOTE]
-    {note_excerpt}
-
-    [REQUIRED JSON SCHEMA]
-    {schema_json}
-
     [TASK]
     Review the draft sections against the brief. Produce a JSON report only.
     """
 ).strip()
+_render_feedback_user_prompt = compile_template(FEEDBACK_USER_PROMPT_TEMPLATE)
+
+
+_ALL_CATEGORIES = tuple(CATEGORY_DEFINITIONS)
+_CATEGORY_LINES = {category: f"- {category}: {definition}" for category, definition in CATEGORY_DEFINITIONS.items()}
+_CATEGORY_PLACEHOLDER = "<categories>"
+# Rendered once at import; only the findings category enum varies between calls. Kept on one line:
+# indentation made up a third of the example's characters and the model reads it just as well.
+_SCHEMA_JSON_TEMPLATE = json.dumps(
+    {
+        "summary": {"issues": ["string"], "strengths": ["string"]},
+        "brief_alignment": {
+            "intent": "string",
+            "outline_covered": ["string"],
+            "outline_missing": ["string"],
+            "keywords_covered": ["string"],
+            "keywords_missing": ["string"],
+            "faq_covered": ["string"],
+            "faq_missing": ["string"],
+        },
+        "section_notes": [
+            {
+                "heading": "string",
+                "notes": ["string"],
+            }
+        ],
+        "evidence_gaps": ["string"],
+        "findings": [
+            {
+                "severity": "low|medium|high",
+                "category": _CATEGORY_PLACEHOLDER,
+                "message": "string",
+                "location": {"heading": "string", "paragraph_index": 1},
+            }
+        ],
+        "checklist": ["string"],
+    },
+    ensure_ascii=False,
+)
+
+
+@lru_cache(maxsize=32)
+def _schema_json(focus_categories: tuple[str, ...]) -> str:
+    # Include selected categories + "other" for critical overrides
+    category_enum = "|".join((*focus_categories, "other"))
+    return _SCHEMA_JSON_TEMPLATE.replace(_CATEGORY_PLACEHOLDER, category_enum, 1)
+
+
+@lru_cache(maxsize=32)
+def _compact_schema_summary(focus_categories: tuple[str, ...]) -> str:
+    # The agent already sends the full FeedbackReport JSON schema as its structured-output format,
+    # so the example above is redundant there; keep only the category enum the schema cannot express.
+    category_enum = "|".join((*focus_categories, "other"))
+    return (
+        "Use the FeedbackReport response schema (fields: summary, brief_alignment, section_notes, "
+        f"evidence_gaps, findings, checklist). findings[].category: {category_enum}"
+    )
 
 
-def _format_category_definitions(categories: list[str]) -> str:
-    lines = [f"- {category}: {CATEGORY_DEFINITIONS[category]}" for category in categories]
-    return "\n".join(lines) if lines else "- none"
+@lru_cache(maxsize=32)
+def _format_category_definitions(categories: tuple[str, ...]) -> str:
+    return "\n".join([_CATEGORY_LINES[category] for category in categories]) or "- none"
 
 
-def _format_sections_under_review(selected_outline: list[str], total_outline: int) -> str:
+def _format_sections_under_review(selected_outline: Sequence[str], total_outline: int) -> str:
     """Format SectionsUnderReview line, or empty string if all sections are selected."""
     if len(selected_outline) >= total_outline:
         # All sections selected - omit the line entirely (redundant with Outline above)
@@ -130,68 +197,82 @@ def _format_sections_under_review(selected_outline: list[str], total_outline: in
 
 
 def build_feedback_prompt_bundle(context: FeedbackPromptContext) -> FeedbackPromptBundle:
-    """Render the system and user prompts for the feedback agent."""
-    focus_categories = context.focus or list(CATEGORY_DEFINITIONS.keys())
-    focus_label = ", ".join(focus_categories)
-    project_keywords = ", ".join(context.project.get("keywords") or []) or "none"
-    faq_entries = [f"{item.question} — {item.answer}" for item in context.brief.faq]
-    # Build category enum for schema: include selected categories + "other" for critical overrides
-    category_enum = "|".join(focus_categories + ["other"])
-    schema_json = json.dumps(
-        {
-            "summary": {"issues": ["string"], "strengths": ["string"]},
-            "brief_alignment": {
-                "intent": "string",
-                "outline_covered": ["string"],
-                "outline_missing": ["string"],
-                "keywords_covered": ["string"],
-                "keywords_missing": ["string"],
-                "faq_covered": ["string"],
-                "faq_missing": ["string"],
-            },
-            "section_notes": [
-                {
-                    "heading": "string",
-                    "notes": ["string"],
-                }
-            ],
-            "evidence_gaps": ["string"],
-            "findings": [
-                {
-                    "severity": "low|medium|high",
-                    "category": category_enum,
-                    "message": "string",
-                    "location": {"heading": "string", "paragraph_index": 1},
-                }
-            ],
-            "checklist": ["string"],
-        },
-        indent=2,
-        ensure_ascii=False,
-    )
-    draft_sections_json = json.dumps(context.selected_sections, indent=2, ensure_ascii=False)
-    sections_under_review_line = _format_sections_under_review(
-        context.selected_outline, len(context.brief.outline)
-    )
-    prompt = FEEDBACK_USER_PROMPT_TEMPLATE.format(
-        site_name=context.project["site_name"],
-        domain=context.project["domain"],
-        audience=context.project["audience"],
-        tone=context.project["tone"],
+    """Render the system and user prompts for the feedback agent.
+
+    With `context.compact_schema` the embedded schema example is replaced by a one-line summary.
+    Identical inputs (retries, repeated focus runs) return the previously rendered bundle, and every
+    bundle shares the `FEEDBACK_SYSTEM_PROMPT` object, so callers may cache prompt prefixes by identity.
+    """
+    project = context.project
+    brief = context.brief
+    return _render_feedback_prompt_bundle(
+        site_name=project["site_name"],
+        domain=project["domain"],
+        audience=project["audience"],
+        tone=project["tone"],
         language=context.language,
+        project_keywords=keywords_text(project),
+        brief_title=brief.title,
+        primary_keyword=brief.primary_keyword,
+        secondary_keywords=brief.secondary_keywords_text,
+        search_intent=brief.search_intent,
+        outline=brief.outline_text,
+        outline_total=len(brief.outline),
+        faq=brief.faq_text,
+        focus_categories=tuple(context.focus) if context.focus else _ALL_CATEGORIES,
+        selected_outline=tuple(context.selected_outline),
+        selected_sections=tuple(tuple(section.items()) for section in context.selected_sections),
+        note_excerpt=context.note_excerpt,
+        compact_schema=context.compact_schema,
+    )
+
+
+# Keyed on the rendered string inputs; str hashes are cached, so a hit costs one tuple build and lookup.
+@lru_cache(maxsize=32)
+def _render_feedback_prompt_bundle(
+    *,
+    site_name: str,
+    domain: str,
+    audience: str,
+    tone: str,
+    language: str,
+    project_keywords: str,
+    brief_title: str,
+    primary_keyword: str,
+    secondary_keywords: str,
+    search_intent: str,
+    outline: str,
+    outline_total: int,
+    faq: str,
+    focus_categories: tuple[str, ...],
+    selected_outline: tuple[str, ...],
+    selected_sections: tuple[tuple[tuple[str, str], ...], ...],
+    note_excerpt: str | None,
+    compact_schema: bool,
+) -> FeedbackPromptBundle:
+    focus_label = ", ".join(focus_categories)
+    schema_block = _compact_schema_summary if compact_schema else _schema_json
+    # Same bytes as json.dumps(indent=2, ensure_ascii=False), serialized in Rust; drafts can be large.
+    draft_sections_json = to_json([dict(section) for section in selected_sections], indent=2).decode("utf-8")
+    prompt = _render_feedback_user_prompt(
+        site_name=site_name,
+        domain=domain,
+        audience=audience,
+        tone=tone,
+        language=language,
         project_keywords=project_keywords,
-        brief_title=context.brief.title,
-        primary_keyword=context.brief.primary_keyword,
-        secondary_keywords=", ".join(context.brief.secondary_keywords),
-        search_intent=context.brief.search_intent,
-        outline=" | ".join(context.brief.outline),
-        faq=" | ".join(faq_entries),
+        brief_title=brief_title,
+        primary_keyword=primary_keyword,
+        secondary_keywords=secondary_keywords,
+        search_intent=search_intent,
+        outline=outline,
+        faq=faq,
         focus=focus_label or "all (seo, structure, clarity, style, evidence)",
         focus_categories=focus_label or "seo, structure, clarity, style, evidence",
-        sections_under_review_line=sections_under_review_line,
+        sections_under_review_line=_format_sections_under_review(selected_outline, outline_total),
         draft_sections_json=draft_sections_json,
-        note_excerpt=context.note_excerpt or "No source note provided.",
-        schema_json=schema_json,
+        note_excerpt=note_excerpt or "No source note provided.",
+        schema_json=schema_block(focus_categories),
         category_definitions=_format_category_definitions(focus_categories),
     )
     return FeedbackPromptBundle(system_prompt=FEEDBACK_SYSTEM_PROMPT, user_prompt=prompt)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-CATEGORY_DEFINITIONS: dict[str, str] = {
+from collections.abc import Mapping
+from types import MappingProxyType
+
+_CATEGORY_DEFINITIONS: dict[str, str] = {
     "seo": (
         "keyword usage and density throughout content; placement in headings and early paragraphs; "
         "primary/secondary keyword balance; search intent alignment; internal linking opportunities; "
@@ -28,3 +31,6 @@ CATEGORY_DEFINITIONS: dict[str, str] = {
         "source note; outdated information"
     ),
 }
+
+# Read-only view: prompts/feedback.py derives import-time caches (category lines, labels) from it.
+CATEGORY_DEFINITIONS: Mapping[str, str] = MappingProxyType(_CATEGORY_DEFINITIONS)
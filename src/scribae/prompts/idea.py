@@ -3,7 +3,9 @@ from __future__ import annotations
 import textwrap
 from dataclasses import dataclass
 
-from scribae.project import ProjectConfig
+from scribae.project import ProjectConfig, keywords_text
+
+from .templating import compile_template
 
 IDEA_SYSTEM_PROMPT = textwrap.dedent(
     """
@@ -16,7 +18,7 @@ IDEA_SYSTEM_PROMPT = textwrap.dedent(
 ).strip()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdeaPromptBundle:
     """Container for the system and user prompts."""
 
@@ -39,42 +41,44 @@ def build_idea_prompt_bundle(
     )
 
 
+IDEA_USER_PROMPT_TEMPLATE = textwrap.dedent(
+    """
+    [PROJECT CONTEXT]
+    Site: {site_name} ({domain})
+    Audience: {audience}
+    Tone: {tone}
+    FocusKeywords: {keywords}
+    AllowedTags: {allowed_tags}
+    Language: {language}
+    Output directive: respond entirely in language code '{language}'.
+
+    [TASK]
+    Propose 5–8 content ideas grounded in the note. Avoid generic listicles or duplicative angles.
+    Each idea must include:
+    - id: short slug (lowercase, hyphenated) that is stable and unique within this list.
+    - title: 5–12 words capturing the core hook.
+    - description: 2–3 sentences describing the article or asset.
+    - why: 1–2 sentences explaining why this idea fits the audience and project goals.
+    Respond with a JSON object containing an "ideas" array of idea objects, nothing else.
+
+    [NOTE TITLE]
+    {note_title}
+
+    [NOTE CONTENT]
+    {note_content}
+
+    JSON only. The root object must contain an "ideas" array with at least 5 entries.
+    """
+).strip()
+_render_idea_user_prompt = compile_template(IDEA_USER_PROMPT_TEMPLATE)
+
+
 def build_user_prompt(*, project: ProjectConfig, note_title: str, note_content: str, language: str) -> str:
     """Render the idea-generation user prompt."""
-    keywords = ", ".join(project["keywords"]) if project["keywords"] else "none"
+    keywords = keywords_text(project)
     allowed_tags = ", ".join(project["allowed_tags"] or []) if project["allowed_tags"] else "any"
 
-    template = textwrap.dedent(
-        """
-        [PROJECT CONTEXT]
-        Site: {site_name} ({domain})
-        Audience: {audience}
-        Tone: {tone}
-        FocusKeywords: {keywords}
-        AllowedTags: {allowed_tags}
-        Language: {language}
-        Output directive: respond entirely in language code '{language}'.
-
-        [TASK]
-        Propose 5–8 content ideas grounded in the note. Avoid generic listicles or duplicative angles.
-        Each idea must include:
-        - id: short slug (lowercase, hyphenated) that is stable and unique within this list.
-        - title: 5–12 words capturing the core hook.
-        - description: 2–3 sentences describing the article or asset.
-        - why: 1–2 sentences explaining why this idea fits the audience and project goals.
-        Respond with a JSON object containing an "ideas" array of idea objects, nothing else.
-
-        [NOTE TITLE]
-        {note_title}
-
-        [NOTE CONTENT]
-        {note_content}
-
-        JSON only. The root object must contain an "ideas" array with at least 5 entries.
-        """
-    ).strip()
-
-    return template.format(
+    return _render_idea_user_prompt(
         site_name=project["site_name"],
         domain=project["domain"],
         audience=project["audience"],
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any, Protocol
 from scribae.brief import SeoBrief
 from scribae.project import ProjectConfig
 
+from .templating import compile_template
+
 if TYPE_CHECKING:
     from scribae.meta import OverwriteMode
 
@@ -37,7 +39,7 @@ class MetaPromptContext(Protocol):
     def language(self) -> str: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetaPromptBundle:
     system_prompt: str
     user_prompt: str
@@ -96,6 +98,18 @@ META_USER_PROMPT_TEMPLATE = textwrap.dedent(
     Apply the overwrite rules and metadata rules defined in the system prompt.
     """
 ).strip()
+_render_meta_user_prompt = compile_template(META_USER_PROMPT_TEMPLATE)
+
+BRIEF_CONTEXT_TEMPLATE = textwrap.dedent(
+    """\
+    BriefTitle: {title}
+    PrimaryKeyword: {primary_keyword}
+    SecondaryKeywords: {secondary_keywords}
+    PlannedSearchIntent: {search_intent}
+    PlannedMetaDescription: {meta_description}
+    """
+)
+_render_brief_context = compile_template(BRIEF_CONTEXT_TEMPLATE)
 
 
 def build_meta_prompt_bundle(context: MetaPromptContext) -> MetaPromptBundle:
@@ -104,7 +118,7 @@ def build_meta_prompt_bundle(context: MetaPromptContext) -> MetaPromptBundle:
     current_meta_json = json.dumps(context.current_meta, indent=2, ensure_ascii=False)
     allowed_tags = context.project.get("allowed_tags") or "not specified"
     keywords = context.project.get("keywords") or []
-    prompt = META_USER_PROMPT_TEMPLATE.format(
+    prompt = _render_meta_user_prompt(
         site_name=context.project["site_name"],
         domain=context.project["domain"],
         audience=context.project["audience"],
@@ -124,14 +138,12 @@ def render_brief_context(brief: SeoBrief | None) -> str:
     """Return a formatted snippet describing the SeoBrief context."""
     if brief is None:
         return "No SeoBrief provided."
-    return textwrap.dedent(
-        f"""\
-        BriefTitle: {brief.title}
-        PrimaryKeyword: {brief.primary_keyword}
-        SecondaryKeywords: {", ".join(brief.secondary_keywords)}
-        PlannedSearchIntent: {brief.search_intent}
-        PlannedMetaDescription: {brief.meta_description}
-        """
+    return _render_brief_context(
+        title=brief.title,
+        primary_keyword=brief.primary_keyword,
+        secondary_keywords=brief.secondary_keywords_text,
+        search_intent=brief.search_intent,
+        meta_description=brief.meta_description,
     ).strip()
 
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import textwrap
+from functools import lru_cache
 from typing import Any
 
 from scribae.brief import SeoBrief
-from scribae.project import ProjectConfig
+from scribae.project import ProjectConfig, keywords_text
+
+from .templating import compile_template
 
 SYSTEM_PROMPT = textwrap.dedent(
     """\
@@ -19,6 +22,70 @@ SYSTEM_PROMPT = textwrap.dedent(
 ).strip()
 
 
+USER_PROMPT_TEMPLATE = textwrap.dedent(
+    """\
+    [PROJECT CONTEXT]
+    Site: {site_name} ({domain})
+    Audience: {audience}
+    Tone: {tone}
+    Language: {language}
+    Output directive: write this section in language code '{language}'.
+    FocusKeywords: {keywords}
+
+    [BRIEF CONTEXT]
+    H1: {h1}
+    Current Section: {section_title}
+    SearchIntent: {search_intent}
+    PrimaryKeyword: {primary_keyword}
+    SecondaryKeywords: {secondary_keywords}
+
+    [CURRENT DRAFT]
+    {draft_body}
+
+    [{source_label}]
+    {note_snippets}
+
+    [FEEDBACK]
+    {feedback_block}
+
+    [REFINEMENT CONTROLS]
+    Intensity: {intensity}
+    Feedback handling: {feedback_instruction}
+
+    [STYLE RULES]
+    {style_rules}
+
+    [OUTPUT]
+    Provide only the refined section body (no headings).
+    """
+).strip()
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
+
+CHANGELOG_PROMPT_TEMPLATE = textwrap.dedent(
+    """\
+    [TASK]
+    Summarize the refinements applied to the draft.
+
+    [BRIEF TITLE]
+    {brief_title}
+
+    [REFINED SECTIONS]
+    {refined_titles}
+
+    [FEEDBACK]
+    {feedback_block}
+
+    [INSTRUCTIONS]
+    - Write 3-7 bullet points.
+    - Be concise and concrete.
+    - Mention any feedback items addressed.
+    - Do not introduce new claims or content.
+    - {feedback_instruction}
+    """
+).strip()
+_render_changelog_prompt = compile_template(CHANGELOG_PROMPT_TEMPLATE)
+
+
 def build_user_prompt(
     *,
     project: ProjectConfig,
@@ -34,62 +101,13 @@ def build_user_prompt(
     source_label: str,
 ) -> str:
     """Render the structured user prompt for refining a section."""
-    keywords = ", ".join(project["keywords"]) if project["keywords"] else "none"
+    keywords = keywords_text(project)
     snippets_block = note_snippets.strip() or "(no relevant excerpts)"
     feedback_block = feedback.strip() if feedback else "(no feedback provided)"
-    evidence_rule = _format_evidence_rule(evidence_mode)
-    intensity_rules = _format_intensity_rules(intensity)
     feedback_instruction = "Prioritize feedback items." if apply_feedback and feedback else "Use feedback if helpful."
+    intensity_value = _coerce_enum(intensity)
 
-    style_rules = "\n".join(
-        [
-            "- Preserve Markdown structure where possible.",
-            "- Keep the original intent and key facts.",
-            "- Do not add new headings.",
-            "- Maintain the brief tone and audience.",
-            evidence_rule,
-        ]
-    )
-
-    template = textwrap.dedent(
-        """\
-        [PROJECT CONTEXT]
-        Site: {site_name} ({domain})
-        Audience: {audience}
-        Tone: {tone}
-        Language: {language}
-        Output directive: write this section in language code '{language}'.
-        FocusKeywords: {keywords}
-
-        [BRIEF CONTEXT]
-        H1: {h1}
-        Current Section: {section_title}
-        SearchIntent: {search_intent}
-        PrimaryKeyword: {primary_keyword}
-        SecondaryKeywords: {secondary_keywords}
-
-        [CURRENT DRAFT]
-        {draft_body}
-
-        [{source_label}]
-        {note_snippets}
-
-        [FEEDBACK]
-        {feedback_block}
-
-        [REFINEMENT CONTROLS]
-        Intensity: {intensity}
-        Feedback handling: {feedback_instruction}
-
-        [STYLE RULES]
-        {style_rules}
-
-        [OUTPUT]
-        Provide only the refined section body (no headings).
-        """
-    ).strip()
-
-    return template.format(
+    return _render_user_prompt(
         site_name=project["site_name"],
         domain=project["domain"],
         audience=project["audience"],
@@ -100,14 +118,14 @@ def build_user_prompt(
         section_title=section_title,
         search_intent=brief.search_intent,
         primary_keyword=brief.primary_keyword,
-        secondary_keywords=", ".join(brief.secondary_keywords) if brief.secondary_keywords else "none",
+        secondary_keywords=brief.secondary_keywords_text or "none",
         draft_body=draft_body.strip() or "(empty draft section)",
         source_label=source_label,
         note_snippets=snippets_block,
         feedback_block=feedback_block,
-        intensity=_coerce_enum(intensity),
+        intensity=intensity_value,
         feedback_instruction=feedback_instruction,
-        style_rules="\n".join([rule for rule in [*intensity_rules, *style_rules.splitlines()] if rule.strip()]),
+        style_rules=_style_rules(intensity_value, _coerce_enum(evidence_mode)),
     )
 
 
@@ -125,30 +143,7 @@ def build_changelog_prompt(
         "Prioritize feedback items." if apply_feedback and feedback else "Summarize key improvements."
     )
 
-    template = textwrap.dedent(
-        """\
-        [TASK]
-        Summarize the refinements applied to the draft.
-
-        [BRIEF TITLE]
-        {brief_title}
-
-        [REFINED SECTIONS]
-        {refined_titles}
-
-        [FEEDBACK]
-        {feedback_block}
-
-        [INSTRUCTIONS]
-        - Write 3-7 bullet points.
-        - Be concise and concrete.
-        - Mention any feedback items addressed.
-        - Do not introduce new claims or content.
-        - {feedback_instruction}
-        """
-    ).strip()
-
-    return template.format(
+    return _render_changelog_prompt(
         brief_title=brief.title,
         refined_titles=refined_block,
         feedback_block=feedback_block,
@@ -156,17 +151,30 @@ def build_changelog_prompt(
     )
 
 
-def _format_evidence_rule(mode: Any) -> str:
-    mode_value = _coerce_enum(mode)
+@lru_cache(maxsize=16)
+def _style_rules(intensity_value: str, evidence_value: str) -> str:
+    # Only a handful of intensity/evidence combinations exist; every section of a refine run reuses one.
+    return "\n".join(
+        [
+            *_format_intensity_rules(intensity_value),
+            "- Preserve Markdown structure where possible.",
+            "- Keep the original intent and key facts.",
+            "- Do not add new headings.",
+            "- Maintain the brief tone and audience.",
+            _format_evidence_rule(evidence_value),
+        ]
+    )
+
+
+def _format_evidence_rule(mode_value: str) -> str:
     if mode_value == "off":
         return "- Evidence citations are optional."
     if mode_value == "required":
-        return "- Evidence is required; if missing write exactly: \"(no supporting evidence in the note)\"."
+        return '- Evidence is required; if missing write exactly: "(no supporting evidence in the note)".'
     return "- Prefer citing supporting evidence where available."
 
 
-def _format_intensity_rules(intensity: Any) -> list[str]:
-    intensity_value = _coerce_enum(intensity)
+def _format_intensity_rules(intensity_value: str) -> list[str]:
     if intensity_value == "minimal":
         return [
             "- Make minimal edits: fix clarity, grammar, and obvious issues.",
@@ -183,6 +191,7 @@ def _format_intensity_rules(intensity: Any) -> list[str]:
     ]
 
 
+@lru_cache(maxsize=64)
 def _coerce_enum(value: Any) -> str:
     return str(getattr(value, "value", value)).strip().lower()
 
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from string import Formatter
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """Pre-parse a `str.format` template into a renderer equivalent to `template.format(**fields)`.
+
+    Only plain named fields (optionally with a format spec) are supported; `{{`/`}}` escapes are honoured.
+    """
+    parts: list[tuple[str, str | None, str]] = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        if name is not None and (not name.isidentifier() or conversion or "{" in (spec or "")):
+            raise ValueError(f"Unsupported template field: {{{name}}}")
+        parts.append((literal, name, spec or ""))
+
+    def render(**fields: object) -> str:
+        chunks: list[str] = []
+        for literal, name, spec in parts:
+            chunks.append(literal)
+            if name is not None:
+                value = fields[name]
+                # Prompt fields are almost always plain strings; format() only for specs and other types.
+                chunks.append(value if not spec and type(value) is str else format(value, spec))
+        return "".join(chunks)
+
+    return render
+
+
+__all__ = ["compile_template"]
@@ -3,7 +3,9 @@ from __future__ import annotations
 import textwrap
 
 from scribae.brief import SeoBrief
-from scribae.project import ProjectConfig
+from scribae.project import ProjectConfig, keywords_text
+
+from .templating import compile_template
 
 SYSTEM_PROMPT = textwrap.dedent(
     """\
@@ -18,6 +20,81 @@ SYSTEM_PROMPT = textwrap.dedent(
 ).strip()
 
 
+SECTION_PROMPT_TEMPLATE = textwrap.dedent(
+    """\
+    [PROJECT CONTEXT]
+    Site: {site_name} ({domain})
+    Audience: {audience}
+    Tone: {tone}
+    Language: {language}
+    Output directive: write this section in language code '{language}'.
+    FocusKeywords: {keywords}
+
+    [ARTICLE CONTEXT]
+    H1: {h1}
+    Current Section: {section_title}
+
+    [FAQ CONTEXT]
+    {faq_context}
+
+    [NOTE EXCERPTS]
+    {note_snippets}
+
+    [STYLE RULES]
+    {style_rules}
+    """
+).strip()
+_render_section_prompt = compile_template(SECTION_PROMPT_TEMPLATE)
+
+FAQ_PROMPT_TEMPLATE = textwrap.dedent(
+    """\
+    [PROJECT CONTEXT]
+    Site: {site_name} ({domain})
+    Audience: {audience}
+    Tone: {tone}
+    Language: {language}
+    Output directive: write this section in language code '{language}'.
+    FocusKeywords: {keywords}
+
+    [ARTICLE CONTEXT]
+    H1: {h1}
+    Current Section: FAQ
+
+    [FAQ TARGETS]
+    {faq_targets}
+
+    [NOTE EXCERPTS]
+    {note_snippets}
+
+    [STYLE RULES]
+    {style_rules}
+    """
+).strip()
+_render_faq_prompt = compile_template(FAQ_PROMPT_TEMPLATE)
+
+_SECTION_STYLE_RULES = "\n".join(
+    [
+        "- Start with 1 short lead sentence.",
+        "- 1–3 short paragraphs; use lists when helpful.",
+        "- Keep it specific; avoid filler.",
+        "- No frontmatter, no extra headings.",
+    ]
+)
+_EVIDENCE_STYLE_RULES = (
+    _SECTION_STYLE_RULES
+    + '\n- If evidence is required and missing: write a single line "(no supporting evidence in the note)".'
+)
+
+_FAQ_STYLE_RULES = "\n".join(
+    [
+        "- Render each question in bold (e.g., **Question?**).",
+        "- Follow each question with 1 short paragraph answer.",
+        "- Keep answers aligned to the FAQ targets; do not add new questions.",
+        "- No frontmatter, no extra headings; write FAQ entries only.",
+    ]
+)
+
+
 def build_user_prompt(
     *,
     project: ProjectConfig,
@@ -28,49 +105,13 @@ def build_user_prompt(
     language: str,
 ) -> str:
     """Render the structured user prompt for a single outline section."""
-    keywords = ", ".join(project["keywords"]) if project["keywords"] else "none"
+    keywords = keywords_text(project)
     snippets_block = note_snippets.strip() or "(no relevant note excerpts)"
-    faq_context = _format_faq_items(brief)
+    faq_context = brief.faq_qa_text
 
-    style_rules = [
-        "- Start with 1 short lead sentence.",
-        "- 1–3 short paragraphs; use lists when helpful.",
-        "- Keep it specific; avoid filler.",
-        "- No frontmatter, no extra headings.",
-    ]
-    if evidence_required:
-        style_rules.append(
-            "- If evidence is required and missing: write a single line " + '"(no supporting evidence in the note)".'
-        )
-
-    style_rules_text = "\n".join(style_rules)
-
-    template = textwrap.dedent(
-        """\
-        [PROJECT CONTEXT]
-        Site: {site_name} ({domain})
-        Audience: {audience}
-        Tone: {tone}
-        Language: {language}
-        Output directive: write this section in language code '{language}'.
-        FocusKeywords: {keywords}
-
-        [ARTICLE CONTEXT]
-        H1: {h1}
-        Current Section: {section_title}
-
-        [FAQ CONTEXT]
-        {faq_context}
-
-        [NOTE EXCERPTS]
-        {note_snippets}
-
-        [STYLE RULES]
-        {style_rules}
-        """
-    ).strip()
-
-    return template.format(
+    style_rules_text = _EVIDENCE_STYLE_RULES if evidence_required else _SECTION_STYLE_RULES
+
+    return _render_section_prompt(
         site_name=project["site_name"],
         domain=project["domain"],
         audience=project["audience"],
@@ -93,45 +134,11 @@ def build_faq_prompt(
     language: str,
 ) -> str:
     """Render the structured user prompt for the FAQ section."""
-    keywords = ", ".join(project["keywords"]) if project["keywords"] else "none"
+    keywords = keywords_text(project)
     snippets_block = note_snippets.strip() or "(no relevant note excerpts)"
-    faq_targets = _format_faq_items(brief)
-
-    style_rules = "\n".join(
-        [
-            "- Render each question in bold (e.g., **Question?**).",
-            "- Follow each question with 1 short paragraph answer.",
-            "- Keep answers aligned to the FAQ targets; do not add new questions.",
-            "- No frontmatter, no extra headings; write FAQ entries only.",
-        ]
-    )
+    faq_targets = brief.faq_qa_text
 
-    template = textwrap.dedent(
-        """\
-        [PROJECT CONTEXT]
-        Site: {site_name} ({domain})
-        Audience: {audience}
-        Tone: {tone}
-        Language: {language}
-        Output directive: write this section in language code '{language}'.
-        FocusKeywords: {keywords}
-
-        [ARTICLE CONTEXT]
-        H1: {h1}
-        Current Section: FAQ
-
-        [FAQ TARGETS]
-        {faq_targets}
-
-        [NOTE EXCERPTS]
-        {note_snippets}
-
-        [STYLE RULES]
-        {style_rules}
-        """
-    ).strip()
-
-    return template.format(
+    return _render_faq_prompt(
         site_name=project["site_name"],
         domain=project["domain"],
         audience=project["audience"],
@@ -141,18 +148,8 @@ def build_faq_prompt(
         h1=brief.h1,
         faq_targets=faq_targets,
         note_snippets=snippets_block,
-        style_rules=style_rules,
+        style_rules=_FAQ_STYLE_RULES,
     )
 
 
-def _format_faq_items(brief: SeoBrief) -> str:
-    entries: list[str] = []
-    for item in brief.faq:
-        question = item.question.strip()
-        answer = item.answer.strip()
-        if question and answer:
-            entries.append(f"- Q: {question}\n  A: {answer}")
-    return "\n".join(entries) if entries else "(no FAQ items provided)"
-
-
 __all__ = ["SYSTEM_PROMPT", "build_user_prompt", "build_faq_prompt"]
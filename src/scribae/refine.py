@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import re
@@ -10,8 +9,6 @@ from enum import Enum
 from pathlib import Path
 
 from pydantic import ValidationError
-from pydantic_ai import Agent
-from pydantic_ai.settings import ModelSettings
 
 from .brief import SeoBrief
 from .common import Reporter, report, slugify
@@ -22,13 +19,14 @@ from .language import (
     ensure_language_output,
     resolve_output_language,
 )
-from .llm import LLM_TIMEOUT_SECONDS, OpenAISettings, apply_optional_settings, make_model
+from .llm import LLM_TIMEOUT_SECONDS, OpenAISettings, apply_optional_settings, make_model, run_sync, with_timeout
 from .project import ProjectConfig
 from .prompts.refine import SYSTEM_PROMPT, build_changelog_prompt, build_user_prompt
 from .snippets import SnippetSelection, build_snippet_block
 
 logger = logging.getLogger(__name__)
 
+
 class RefiningError(Exception):
     """Base class for refine command failures."""
 
@@ -587,6 +585,9 @@ def _invoke_model(
     top_p: float | None = None,
     seed: int | None = None,
 ) -> str:
+    from pydantic_ai import Agent
+    from pydantic_ai.settings import ModelSettings
+
     model_settings = ModelSettings(temperature=temperature)
     apply_optional_settings(model_settings, top_p=top_p, seed=seed)
     model = make_model(model_name, model_settings=model_settings)
@@ -598,7 +599,7 @@ def _invoke_model(
         return str(output).strip()
 
     try:
-        return asyncio.run(asyncio.wait_for(_call(), LLM_TIMEOUT_SECONDS))
+        return run_sync(with_timeout(_call(), LLM_TIMEOUT_SECONDS))
     except TimeoutError as exc:
         raise RefiningLLMError(f"LLM request timed out after {int(LLM_TIMEOUT_SECONDS)} seconds.") from exc
     except KeyboardInterrupt:
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL_SECONDS = 30 * 60
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (`$XDG_CACHE_HOME/scribae`, else `~/.cache/scribae`)."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "scribae"
+
+
+def cache_key(
+    *,
+    model_name: str,
+    base_url: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    **settings: object,
+) -> str:
+    """Hash everything that determines a model response into a stable cache key.
+
+    The endpoint is part of the key: the same model name can be served by different backends.
+    """
+    payload = json.dumps(
+        [model_name, base_url, f"{temperature:.3f}", sorted(settings.items()), system_prompt, user_prompt],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ResponseCache:
+    """Exact-match cache of serialized LLM responses, one JSON file per prompt hash.
+
+    Cache problems never fail a command: unreadable entries count as misses and write errors are logged.
+    """
+
+    directory: Path
+    ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put(self, key: str, payload: str) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("Unable to write response cache entry %s: %s", path, exc)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+
+__all__ = ["DEFAULT_CACHE_TTL_SECONDS", "ResponseCache", "cache_key", "default_cache_dir"]
@@ -5,14 +5,20 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from pydantic_ai import Agent, NativeOutput, UnexpectedModelBehavior
-from pydantic_ai.settings import ModelSettings
-
-from scribae.llm import DEFAULT_MODEL_NAME, LLM_OUTPUT_RETRIES, OpenAISettings, apply_optional_settings, make_model
+from scribae.llm import (
+    DEFAULT_MODEL_NAME,
+    LLM_OUTPUT_RETRIES,
+    OpenAISettings,
+    apply_optional_settings,
+    make_model,
+    run_sync,
+)
 
 from .markdown_segmenter import ProtectedText
 
 if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
     from .pipeline import TranslationConfig
 
 
@@ -74,6 +80,8 @@ class LLMPostEditor:
             self._validate_output(enforced, protected.placeholders.keys(), cfg.glossary)
             return enforced
 
+        from pydantic_ai import UnexpectedModelBehavior
+
         trimmed_source, trimmed_mt = self._trim_inputs(source_text, mt_draft)
         prompt = self._build_prompt(trimmed_source, trimmed_mt, cfg, protected.placeholders.keys(), strict=strict)
         if self.max_chars is not None and len(prompt) > self.max_chars:
@@ -103,6 +111,8 @@ class LLMPostEditor:
         if agent is None:
             return prompt
 
+        from pydantic_ai import NativeOutput, UnexpectedModelBehavior
+
         output_validator = self._build_output_validator(placeholders, mt_draft, expected_lang)
 
         async def _call() -> str:
@@ -126,7 +136,7 @@ class LLMPostEditor:
                 raise UnexpectedModelBehavior("missing output from LLM")
             return str(output)
 
-        return asyncio.run(_call())
+        return run_sync(_call())
 
     def _build_output_validator(
         self,
@@ -134,6 +144,8 @@ class LLMPostEditor:
         mt_draft: str,
         expected_lang: str,
     ) -> Callable[[str], str]:
+        from pydantic_ai import UnexpectedModelBehavior
+
         placeholder_list = list(placeholders)
         mt_lines = mt_draft.splitlines()
 
@@ -201,6 +213,7 @@ class LLMPostEditor:
 
     def _create_language_detector(self) -> Callable[[str], str]:
         from lingua import LanguageDetectorBuilder
+        from pydantic_ai import UnexpectedModelBehavior
 
         detector = LanguageDetectorBuilder.from_all_languages().build()
 
@@ -379,6 +392,9 @@ class LLMPostEditor:
         top_p: float | None = None,
         seed: int | None = None,
     ) -> Agent[None, str] | None:
+        from pydantic_ai import Agent, NativeOutput
+        from pydantic_ai.settings import ModelSettings
+
         settings = OpenAISettings.from_env()
         model_settings = ModelSettings(temperature=temperature)
         apply_optional_settings(model_settings, top_p=top_p, seed=seed)
@@ -27,8 +27,6 @@ from scribae.translate import (
 )
 from scribae.translate.postedit import PostEditAborted
 
-translate_app = typer.Typer()
-
 _LIBRARY_LOGGERS = ("transformers", "huggingface_hub", "sentencepiece")
 _LANGUAGE_CODE_RE = re.compile(r"^[A-Za-z]{2,3}$|^[A-Za-z]{3}[-_][A-Za-z]{4}$")
 
@@ -81,8 +79,7 @@ def _validate_language_code(value: str, *, label: str) -> None:
         raise typer.BadParameter(f"{label} must be a language code like en or eng_Latn; received '{value}'.")
 
 
-@translate_app.command()
-def translate(
+def translate_command(
     src: str | None = typer.Option(  # noqa: B008
         None,
         "--src",
@@ -354,6 +351,4 @@ def translate(
         echo_info(f"Wrote debug report to {debug_path}")
 
 
-translate_command = translate
-
-__all__ = ["translate_command", "translate_app"]
+__all__ = ["translate_command"]
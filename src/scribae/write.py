@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import re
@@ -11,8 +10,6 @@ from pathlib import Path
 from typing import cast
 
 from pydantic import ValidationError
-from pydantic_ai import Agent
-from pydantic_ai.settings import ModelSettings
 
 from .brief import SeoBrief
 from .common import report, slugify
@@ -24,7 +21,7 @@ from .language import (
     normalize_language,
     resolve_output_language,
 )
-from .llm import LLM_TIMEOUT_SECONDS, apply_optional_settings, make_model
+from .llm import LLM_TIMEOUT_SECONDS, apply_optional_settings, make_model, run_sync, with_timeout
 from .project import ProjectConfig
 from .prompts.write import SYSTEM_PROMPT, build_faq_prompt, build_user_prompt
 from .snippets import SnippetSelection, build_snippet_block
@@ -339,6 +336,9 @@ def _invoke_model(
     seed: int | None = None,
 ) -> str:
     """Call the writer model and return Markdown text."""
+    from pydantic_ai import Agent
+    from pydantic_ai.settings import ModelSettings
+
     model_settings = ModelSettings(temperature=temperature)
     apply_optional_settings(model_settings, top_p=top_p, seed=seed)
     model = make_model(model_name, model_settings=model_settings)
@@ -351,7 +351,7 @@ def _invoke_model(
         return str(output).strip()
 
     try:
-        return asyncio.run(asyncio.wait_for(_call(), LLM_TIMEOUT_SECONDS))
+        return run_sync(with_timeout(_call(), LLM_TIMEOUT_SECONDS))
     except TimeoutError as exc:
         raise WritingLLMError(f"LLM request timed out after {int(LLM_TIMEOUT_SECONDS)} seconds.") from exc
     except KeyboardInterrupt:
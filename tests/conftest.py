@@ -1,16 +1,55 @@
+import json
+import os
 import re
-from collections.abc import Generator
+import subprocess
+import sys
+import textwrap
+import threading
+from collections.abc import Generator, Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from typing import Any
 
 import pytest
 from faker import Faker
 
+from scribae.llm import close_http_client
+
 
 def strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from text."""
     return re.sub(r"\x1b\[[0-9;]*m", "", text)
 
 
+_CLI_SCRIPT = """\
+import sys
+
+from typer.testing import CliRunner
+
+from scribae.main import app
+
+result = CliRunner().invoke(app, sys.argv[1:])
+assert result.exit_code == 0, result.output
+"""
+
+
+def imported_modules(code: str, *args: str, cwd: Path | None = None) -> set[str]:
+    """Run `code` in a fresh interpreter and return the names of every module it left imported."""
+    script = textwrap.dedent(code) + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))\n"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args], capture_output=True, text=True, check=False, cwd=cwd, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def cli_imported_modules(args: list[str], *, cwd: Path | None = None) -> set[str]:
+    """Invoke `scribae <args>` in a fresh interpreter and return the modules the command imported."""
+    return imported_modules(_CLI_SCRIPT, *args, cwd=cwd)
+
+
 @pytest.fixture(autouse=True)
 def stub_mt_pipeline(monkeypatch: pytest.MonkeyPatch) -> None:
     def _fake_pipeline(self: object, model_id: str) -> Any:  # noqa: ARG001
@@ -24,9 +63,70 @@ def stub_mt_pipeline(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("scribae.translate.mt.MTTranslator._pipeline_for", _fake_pipeline)
 
 
+@pytest.fixture(autouse=True)
+def isolated_response_cache(monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Keep CLI runs from reading or filling the developer's real response cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture()
 def fake() -> Generator[Faker]:
     faker = Faker()
     # Ensure deterministic data per test function
     faker.seed_instance(1337)
     yield faker
+
+
+@dataclass
+class FakeOpenAIServer:
+    """Local OpenAI-compatible endpoint answering every chat completion with `content`."""
+
+    requests: list[str] = field(default_factory=list)
+    content: str = ""
+
+
+@pytest.fixture()
+def openai_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeOpenAIServer]:
+    """Route the real request path (shared HTTP client and event loop) to a local keep-alive server."""
+    fake_server = FakeOpenAIServer()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep connections alive like real endpoints, so the client pools them
+
+        def do_POST(self) -> None:  # noqa: N802
+            fake_server.requests.append(self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8"))
+            payload = json.dumps(
+                {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "test-model",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": fake_server.content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_BASE", f"http://127.0.0.1:{server.server_port}/v1")
+    try:
+        yield fake_server
+    finally:
+        close_http_client()
+        server.shutdown()
+        server.server_close()
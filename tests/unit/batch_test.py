@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from scribae.batch import (
+    BatchEntry,
+    BatchError,
+    BatchManifest,
+    BatchPendingError,
+    BatchRequest,
+    build_batch_lines,
+    collect_batch,
+    parse_batch_output,
+    read_manifest,
+    submit_batch,
+    write_batch_input,
+    write_manifest,
+)
+from scribae.llm import OpenAISettings
+
+SETTINGS = OpenAISettings(base_url="http://example", api_key="secret")
+
+
+class _Answer(BaseModel):
+    text: str
+
+
+class FakeBatchClient:
+    """Minimal stand-in for the `files` and `batches` resources of the OpenAI client."""
+
+    def __init__(self, *, status: str = "completed", output: str = "", errors: str = "") -> None:
+        self.uploads: list[bytes] = []
+        self.created: list[dict[str, Any]] = []
+        self.status = status
+        self.contents = {"file-out": output, "file-err": errors}
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    def _create_file(self, *, file: Any, purpose: str) -> SimpleNamespace:
+        assert purpose == "batch"
+        self.uploads.append(file.read())
+        return SimpleNamespace(id="file-in")
+
+    def _create_batch(self, **kwargs: Any) -> SimpleNamespace:
+        self.created.append(kwargs)
+        return SimpleNamespace(id="batch_123")
+
+    def _retrieve_batch(self, batch_id: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=batch_id,
+            status=self.status,
+            output_file_id="file-out" if self.contents["file-out"] else None,
+            error_file_id="file-err" if self.contents["file-err"] else None,
+        )
+
+    def _file_content(self, file_id: str) -> SimpleNamespace:
+        return SimpleNamespace(text=self.contents[file_id])
+
+
+def _output_line(custom_id: str, content: str, *, status_code: int = 200) -> str:
+    body = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+    return json.dumps({"custom_id": custom_id, "response": {"status_code": status_code, "body": body}, "error": None})
+
+
+def test_build_batch_lines_requests_structured_output() -> None:
+    lines = build_batch_lines(
+        [BatchRequest(custom_id="01-a", system_prompt="sys", user_prompt="user")],
+        model_name="gpt-test",
+        temperature=0.2,
+        seed=7,
+        output_type=_Answer,
+        schema_name="Answer",
+    )
+
+    assert len(lines) == 1
+    line = lines[0]
+    assert line["custom_id"] == "01-a"
+    assert line["url"] == "/v1/chat/completions"
+    body = line["body"]
+    assert body["messages"] == [{"role": "system", "content": "sys"}, {"role": "user", "content": "user"}]
+    assert body["seed"] == 7
+    assert "top_p" not in body
+    assert body["response_format"]["json_schema"] == {"name": "Answer", "schema": _Answer.model_json_schema()}
+
+
+def test_parse_batch_output_separates_results_and_failures() -> None:
+    payload = "\n".join(
+        [
+            _output_line("ok", '{"text": "hi"}'),
+            _output_line("bad-status", "", status_code=500),
+            json.dumps({"custom_id": "failed", "response": None, "error": {"message": "rate limited"}}),
+            "",
+        ]
+    )
+
+    outcomes = parse_batch_output(payload)
+
+    assert outcomes["ok"].content == '{"text": "hi"}'
+    assert outcomes["bad-status"].content is None
+    assert outcomes["bad-status"].error == "HTTP 500"
+    assert outcomes["failed"].error == "rate limited"
+
+
+def test_parse_batch_output_records_malformed_lines_as_failures(caplog: pytest.LogCaptureFixture) -> None:
+    payload = "\n".join(
+        [
+            _output_line("ok", '{"text": "hi"}'),
+            '{"custom_id": "truncated", "response": {"status_code": 200, "bo',
+            "[1, 2]",
+            "not json at all",
+        ]
+    )
+
+    outcomes = parse_batch_output(payload)
+
+    assert outcomes["ok"].content == '{"text": "hi"}'
+    assert outcomes["truncated"].content is None
+    assert outcomes["truncated"].error is not None
+    assert outcomes["truncated"].error.startswith("Malformed batch output line")
+    assert set(outcomes) == {"ok", "truncated"}
+    assert "without a readable custom_id" in caplog.text
+
+
+def test_submit_batch_uploads_input_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    client = FakeBatchClient()
+    monkeypatch.setattr("scribae.batch._client", lambda settings: client)
+    input_path = tmp_path / "batch-input.jsonl"
+    write_batch_input(input_path, [{"custom_id": "a"}, {"custom_id": "b"}])
+
+    batch_id = submit_batch(input_path, settings=SETTINGS)
+
+    assert batch_id == "batch_123"
+    assert client.uploads[0].decode("utf-8").splitlines() == ['{"custom_id": "a"}', '{"custom_id": "b"}']
+    assert client.created[0]["input_file_id"] == "file-in"
+    assert client.created[0]["completion_window"] == "24h"
+
+
+def test_collect_batch_reports_pending_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("scribae.batch._client", lambda settings: FakeBatchClient(status="in_progress"))
+
+    with pytest.raises(BatchPendingError, match="still in_progress"):
+        collect_batch("batch_123", settings=SETTINGS)
+
+
+def test_collect_batch_merges_output_and_error_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = FakeBatchClient(
+        output=_output_line("a", '{"text": "hi"}'),
+        errors=json.dumps({"custom_id": "b", "response": None, "error": {"message": "expired"}}),
+    )
+    monkeypatch.setattr("scribae.batch._client", lambda settings: client)
+
+    outcomes = collect_batch("batch_123", settings=SETTINGS)
+
+    assert outcomes["a"].content == '{"text": "hi"}'
+    assert outcomes["b"].error == "expired"
+
+
+def test_manifest_round_trip_checks_batch_id(tmp_path: Path) -> None:
+    manifest = BatchManifest(
+        batch_id="batch_123",
+        command="feedback",
+        entries=[BatchEntry(custom_id="01-a", outputs=[str(tmp_path / "01-a.md")], focus=["seo"])],
+    )
+    write_manifest(tmp_path, manifest)
+
+    assert read_manifest(tmp_path, batch_id="batch_123", command="feedback") == manifest
+    with pytest.raises(BatchError, match="not feedback batch batch_999") as excinfo:
+        read_manifest(tmp_path, batch_id="batch_999", command="feedback")
+    assert excinfo.value.exit_code == 2
+
+
+def test_read_manifest_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(BatchError, match="not found") as excinfo:
+        read_manifest(tmp_path, batch_id="batch_123", command="brief")
+    assert excinfo.value.exit_code == 3
@@ -1,27 +1,38 @@
+import asyncio
 import json
 import os
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, cast
 
 import pytest
 from faker import Faker
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from pydantic_ai import UnexpectedModelBehavior
 
 from scribae.brief import (
     BriefingContext,
+    BriefLLMError,
     BriefValidationError,
     NoteDetails,
     OpenAISettings,
     SeoBrief,
+    _create_agent,
+    _run_agent,
+    close_agents,
     generate_brief,
+    generate_briefs_batch,
+    load_ideas,
     prepare_context,
+    render_json,
+    render_json_bytes,
 )
 from scribae.idea import Idea, IdeaList
 from scribae.llm import DEFAULT_API_KEY as DEFAULT_OPENAI_API_KEY
 from scribae.llm import DEFAULT_BASE_URL as DEFAULT_OPENAI_BASE_URL
 from scribae.project import default_project
 from scribae.prompts.brief import PromptBundle
+from tests.conftest import imported_modules
 
 
 def _base_payload(fake: Faker) -> dict[str, Any]:
@@ -90,6 +101,26 @@ def test_faq_answers_require_substance(fake: Faker) -> None:
     assert "faq" in str(excinfo.value)
 
 
+def test_prompt_joins_follow_field_changes_and_are_not_serialized(fake: Faker) -> None:
+    brief_obj = SeoBrief(**_base_payload(fake))
+
+    assert brief_obj.outline_text == " | ".join(brief_obj.outline)
+    assert brief_obj.secondary_keywords_text == ", ".join(brief_obj.secondary_keywords)
+    assert brief_obj.faq_text.startswith(f"{brief_obj.faq[0].question} — {brief_obj.faq[0].answer}")
+    assert brief_obj.faq_qa_text.splitlines()[:2] == [
+        f"- Q: {brief_obj.faq[0].question}",
+        f"  A: {brief_obj.faq[0].answer}",
+    ]
+    assert "outline_text" not in json.loads(brief_obj.model_dump_json())
+    assert brief_obj == SeoBrief(**brief_obj.model_dump())
+
+    copied = brief_obj.model_copy(update={"secondary_keywords": ["edited"]})
+    brief_obj.outline = [*brief_obj.outline[:-1], "Edited heading"]
+
+    assert copied.secondary_keywords_text == "edited"
+    assert brief_obj.outline_text.endswith(" | Edited heading")
+
+
 def _briefing_context(fake: Faker) -> BriefingContext:
     note = NoteDetails(
         path=Path("note.md"),
@@ -259,3 +290,176 @@ def test_prepare_context_selects_idea_by_index_string(tmp_path: Path, fake: Fake
 
     assert context.idea is not None
     assert context.idea.id == ideas.ideas[1].id
+
+
+def test_generate_briefs_batch_returns_results_in_input_order(monkeypatch: pytest.MonkeyPatch, fake: Faker) -> None:
+    contexts = [
+        BriefingContext(
+            note=_briefing_context(fake).note,
+            idea=None,
+            project=default_project(),
+            prompts=PromptBundle(system_prompt="system", user_prompt=f"prompt-{idx}"),
+            language="en",
+        )
+        for idx in range(3)
+    ]
+    briefs = {f"prompt-{idx}": SeoBrief(**_base_payload(fake)) for idx in range(3)}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_run_agent(_agent: object, prompt: str, *, timeout_seconds: float) -> SeoBrief:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return briefs[prompt]
+
+    monkeypatch.setattr("scribae.brief._run_agent", _fake_run_agent)
+
+    results = generate_briefs_batch(
+        contexts,
+        model_name="gpt-4o-mini",
+        temperature=0.2,
+        settings=OpenAISettings(base_url="http://example", api_key="secret"),
+        concurrency=2,
+        language_detector=lambda _: "en",
+    )
+
+    assert results == [briefs["prompt-0"], briefs["prompt-1"], briefs["prompt-2"]]
+    assert max_in_flight == 2
+
+
+def test_generate_briefs_batch_maps_timeouts_to_llm_error(monkeypatch: pytest.MonkeyPatch, fake: Faker) -> None:
+    async def _timeout(*_: object, **__: object) -> SeoBrief:
+        raise TimeoutError
+
+    monkeypatch.setattr("scribae.brief._run_agent", _timeout)
+
+    with pytest.raises(BriefLLMError, match="timed out"):
+        generate_briefs_batch(
+            [_briefing_context(fake)],
+            model_name="gpt-4o-mini",
+            temperature=0.2,
+            settings=OpenAISettings(base_url="http://example", api_key="secret"),
+            timeout_seconds=5,
+        )
+
+
+def test_generate_briefs_batch_keeps_finished_briefs_when_one_fails(
+    monkeypatch: pytest.MonkeyPatch, fake: Faker
+) -> None:
+    contexts = [
+        BriefingContext(
+            note=_briefing_context(fake).note,
+            idea=None,
+            project=default_project(),
+            prompts=PromptBundle(system_prompt="system", user_prompt=f"prompt-{idx}"),
+            language="en",
+        )
+        for idx in range(3)
+    ]
+    finished = SeoBrief(**_base_payload(fake))
+    completed: list[str] = []
+
+    async def _fake_run_agent(_agent: object, prompt: str, *, timeout_seconds: float) -> SeoBrief:
+        if prompt == "prompt-0":
+            raise TimeoutError
+        await asyncio.sleep(0.01)
+        completed.append(prompt)
+        return finished
+
+    monkeypatch.setattr("scribae.brief._run_agent", _fake_run_agent)
+    written: list[int] = []
+
+    with pytest.raises(BriefLLMError, match="1 of 3 briefs failed") as excinfo:
+        generate_briefs_batch(
+            contexts,
+            model_name="gpt-4o-mini",
+            temperature=0.2,
+            settings=OpenAISettings(base_url="http://example", api_key="secret"),
+            language_detector=lambda _: "en",
+            on_result=lambda index, _brief: written.append(index),
+        )
+
+    assert "timed out" in str(excinfo.value)
+    assert sorted(completed) == ["prompt-1", "prompt-2"]
+    assert sorted(written) == [1, 2]
+
+
+def test_create_agent_reuses_agent_for_identical_configuration() -> None:
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+
+    first = _create_agent("gpt-4o-mini", settings, temperature=0.2)
+    second = _create_agent("gpt-4o-mini", settings, temperature=0.2)
+    other = _create_agent("gpt-4o-mini", settings, temperature=0.7)
+
+    assert first is second
+    assert other is not first
+
+
+def test_render_json_matches_stdlib_formatting(fake: Faker) -> None:
+    payload = _base_payload(fake)
+    payload["angle"] = "Überblick für Einsteiger – “praxisnah”"
+    brief_obj = SeoBrief(**payload)
+
+    assert render_json(brief_obj) == json.dumps(brief_obj.model_dump(), indent=2, ensure_ascii=False)
+    assert render_json_bytes(brief_obj) == render_json(brief_obj).encode("utf-8")
+
+
+def test_close_agents_drops_cached_agents() -> None:
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+    first = _create_agent("gpt-4o-mini", settings, temperature=0.2)
+
+    close_agents()
+
+    assert _create_agent("gpt-4o-mini", settings, temperature=0.2) is not first
+    close_agents()
+
+
+def test_run_agent_converts_foreign_model_output(fake: Faker) -> None:
+    class _ForeignFaq(BaseModel):
+        question: str
+        answer: str
+
+    class _ForeignBrief(BaseModel):
+        primary_keyword: str
+        secondary_keywords: list[str]
+        search_intent: str
+        audience: str
+        angle: str
+        title: str
+        h1: str
+        outline: list[str]
+        faq: list[_ForeignFaq]
+        meta_description: str
+
+    payload = _base_payload(fake)
+
+    class _Agent:
+        async def run(self, _prompt: str) -> SimpleNamespace:
+            return SimpleNamespace(output=_ForeignBrief(**payload))
+
+    result = asyncio.run(_run_agent(cast(Any, _Agent()), "prompt", timeout_seconds=5))
+
+    assert result == SeoBrief(**payload)
+
+
+def test_importing_brief_does_not_load_pydantic_ai() -> None:
+    assert "pydantic_ai" not in imported_modules("import scribae.brief")
+
+
+def test_load_ideas_reports_invalid_json(tmp_path: Path) -> None:
+    ideas_path = tmp_path / "ideas.json"
+    ideas_path.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(BriefValidationError, match="not valid JSON"):
+        load_ideas(ideas_path)
+
+
+def test_load_ideas_reports_schema_mismatch(tmp_path: Path) -> None:
+    ideas_path = tmp_path / "ideas.json"
+    ideas_path.write_text(json.dumps({"ideas": "none"}), encoding="utf-8")
+
+    with pytest.raises(BriefValidationError, match="does not match schema"):
+        load_ideas(ideas_path)
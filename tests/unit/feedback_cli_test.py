@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any, cast
@@ -10,13 +11,26 @@ from typer.testing import CliRunner
 from scribae.feedback import (
     BriefAlignment,
     FeedbackFinding,
+    FeedbackFocus,
+    FeedbackFormat,
+    FeedbackLLMError,
     FeedbackLocation,
     FeedbackReport,
     FeedbackSummary,
+    FeedbackValidationError,
     SectionNote,
+    generate_feedback_report_async,
+    generate_feedback_reports_async,
+    generate_feedback_reports_batch,
+    prepare_context,
+    render_json,
+    render_json_bytes,
+    render_markdown,
     strip_emojis,
 )
 from scribae.main import app
+from scribae.project import default_project
+from tests.conftest import strip_ansi
 
 runner = CliRunner()
 
@@ -134,6 +148,41 @@ def test_feedback_json_output(
     assert "findings" in payload
 
 
+def test_feedback_json_to_stdout(
+    monkeypatch: pytest.MonkeyPatch,
+    body_path: Path,
+    brief_path: Path,
+) -> None:
+    stub = StubLLM()
+    monkeypatch.setattr("scribae.feedback._invoke_agent", stub)
+
+    result = runner.invoke(
+        app,
+        ["feedback", "--body", str(body_path), "--brief", str(brief_path), "--format", "json"],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout == render_json(stub.report)
+
+
+def test_feedback_multiple_focuses_share_one_request(
+    monkeypatch: pytest.MonkeyPatch,
+    body_path: Path,
+    brief_path: Path,
+) -> None:
+    stub = StubLLM()
+    monkeypatch.setattr("scribae.feedback._invoke_agent", stub)
+
+    result = runner.invoke(
+        app,
+        ["feedback", "--body", str(body_path), "--brief", str(brief_path), "--focus", "seo,style", "--format", "json"],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert len(stub.prompts) == 1
+    assert "Allowed categories: seo, style, other" in stub.prompts[0]
+
+
 def test_feedback_dry_run_prints_prompt(body_path: Path, brief_path: Path) -> None:
     result = runner.invoke(
         app,
@@ -153,6 +202,19 @@ def test_feedback_dry_run_prints_prompt(body_path: Path, brief_path: Path) -> No
     assert "[REQUIRED JSON SCHEMA]" in result.stdout
 
 
+def test_feedback_compact_schema_replaces_schema_example(body_path: Path, brief_path: Path) -> None:
+    args = ["feedback", "--body", str(body_path), "--brief", str(brief_path), "--focus", "seo", "--dry-run"]
+    full = runner.invoke(app, args)
+    compact = runner.invoke(app, [*args, "--compact-schema"])
+
+    assert full.exit_code == 0
+    assert compact.exit_code == 0
+    assert '"brief_alignment": {' in full.stdout
+    assert '"brief_alignment": {' not in compact.stdout
+    assert "findings[].category: seo|other" in compact.stdout
+    assert len(compact.stdout) < len(full.stdout)
+
+
 def test_feedback_section_range_shows_sections_under_review(
     body_multi_section_path: Path,
     brief_path: Path,
@@ -331,6 +393,26 @@ class TestStripEmojis:
     def test_strips_skin_tone_emojis(self) -> None:
         assert strip_emojis("Thumbs up 👍🏻👍🏿") == "Thumbs up"
 
+    def test_strips_joined_sequences(self) -> None:
+        assert strip_emojis("Team👨\u200d👩\u200d👧work") == "Team work"
+        assert (
+            strip_emojis("Scotland 🏴\U000e0067\U000e0062\U000e0073\U000e0063\U000e0074\U000e007f rules")
+            == "Scotland rules"
+        )
+        assert strip_emojis("Step 1️⃣ first") == "Step first"
+
+    def test_preserves_non_emoji_unicode(self) -> None:
+        assert strip_emojis("Größe – café … naïve") == "Größe – café … naïve"
+
+    def test_preserves_zero_width_joiner_outside_emoji(self) -> None:
+        # Devanagari half-form and Malayalam chillu both rely on ZWJ.
+        assert strip_emojis("क्\u200dष") == "क्\u200dष"
+        assert strip_emojis("ന്\u200d") == "ന്\u200d"
+
+    def test_matches_tokenizer_on_lone_regional_indicators_and_text_presentation(self) -> None:
+        assert strip_emojis("Region 🇺 only") == "Region 🇺 only"
+        assert strip_emojis("Heart ❤\ufe0e text") == "Heart text"
+
 
 class TestFeedbackReportStripsEmojis:
     def test_checklist_emojis_stripped(self) -> None:
@@ -455,3 +537,512 @@ class TestNormalizeFindingCategories:
         result = _normalize_finding_categories(report, focus=["seo"])
         assert result.findings[0].severity == "medium"
         assert result.findings[0].message == "Issue in structure"
+
+
+def test_generate_feedback_report_async_awaits_agent_in_running_loop(
+    monkeypatch: pytest.MonkeyPatch,
+    body_path: Path,
+    brief_path: Path,
+) -> None:
+    stub = StubLLM()
+
+    async def _fake_run_agent(agent: object, prompt: str, *, timeout_seconds: float) -> FeedbackReport:
+        return stub(agent, prompt, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr("scribae.feedback._run_agent", _fake_run_agent)
+    context = prepare_context(
+        body_path=body_path,
+        brief_path=brief_path,
+        project=default_project(),
+        language="en",
+        focus=["seo"],
+    )
+
+    result = asyncio.run(
+        generate_feedback_report_async(
+            context,
+            model_name="test-model",
+            temperature=0.2,
+            agent=cast(Any, object()),
+            language_detector=lambda _: "en",
+        )
+    )
+
+    assert stub.prompts
+    assert [finding.category for finding in result.findings] == ["other"]
+
+
+def test_generate_feedback_reports_batch_bounds_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+    body_path: Path,
+    brief_path: Path,
+) -> None:
+    stub = StubLLM()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_run_agent(agent: object, prompt: str, *, timeout_seconds: float) -> FeedbackReport:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return stub(agent, prompt, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr("scribae.feedback._run_agent", _fake_run_agent)
+    context = prepare_context(body_path=body_path, brief_path=brief_path, project=default_project(), language="en")
+
+    results = generate_feedback_reports_batch(
+        [context] * 3,
+        model_name="test-model",
+        temperature=0.2,
+        agent=cast(Any, object()),
+        concurrency=2,
+        language_detector=lambda _: "en",
+    )
+
+    assert len(results) == 3
+    assert len(stub.prompts) == 3
+    assert max_in_flight == 2
+
+
+def test_generate_feedback_reports_async_keeps_finished_reports_and_maps_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    body_path: Path,
+    brief_path: Path,
+) -> None:
+    stub = StubLLM()
+    calls = 0
+
+    async def _fake_run_agent(agent: object, prompt: str, *, timeout_seconds: float) -> FeedbackReport:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise TimeoutError
+        return stub(agent, prompt, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr("scribae.feedback._run_agent", _fake_run_agent)
+    context = prepare_context(body_path=body_path, brief_path=brief_path, project=default_project(), language="en")
+    finished: list[int] = []
+
+    with pytest.raises(FeedbackLLMError, match="1 of 3 drafts failed") as excinfo:
+        asyncio.run(
+            generate_feedback_reports_async(
+                [context] * 3,
+                model_name="test-model",
+                temperature=0.2,
+                agent=cast(Any, object()),
+                concurrency=1,
+                timeout_seconds=5,
+                language_detector=lambda _: "en",
+                on_result=lambda index, _report: finished.append(index),
+            )
+        )
+
+    assert "timed out after 5 seconds" in str(excinfo.value)
+    assert finished == [1, 2]
+
+
+def test_feedback_batch_writes_report_per_draft(
+    monkeypatch: pytest.MonkeyPatch,
+    fixtures_dir: Path,
+    brief_path: Path,
+    tmp_path: Path,
+) -> None:
+    stub = StubLLM()
+
+    async def _fake_run_agent(agent: object, prompt: str, *, timeout_seconds: float) -> FeedbackReport:
+        return stub(agent, prompt, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr("scribae.feedback._run_agent", _fake_run_agent)
+    drafts_dir = tmp_path / "drafts"
+    drafts_dir.mkdir()
+    for name in ("b-second.md", "a-first.md"):
+        (drafts_dir / name).write_text((fixtures_dir / "body_without_frontmatter.md").read_text(encoding="utf-8"))
+    out_dir = tmp_path / "feedback"
+
+    result = runner.invoke(
+        app,
+        [
+            "feedback",
+            "--batch",
+            str(drafts_dir),
+            "--brief",
+            str(brief_path),
+            "--language",
+            "en",
+            "--format",
+            "both",
+            "--out-dir",
+            str(out_dir),
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert sorted(path.name for path in out_dir.iterdir()) == [
+        "01-a-first.json",
+        "01-a-first.md",
+        "02-b-second.json",
+        "02-b-second.md",
+    ]
+    assert len(stub.prompts) == 2
+
+
+def test_feedback_batch_requires_out_dir(brief_path: Path, tmp_path: Path) -> None:
+    result = runner.invoke(app, ["feedback", "--batch", str(tmp_path), "--brief", str(brief_path)])
+
+    assert result.exit_code != 0
+    assert "--out-dir" in result.output
+
+
+def test_feedback_batch_submit_and_collect(
+    monkeypatch: pytest.MonkeyPatch,
+    fixtures_dir: Path,
+    brief_path: Path,
+    tmp_path: Path,
+) -> None:
+    from types import SimpleNamespace
+
+    uploaded: list[str] = []
+    report_json = render_json(StubLLM().report)
+
+    def _create_file(*, file: Any, purpose: str) -> SimpleNamespace:
+        uploaded.append(file.read().decode("utf-8"))
+        return SimpleNamespace(id="file-in")
+
+    def _file_content(file_id: str) -> SimpleNamespace:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": json.loads(line)["custom_id"],
+                    "response": {"status_code": 200, "body": {"choices": [{"message": {"content": report_json}}]}},
+                }
+            )
+            for line in uploaded[0].splitlines()
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(create=_create_file, content=_file_content),
+        batches=SimpleNamespace(
+            create=lambda **_: SimpleNamespace(id="batch_abc"),
+            retrieve=lambda batch_id: SimpleNamespace(
+                status="completed", output_file_id="file-out", error_file_id=None
+            ),
+        ),
+    )
+    monkeypatch.setattr("scribae.batch._client", lambda settings: client)
+    drafts_dir = tmp_path / "drafts"
+    drafts_dir.mkdir()
+    (drafts_dir / "post.md").write_text((fixtures_dir / "body_without_frontmatter.md").read_text(encoding="utf-8"))
+    out_dir = tmp_path / "feedback"
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    submitted = runner.invoke(
+        app,
+        [
+            "feedback",
+            "--batch",
+            str(drafts_dir),
+            "--brief",
+            str(brief_path),
+            "--language",
+            "en",
+            "--out-dir",
+            "feedback",
+            "--batch-submit",
+        ],
+    )
+
+    assert submitted.exit_code == 0, submitted.stderr
+    assert submitted.stdout.strip() == "batch_abc"
+    assert json.loads(uploaded[0])["custom_id"] == "01-post"
+    assert not (out_dir / "01-post.md").exists()
+
+    # Collecting from another working directory still writes next to the manifest.
+    monkeypatch.chdir(elsewhere)
+    collected = runner.invoke(app, ["feedback", "--batch-collect", "batch_abc", "--out-dir", str(out_dir)])
+
+    assert collected.exit_code == 0, collected.stderr
+    assert (out_dir / "01-post.md").read_text(encoding="utf-8") == render_markdown(StubLLM().report)
+
+
+def test_batch_collect_keeps_going_after_write_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from scribae.batch import BatchEntry, BatchManifest, BatchOutcome, write_manifest
+
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory", encoding="utf-8")
+    good_path = tmp_path / "02-good.md"
+    write_manifest(
+        tmp_path,
+        BatchManifest(
+            batch_id="batch_abc",
+            command="feedback",
+            entries=[
+                BatchEntry(custom_id="01-bad", outputs=[str(blocked / "01-bad.md")]),
+                BatchEntry(custom_id="02-good", outputs=[str(good_path)]),
+            ],
+        ),
+    )
+    content = render_json(StubLLM().report)
+    monkeypatch.setattr(
+        "scribae.feedback_cli.collect_batch",
+        lambda batch_id: {"01-bad": BatchOutcome(content=content), "02-good": BatchOutcome(content=content)},
+    )
+
+    result = runner.invoke(app, ["feedback", "--batch-collect", "batch_abc", "--out-dir", str(tmp_path)])
+
+    assert result.exit_code != 0
+    assert "01-bad: Unable to write feedback report" in result.stderr
+    assert good_path.read_text(encoding="utf-8") == render_markdown(StubLLM().report)
+
+
+def test_batch_collect_rejects_format(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        ["feedback", "--batch-collect", "batch_abc", "--out-dir", str(tmp_path), "--format", "json"],
+    )
+
+    assert result.exit_code == 2
+    assert "--format cannot be combined" in strip_ansi(result.output)
+
+
+def test_create_agent_reuses_agent_for_identical_configuration() -> None:
+    from scribae.feedback import _create_agent, close_agents
+    from scribae.llm import OpenAISettings
+
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+
+    first = _create_agent("gpt-4o-mini", settings, temperature=0.2, seed=7)
+    second = _create_agent("gpt-4o-mini", settings, temperature=0.2, seed=7)
+    other = _create_agent("gpt-4o-mini", settings, temperature=0.2, seed=8)
+
+    assert first is second
+    assert other is not first
+
+    close_agents()
+
+    assert _create_agent("gpt-4o-mini", settings, temperature=0.2, seed=7) is not first
+    close_agents()
+
+
+def test_cached_agents_are_dropped_when_shared_client_closes() -> None:
+    from scribae import brief
+    from scribae.feedback import _create_agent, close_agents
+    from scribae.llm import OpenAISettings, shared_http_client
+
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+    first = _create_agent("gpt-4o-mini", settings, temperature=0.2)
+
+    brief.close_agents()
+    second = _create_agent("gpt-4o-mini", settings, temperature=0.2)
+
+    assert second is not first
+    assert not shared_http_client().is_closed
+    close_agents()
+
+
+def test_list_fields_coerce_and_drop_blank_items() -> None:
+    summary = FeedbackSummary.model_validate({"issues": "Single issue 📚", "strengths": [" Tight ", 42, "🚀", ""]})
+    note = SectionNote.model_validate({"heading": "Intro", "notes": ["  keep  ", "   ", 3]})
+
+    assert summary.issues == ["Single issue"]
+    assert summary.strengths == ["Tight", "42"]
+    assert note.notes == ["keep", "3"]
+    with pytest.raises(TypeError, match="must be a list"):
+        FeedbackSummary.model_validate({"issues": {"a": 1}, "strengths": []})
+
+
+def test_render_json_matches_stdlib_formatting() -> None:
+    report = StubLLM().report.model_copy(update={"checklist": ["Überprüfe die Quellen – “bitte”"]})
+
+    assert render_json(report) == json.dumps(report.model_dump(), indent=2, ensure_ascii=False)
+    assert render_json_bytes(report) == render_json(report).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "model", [FeedbackReport, FeedbackSummary, BriefAlignment, SectionNote, FeedbackFinding, FeedbackLocation]
+)
+def test_report_models_are_built_at_import(model: type[Any]) -> None:
+    from pydantic_core import SchemaSerializer, SchemaValidator
+
+    assert model.__pydantic_complete__
+    assert isinstance(model.__pydantic_validator__, SchemaValidator)
+    assert isinstance(model.__pydantic_serializer__, SchemaSerializer)
+
+
+def test_focus_parse_list_dedupes_in_order() -> None:
+    assert FeedbackFocus.parse_list("Style, seo,style , SEO,evidence") == ["style", "seo", "evidence"]
+
+
+def test_format_from_raw_normalizes_case() -> None:
+    assert FeedbackFormat.from_raw(" JSON ") == FeedbackFormat.JSON
+    with pytest.raises(FeedbackValidationError, match="--format"):
+        FeedbackFormat.from_raw("yaml")
+
+
+def test_render_markdown_fills_empty_sections() -> None:
+    report = FeedbackReport(
+        summary=FeedbackSummary(issues=[], strengths=[]),
+        brief_alignment=BriefAlignment(
+            intent="Informational",
+            outline_covered=[],
+            outline_missing=[],
+            keywords_covered=[],
+            keywords_missing=[],
+            faq_covered=[],
+            faq_missing=[],
+        ),
+        section_notes=[],
+        evidence_gaps=[],
+        findings=[],
+        checklist=[],
+    )
+
+    rendered = render_markdown(report)
+
+    assert rendered.count("- None noted.\n") == 6
+    assert rendered.count(": None noted\n") == 6
+    assert rendered.endswith("## Checklist\n\n- None noted.\n")
+
+
+def test_feedback_markdown_file_matches_rendered_report(
+    monkeypatch: pytest.MonkeyPatch,
+    body_path: Path,
+    brief_path: Path,
+    tmp_path: Path,
+) -> None:
+    stub = StubLLM()
+    monkeypatch.setattr("scribae.feedback._invoke_agent", stub)
+    output_path = tmp_path / "feedback.md"
+
+    result = runner.invoke(
+        app,
+        ["feedback", "--body", str(body_path), "--brief", str(brief_path), "--out", str(output_path)],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    written = output_path.read_text(encoding="utf-8")
+    assert written == render_markdown(stub.report)
+    assert written.endswith("\n") and not written.endswith("\n\n")
+
+
+@pytest.mark.parametrize(
+    ("location", "expected"),
+    [
+        (FeedbackLocation(heading="Intro", paragraph_index=2), " (heading: Intro; paragraph: 2)"),
+        (FeedbackLocation(heading="Intro"), " (heading: Intro)"),
+        (FeedbackLocation(paragraph_index=0), " (paragraph: 0)"),
+        (FeedbackLocation(), ""),
+        (None, ""),
+    ],
+)
+def test_format_location(location: FeedbackLocation | None, expected: str) -> None:
+    from scribae.feedback import _format_location
+
+    assert _format_location(location) == expected
+
+
+def test_feedback_language_text_covers_all_prose_fields() -> None:
+    from scribae.feedback import _feedback_language_text
+
+    text = _feedback_language_text(StubLLM().report)
+
+    for fragment in ("Missing citations", "Clear introduction", "Claim needs a citation.", "Add a concrete example."):
+        assert fragment in text
+    assert text.endswith("Add a concrete example.")
+
+
+def test_load_brief_reports_invalid_json_and_schema_errors(tmp_path: Path) -> None:
+    from scribae.feedback import FeedbackBriefError, _load_brief
+
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    incomplete = tmp_path / "incomplete.json"
+    incomplete.write_text('{"title": "Only a title"}', encoding="utf-8")
+
+    with pytest.raises(FeedbackBriefError, match="not valid JSON"):
+        _load_brief(broken)
+    with pytest.raises(FeedbackBriefError, match="failed validation"):
+        _load_brief(incomplete)
+
+
+def test_prepare_contexts_parses_shared_brief_once(
+    monkeypatch: pytest.MonkeyPatch, body_path: Path, body_multi_section_path: Path, brief_path: Path
+) -> None:
+    import scribae.feedback as feedback
+
+    calls: list[Path] = []
+    original = feedback._load_brief
+
+    def _counting_load_brief(path: Path) -> Any:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(feedback, "_load_brief", _counting_load_brief)
+
+    contexts = feedback.prepare_contexts(
+        [body_path, body_multi_section_path],
+        brief_path=brief_path,
+        project=default_project(),
+        language="en",
+    )
+
+    assert calls == [brief_path]
+    assert [context.body.path for context in contexts] == [body_path, body_multi_section_path]
+    assert contexts[0].brief is contexts[1].brief
+
+
+def test_feedback_prompts_for_one_brief_share_static_prefix(
+    body_path: Path, body_multi_section_path: Path, brief_path: Path
+) -> None:
+    from scribae.feedback import build_prompt_bundle, prepare_contexts
+
+    contexts = prepare_contexts(
+        [body_path, body_multi_section_path],
+        brief_path=brief_path,
+        project=default_project(),
+        language="en",
+        focus=["seo"],
+    )
+    first, second = (build_prompt_bundle(context).user_prompt for context in contexts)
+
+    assert first.startswith("[REQUIRED JSON SCHEMA]")
+    assert '"category": "seo|other"' in first
+    shared = first[: first.index("[DRAFT SECTIONS]")]
+    assert second.startswith(shared)
+    assert first != second
+
+
+def test_draft_sections_json_matches_stdlib_encoding(tmp_path: Path, brief_path: Path) -> None:
+    from scribae.feedback import build_prompt_bundle
+
+    body = tmp_path / "draft.md"
+    body.write_text(
+        '## Größen & "Zitate"\n\nÜber café\tnaïve — 😀 text with \\ backslash.\n\n## Zweiter\n\nMehr.\n',
+        encoding="utf-8",
+    )
+    context = prepare_context(body_path=body, brief_path=brief_path, project=default_project(), language="de")
+    sections = [{"heading": section.heading, "content": section.content} for section in context.selected_sections]
+
+    prompt = build_prompt_bundle(context).user_prompt
+
+    assert json.dumps(sections, indent=2, ensure_ascii=False) in prompt
+
+
+def test_feedback_prompt_bundle_is_reused_for_identical_inputs(body_path: Path, brief_path: Path) -> None:
+    from dataclasses import replace
+
+    from scribae.feedback import build_prompt_bundle
+    from scribae.prompts.feedback import FEEDBACK_SYSTEM_PROMPT
+
+    context = prepare_context(body_path=body_path, brief_path=brief_path, project=default_project(), language="en")
+
+    first = build_prompt_bundle(context)
+
+    assert build_prompt_bundle(context) is first
+    other = build_prompt_bundle(replace(context, focus=["seo"]))
+    assert other is not first
+    assert other.system_prompt is first.system_prompt is FEEDBACK_SYSTEM_PROMPT
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import pytest
 import yaml
 from typer.testing import CliRunner
 
@@ -102,3 +103,40 @@ def test_init_rejects_project_and_file_options() -> None:
     stderr = strip_ansi(result.stderr)
     assert "--project" in stderr
     assert "--file" in stderr
+
+
+def test_render_yaml_round_trips_unicode_and_special_values() -> None:
+    from scribae.init_cli import _render_yaml
+    from scribae.project import default_project
+
+    config = default_project()
+    config["site_name"] = "Café ☕ Notes"
+    config["audience"] = "devs: ops, sre"
+    config["tone"] = "plain " * 40
+    config["keywords"] = ["yes", "123", "- dash", "ünïcode"]
+    config["allowed_tags"] = None
+
+    rendered = _render_yaml(config)
+
+    assert "Café ☕ Notes" in rendered
+    payload = yaml.safe_load(rendered)
+    assert payload["site_name"] == "Café ☕ Notes"
+    assert payload["audience"] == "devs: ops, sre"
+    assert payload["tone"] == "plain " * 40
+    assert payload["keywords"] == ["yes", "123", "- dash", "ünïcode"]
+    assert "allowed_tags" not in payload
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("seo, content strategy", ["seo", "content strategy"]),
+        (" a ,, b ,\t", ["a", "b"]),
+        ("", []),
+        (" , ", []),
+    ],
+)
+def test_split_list_strips_and_drops_empty_items(raw: str, expected: list[str]) -> None:
+    from scribae.init_cli import _split_list
+
+    assert _split_list(raw) == expected
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from scribae.io_utils import Reporter, load_note, truncate
+from scribae.io_utils import Reporter, _split_frontmatter, load_note, load_notes, truncate
 
 
 class TestTruncate:
@@ -83,30 +83,168 @@ class TestReporter:
         assert r2 is None
 
 
+class TestSplitFrontmatter:
+    def test_splits_metadata_from_body(self) -> None:
+        metadata, body = _split_frontmatter("---\ntitle: Hello\ntags:\n  - a\n---\n\nBody text.\n")
+
+        assert metadata == {"title": "Hello", "tags": ["a"]}
+        assert body == "Body text."
+
+    def test_text_without_frontmatter_is_returned_as_body(self) -> None:
+        assert _split_frontmatter("Just a note.\n---\nmore") == ({}, "Just a note.\n---\nmore")
+
+    def test_unterminated_frontmatter_is_treated_as_body(self) -> None:
+        assert _split_frontmatter("---\ntitle: Hello\nBody") == ({}, "---\ntitle: Hello\nBody")
+
+    def test_non_mapping_frontmatter_is_ignored(self) -> None:
+        assert _split_frontmatter("---\n- a\n- b\n---\nBody") == ({}, "Body")
+
+    def test_splits_json_frontmatter(self) -> None:
+        metadata, body = _split_frontmatter('{\n"title": "Hello",\n"tags": ["a"]\n}\n\nBody text.\n')
+
+        assert metadata == {"title": "Hello", "tags": ["a"]}
+        assert body == "Body text."
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "---\ntitle: Hello\n---\nBody",
+            '{\n"title": "Hello"\n}\nBody',
+            '{\n"title": "Hello"\nBody',
+            '{"title": "Hello"}\nBody',
+            "{\n}\nBody",
+            "Body\n{\n}",
+        ],
+    )
+    def test_matches_python_frontmatter(self, text: str) -> None:
+        import frontmatter
+
+        assert _split_frontmatter(text) == frontmatter.parse(text)
+
+
 class TestLoadNoteErrors:
-    def test_load_note_wraps_value_error_as_parse_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _boom(_path: Path) -> None:
+    def test_load_note_wraps_value_error_as_parse_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        note = tmp_path / "note.md"
+        note.write_text("Body", encoding="utf-8")
+
+        def _boom(_text: str) -> None:
             raise ValueError("invalid frontmatter")
 
-        monkeypatch.setattr("scribae.io_utils.frontmatter.load", _boom)
+        monkeypatch.setattr("scribae.io_utils._split_frontmatter", _boom)
 
         with pytest.raises(ValueError, match="Unable to parse note"):
-            load_note(Path("note.md"), max_chars=100)
+            load_note(note, max_chars=100)
+
+    def test_load_note_wraps_yaml_error_as_parse_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        note = tmp_path / "note.md"
+        note.write_text("Body", encoding="utf-8")
 
-    def test_load_note_wraps_yaml_error_as_parse_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _boom(_path: Path) -> None:
+        def _boom(_text: str) -> None:
             raise yaml.YAMLError("bad yaml")
 
-        monkeypatch.setattr("scribae.io_utils.frontmatter.load", _boom)
+        monkeypatch.setattr("scribae.io_utils._split_frontmatter", _boom)
 
         with pytest.raises(ValueError, match="Unable to parse note"):
-            load_note(Path("note.md"), max_chars=100)
+            load_note(note, max_chars=100)
+
+    def test_load_note_does_not_mask_unexpected_runtime_errors(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        note = tmp_path / "note.md"
+        note.write_text("Body", encoding="utf-8")
 
-    def test_load_note_does_not_mask_unexpected_runtime_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        def _boom(_path: Path) -> None:
+        def _boom(_text: str) -> None:
             raise RuntimeError("unexpected parser failure")
 
-        monkeypatch.setattr("scribae.io_utils.frontmatter.load", _boom)
+        monkeypatch.setattr("scribae.io_utils._split_frontmatter", _boom)
 
         with pytest.raises(RuntimeError, match="unexpected parser failure"):
-            load_note(Path("note.md"), max_chars=100)
+            load_note(note, max_chars=100)
+
+
+class TestLoadNoteTitle:
+    def test_front_matter_title_is_trimmed(self, tmp_path: Path) -> None:
+        note = tmp_path / "note.md"
+        note.write_text("---\ntitle: '  Padded title  '\n---\n\n  Body  \n", encoding="utf-8")
+
+        details = load_note(note, max_chars=100)
+
+        assert details.title == "Padded title"
+        assert details.body == "Body"
+
+    def test_non_string_front_matter_title_is_coerced(self, tmp_path: Path) -> None:
+        note = tmp_path / "note.md"
+        note.write_text("---\ntitle: 2024\n---\nBody\n", encoding="utf-8")
+
+        assert load_note(note, max_chars=100).title == "2024"
+
+
+class TestLoadNotes:
+    def test_returns_notes_in_input_order(self, tmp_path: Path) -> None:
+        paths = []
+        for idx in range(5):
+            path = tmp_path / f"note-{idx}.md"
+            path.write_text(f"---\ntitle: Note {idx}\n---\nBody {idx}\n", encoding="utf-8")
+            paths.append(path)
+
+        notes = load_notes(paths, max_chars=100, max_workers=2)
+
+        assert [note.title for note in notes] == [f"Note {idx}" for idx in range(5)]
+        assert [note.body for note in notes] == [f"Body {idx}" for idx in range(5)]
+
+    def test_missing_note_raises_file_not_found(self, tmp_path: Path) -> None:
+        present = tmp_path / "present.md"
+        present.write_text("Body", encoding="utf-8")
+
+        with pytest.raises(FileNotFoundError, match="missing.md"):
+            load_notes([present, tmp_path / "missing.md"], max_chars=100)
+
+
+class TestLoadLargeNote:
+    @pytest.mark.parametrize("max_chars", [10, 5_000, 1_000_000])
+    def test_mapped_read_matches_full_parse(self, tmp_path: Path, max_chars: int) -> None:
+        text = "\n---\ntitle: Größe\nlang: de\n---\n\n" + "Ähnliche Übersicht für Einsteiger – ✓ " * 4_000 + "\n\n"
+        note = tmp_path / "large.md"
+        note.write_text(text, encoding="utf-8")
+        assert note.stat().st_size > 64 * 1024
+
+        metadata, body = _split_frontmatter(text)
+        expected_body, expected_truncated = truncate(body, max_chars)
+
+        details = load_note(note, max_chars=max_chars)
+
+        assert details.metadata == metadata
+        assert details.title == "Größe"
+        assert details.body == expected_body
+        assert details.truncated is expected_truncated
+
+    def test_json_frontmatter_sets_title_and_leaves_body(self, tmp_path: Path) -> None:
+        for name, filler in (("small.md", ""), ("large.md", "Body line.\n" * 8_000)):
+            note = tmp_path / name
+            note.write_text('{\n"title": "From JSON"\n}\n\nBody line.\n' + filler, encoding="utf-8")
+
+            details = load_note(note, max_chars=50)
+
+            assert details.metadata == {"title": "From JSON"}
+            assert details.title == "From JSON"
+            assert details.body.startswith("Body line.")
+
+    def test_mapped_read_translates_windows_newlines(self, tmp_path: Path) -> None:
+        text = "---\r\ntitle: Windows\r\n---\r\n\r\n" + "line one\r\nline two\r\n" * 5_000
+        note = tmp_path / "crlf.md"
+        note.write_bytes(text.encode("utf-8"))
+
+        details = load_note(note, max_chars=40)
+
+        assert details.title == "Windows"
+        assert details.body == "line one\nline two\nline one\nline two\nlin …"
+        assert details.truncated is True
+
+    def test_mapped_read_only_decodes_the_kept_prefix(self, tmp_path: Path) -> None:
+        note = tmp_path / "huge.md"
+        note.write_bytes(b"---\ntitle: Huge\n---\n" + b"word " * 20_000 + b"\xff\xfe")
+
+        details = load_note(note, max_chars=100)
+
+        assert details.truncated is True
+        assert details.body == ("word " * 20)[:99].rstrip() + " …"
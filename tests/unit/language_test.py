@@ -121,9 +121,67 @@ def test_default_language_detector_uses_lingua(monkeypatch: pytest.MonkeyPatch)
         LanguageDetectorBuilder = FakeBuilder
 
     monkeypatch.setitem(sys.modules, "lingua", FakeLinguaModule())
+    language._default_language_detector.cache_clear()
 
-    detector = language._default_language_detector()
-    detected = detector("Bonjour le monde")
+    try:
+        detector = language._default_language_detector()
+        detected = detector("Bonjour le monde")
 
-    assert detected == "fr"
-    assert captured["text"] == "Bonjour le monde"
+        assert detected == "fr"
+        assert captured["text"] == "Bonjour le monde"
+        assert language._default_language_detector() is detector
+    finally:
+        language._default_language_detector.cache_clear()
+
+
+def test_validate_language_skips_detector_for_plain_english(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail() -> None:
+        raise AssertionError("detector should not be built")
+
+    monkeypatch.setattr(language, "_default_language_detector", _fail)
+
+    language._validate_language("The draft covers the basics well.", "en-US")
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("The draft covers the basics well.", "de"),  # not expecting English
+        ("Het concept is goed en duidelijk.", "en"),  # ASCII but no English marker
+        ("The café menu is short.", "en"),  # non-ASCII
+    ],
+)
+def test_validate_language_uses_detector_outside_fast_path(
+    monkeypatch: pytest.MonkeyPatch, text: str, expected: str
+) -> None:
+    calls: list[str] = []
+
+    def _detect(sample: str) -> str:
+        calls.append(sample)
+        return expected
+
+    monkeypatch.setattr(language, "_default_language_detector", lambda: _detect)
+
+    language._validate_language(text, expected)
+
+    assert calls == [text]
+
+
+def test_default_detection_is_memoized_per_detector(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _detect(sample: str) -> str:
+        calls.append(sample)
+        return "de"
+
+    monkeypatch.setattr(language, "_default_language_detector", lambda: _detect)
+    language._detect_with_default.cache_clear()
+
+    try:
+        assert language.detect_language("Ein kurzer Text.") == "de"
+        assert language.detect_language("Ein kurzer Text.") == "de"
+        assert language.detect_language("Noch ein Text.") == "de"
+    finally:
+        language._detect_with_default.cache_clear()
+
+    assert calls == ["Ein kurzer Text.", "Noch ein Text."]
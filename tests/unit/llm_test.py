@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic_ai.settings import ModelSettings
+
+from scribae.llm import (
+    OpenAISettings,
+    RateLimiter,
+    close_http_client,
+    make_model,
+    run_sync,
+    shared_http_client,
+    with_timeout,
+)
+
+
+def test_run_sync_reuses_event_loop_between_calls() -> None:
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    first = run_sync(_current_loop())
+    second = run_sync(_current_loop())
+
+    assert first is second
+    assert not first.is_closed()
+
+
+def test_run_sync_propagates_errors_and_keeps_loop_usable() -> None:
+    async def _boom() -> None:
+        raise ValueError("boom")
+
+    async def _ok() -> str:
+        return "ok"
+
+    with pytest.raises(ValueError, match="boom"):
+        run_sync(_boom())
+
+    assert run_sync(_ok()) == "ok"
+
+
+def test_shared_http_client_is_reused_until_closed() -> None:
+    first = shared_http_client()
+
+    assert shared_http_client() is first
+
+    close_http_client()
+
+    assert first.is_closed
+    replacement = shared_http_client()
+    assert replacement is not first
+    close_http_client()
+
+
+def test_make_model_uses_shared_http_client() -> None:
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+
+    first = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.2), settings=settings)
+    second = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.7), settings=settings)
+
+    assert first.client._client is second.client._client
+    close_http_client()
+
+
+def test_make_model_caches_models_per_settings() -> None:
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+
+    first = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.2, seed=1), settings=settings)
+    same = make_model("gpt-4o-mini", model_settings=ModelSettings(seed=1, temperature=0.2), settings=settings)
+    other = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.7), settings=settings)
+
+    assert same is first
+    assert other is not first
+    close_http_client()
+    rebuilt = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.2, seed=1), settings=settings)
+    assert rebuilt is not first
+    close_http_client()
+
+
+def test_make_model_reuses_provider_per_endpoint() -> None:
+    settings = OpenAISettings(base_url="http://example", api_key="secret")
+    other = OpenAISettings(base_url="http://other.example", api_key="secret")
+
+    first = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.2), settings=settings)
+    second = make_model("gpt-4o", model_settings=ModelSettings(temperature=0.7), settings=settings)
+    third = make_model("gpt-4o-mini", model_settings=ModelSettings(temperature=0.2), settings=other)
+
+    assert first.client is second.client
+    assert third.client is not first.client
+    close_http_client()
+
+
+def test_with_timeout_returns_result_and_raises_builtin_timeout() -> None:
+    async def _slow() -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    async def _fast() -> str:
+        return "ok"
+
+    assert run_sync(with_timeout(_fast(), 1)) == "ok"
+    with pytest.raises(TimeoutError):
+        run_sync(with_timeout(_slow(), 0.01))
+
+
+def test_rate_limiter_spaces_request_starts() -> None:
+    limiter = RateLimiter(per_minute=1200)  # one start every 50ms
+
+    async def _three_starts() -> list[float]:
+        loop = asyncio.get_running_loop()
+        starts: list[float] = []
+        for _ in range(3):
+            await limiter.acquire()
+            starts.append(loop.time())
+        return starts
+
+    starts = run_sync(_three_starts())
+
+    assert starts[1] - starts[0] >= 0.045
+    assert starts[2] - starts[1] >= 0.045
+
+
+def test_rate_limiter_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError, match="greater than zero"):
+        RateLimiter(per_minute=0)
@@ -56,3 +56,27 @@ def test_setup_logging_is_idempotent_for_handlers(tmp_path: Path) -> None:
     second = len(logger.handlers)
 
     assert first == second
+
+
+def test_setup_logging_skips_reconfiguration_for_same_arguments(tmp_path: Path) -> None:
+    _reset_scribae_logger()
+    log_file = tmp_path / "scribae.log"
+
+    logger = setup_logging(log_file=log_file)
+    handlers = list(logger.handlers)
+    setup_logging(log_file=log_file)
+
+    assert logger.handlers == handlers
+    setup_logging(verbose=True, log_file=log_file)
+    assert logger.handlers != handlers
+
+
+def test_setup_logging_opens_log_file_only_when_logging(tmp_path: Path) -> None:
+    _reset_scribae_logger()
+    log_file = tmp_path / "scribae.log"
+
+    logger = setup_logging(log_file=log_file)
+
+    assert not log_file.exists()
+    logger.info("first record")
+    assert log_file.exists()
@@ -1,13 +1,17 @@
+import importlib
 import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+import typer
 from faker import Faker
 from typer.testing import CliRunner
 
 from scribae import __version__
 from scribae.brief import FaqItem, SeoBrief
-from scribae.main import app
+from scribae.main import _COMMANDS, app, app_callback
+from tests.conftest import cli_imported_modules
 
 runner = CliRunner()
 
@@ -161,6 +165,69 @@ def test_brief_dry_run_prints_prompt(monkeypatch: pytest.MonkeyPatch, note_file:
     assert "[NOTE CONTENT]" in result.stdout
 
 
+_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+_LLM_STACK = {"pydantic_ai", "httpx"}
+
+
+@pytest.mark.parametrize(
+    ("args", "not_loaded"),
+    [
+        (["--help"], _LLM_STACK | {"frontmatter", "emoji"}),
+        (["version"], _LLM_STACK),
+        (["brief", "--note", "{note}", "--dry-run", "--language", "en"], _LLM_STACK),
+        (
+            ["feedback", "--body", "{body}", "--brief", "{brief}", "--dry-run", "--language", "en"],
+            _LLM_STACK,
+        ),
+    ],
+    ids=["help", "version", "brief-dry-run", "feedback-dry-run"],
+)
+def test_command_does_not_load_llm_stack(
+    args: list[str], not_loaded: set[str], tmp_path: Path, note_file: Path
+) -> None:
+    paths = {
+        "note": str(note_file),
+        "body": str(_FIXTURES_DIR / "body_without_frontmatter.md"),
+        "brief": str(_FIXTURES_DIR / "brief_valid.json"),
+    }
+
+    loaded = cli_imported_modules([arg.format(**paths) for arg in args], cwd=tmp_path)
+
+    assert not loaded & not_loaded
+    if args[0] != "--help":
+        # Only the invoked command's module is imported; the others stay lazy.
+        assert {name for name in loaded if name.startswith("scribae.") and name.endswith("_cli")} == {
+            f"scribae.{args[0]}_cli"
+        }
+
+
+def _eager_app() -> typer.Typer:
+    """Register every subcommand up front, the way the CLI did before lazy loading."""
+    eager = typer.Typer(context_settings={"help_option_names": ["-h", "--help"]})
+    eager.callback(invoke_without_command=True)(app_callback)
+    for name, (module_name, attr, help_text) in _COMMANDS.items():
+        module = importlib.import_module(f"scribae.{module_name}")
+        eager.command(name, help=help_text)(getattr(module, attr))
+    return eager
+
+
+@pytest.mark.parametrize("command", sorted(_COMMANDS))
+def test_lazy_subcommand_help_matches_eager_registration(command: str) -> None:
+    lazy = runner.invoke(app, [command, "--help"])
+    eager = runner.invoke(_eager_app(), [command, "--help"])
+
+    assert lazy.exit_code == 0, lazy.output
+    assert lazy.output == eager.output
+    assert "--install-completion" not in lazy.output
+
+
+def test_unknown_command_suggests_lazily_registered_name() -> None:
+    result = runner.invoke(app, ["breif"])
+
+    assert result.exit_code != 0
+    assert "Did you mean 'brief'?" in result.stderr
+
+
 def test_brief_save_prompt_creates_files(
     monkeypatch: pytest.MonkeyPatch,
     note_file: Path,
@@ -195,6 +262,95 @@ def test_brief_save_prompt_creates_files(
     assert note_body in note_snapshot.read_text(encoding="utf-8")
 
 
+def test_brief_batch_writes_one_file_per_note(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake: Faker,
+) -> None:
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    for name in ("first-note.md", "second_note.md"):
+        (notes_dir / name).write_text(f"{fake.paragraph()}\n", encoding="utf-8")
+    brief_obj = _fake_brief(fake)
+    seen: list[int] = []
+
+    def _fake_batch(
+        contexts: list[object], *, on_result: Callable[[int, SeoBrief], None], **_: object
+    ) -> list[SeoBrief]:
+        seen.append(len(contexts))
+        for index in range(len(contexts)):
+            on_result(index, brief_obj)
+        return [brief_obj for _ in contexts]
+
+    monkeypatch.setattr("scribae.brief.generate_briefs_batch", _fake_batch)
+    out_dir = tmp_path / "briefs"
+
+    result = runner.invoke(app, ["brief", "--batch", str(notes_dir), "--out-dir", str(out_dir)])
+
+    assert result.exit_code == 0, result.stderr
+    assert seen == [2]
+    assert sorted(path.name for path in out_dir.iterdir()) == ["01-first-note.json", "02-second-note.json"]
+    payload = json.loads((out_dir / "01-first-note.json").read_text(encoding="utf-8"))
+    assert payload["title"] == brief_obj.title
+
+
+def test_brief_batch_collect_keeps_going_after_write_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake: Faker
+) -> None:
+    from scribae.batch import BatchEntry, BatchManifest, BatchOutcome, write_manifest
+
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory", encoding="utf-8")
+    good_path = tmp_path / "02-good.json"
+    write_manifest(
+        tmp_path,
+        BatchManifest(
+            batch_id="batch_abc",
+            command="brief",
+            entries=[
+                BatchEntry(custom_id="01-bad", outputs=[str(blocked / "01-bad.json")]),
+                BatchEntry(custom_id="02-good", outputs=[str(good_path)]),
+            ],
+        ),
+    )
+    content = _fake_brief(fake).model_dump_json()
+    monkeypatch.setattr(
+        "scribae.brief_cli.collect_batch",
+        lambda batch_id: {"01-bad": BatchOutcome(content=content), "02-good": BatchOutcome(content=content)},
+    )
+
+    result = runner.invoke(app, ["brief", "--batch-collect", "batch_abc", "--out-dir", str(tmp_path)])
+
+    assert result.exit_code != 0
+    assert "01-bad: Unable to write brief" in result.stderr
+    assert json.loads(good_path.read_text(encoding="utf-8")) == json.loads(content)
+
+
+def test_brief_rejects_note_and_batch_together(note_file: Path, tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        ["brief", "--note", str(note_file), "--batch", str(tmp_path), "--out-dir", str(tmp_path / "out")],
+    )
+
+    assert result.exit_code != 0
+    assert "exactly one of --note or --batch" in result.stderr
+
+
+@pytest.mark.parametrize(
+    ("note_arg", "message"),
+    [("missing.md", "does not exist"), (".", "is not a regular file")],
+)
+def test_brief_rejects_unusable_note_path(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, note_arg: str, message: str
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["brief", "--note", note_arg, "--json"])
+
+    assert result.exit_code == 2
+    assert message in result.stderr
+
+
 def test_version_command_outputs_version() -> None:
     result = runner.invoke(app, ["version"])
 
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
 from typer.testing import CliRunner
 
 from scribae.main import app
-from scribae.meta import ArticleMeta
+from scribae.meta import ArticleMeta, OverwriteMode, generate_metadata, prepare_context
+from scribae.project import default_project
+from tests.conftest import FakeOpenAIServer
 
 runner = CliRunner()
 
@@ -478,3 +482,186 @@ def test_meta_seed_and_top_p_optional(
     assert result.exit_code == 0, result.stderr
     assert captured_kwargs.get("seed") is None
     assert captured_kwargs.get("top_p") is None
+
+
+def test_meta_reuses_cached_response_for_identical_request(
+    monkeypatch: pytest.MonkeyPatch, body_without_frontmatter: Path, brief_path: Path, tmp_path: Path
+) -> None:
+    stub = StubLLM()
+    monkeypatch.setattr("scribae.meta._invoke_agent", stub)
+    args = ["meta", "--body", str(body_without_frontmatter), "--brief", str(brief_path), "--overwrite", "all"]
+
+    first = runner.invoke(app, [*args, "--out", str(tmp_path / "first.json")])
+    second = runner.invoke(app, [*args, "--out", str(tmp_path / "second.json")])
+    uncached = runner.invoke(app, [*args, "--out", str(tmp_path / "third.json"), "--no-cache"])
+
+    assert first.exit_code == second.exit_code == uncached.exit_code == 0
+    assert len(stub.prompts) == 2
+    assert (tmp_path / "first.json").read_text(encoding="utf-8") == (tmp_path / "second.json").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_meta_cache_is_scoped_to_the_endpoint(
+    monkeypatch: pytest.MonkeyPatch, body_without_frontmatter: Path, brief_path: Path, tmp_path: Path
+) -> None:
+    stub = StubLLM()
+    monkeypatch.setattr("scribae.meta._invoke_agent", stub)
+    args = ["meta", "--body", str(body_without_frontmatter), "--brief", str(brief_path), "--overwrite", "all"]
+
+    monkeypatch.setenv("OPENAI_API_BASE", "http://localhost:11434/v1")
+    local = runner.invoke(app, [*args, "--out", str(tmp_path / "local.json")])
+    monkeypatch.setenv("OPENAI_API_BASE", "https://api.example.com/v1")
+    remote = runner.invoke(app, [*args, "--out", str(tmp_path / "remote.json")])
+
+    assert local.exit_code == remote.exit_code == 0
+    assert len(stub.prompts) == 2
+
+
+def test_generate_metadata_streams_chunks_before_validating(body_without_frontmatter: Path, brief_path: Path) -> None:
+    from pydantic_ai import Agent, NativeOutput
+    from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+    payload = StubLLM().meta.model_dump_json()
+
+    async def _stream(messages: list[Any], info: AgentInfo) -> AsyncIterator[str]:
+        for start in range(0, len(payload), 16):
+            yield payload[start : start + 16]
+
+    agent = Agent[None, ArticleMeta](
+        FunctionModel(stream_function=_stream),
+        output_type=NativeOutput(ArticleMeta, name="ArticleMeta", strict=True),
+    )
+    context = prepare_context(
+        body_path=body_without_frontmatter,
+        brief_path=brief_path,
+        project=default_project(),
+        overwrite=OverwriteMode.from_raw("all"),
+        max_chars=8000,
+        language="en",
+    )
+    chunks: list[str] = []
+
+    meta = generate_metadata(
+        context,
+        model_name="test",
+        temperature=0.2,
+        agent=agent,
+        on_token=chunks.append,
+        language_detector=lambda text: "en",
+    )
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == payload
+    assert meta.slug == "llm-suggested-title"
+
+
+def test_meta_batch_writes_output_per_body(
+    monkeypatch: pytest.MonkeyPatch, fixtures_dir: Path, brief_path: Path, tmp_path: Path
+) -> None:
+    stub = StubLLM()
+
+    async def _fake_run_agent(agent: object, prompt: str, *, timeout_seconds: float) -> ArticleMeta:
+        return stub(agent, prompt, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr("scribae.meta._run_agent", _fake_run_agent)
+    bodies = tmp_path / "drafts"
+    bodies.mkdir()
+    for name in ("b-second.md", "a-first.md"):
+        (bodies / name).write_text((fixtures_dir / "body_without_frontmatter.md").read_text(encoding="utf-8"))
+    out_dir = tmp_path / "meta"
+
+    result = runner.invoke(
+        app,
+        [
+            "meta",
+            "--batch",
+            str(bodies),
+            "--brief",
+            str(brief_path),
+            "--overwrite",
+            "all",
+            "--format",
+            "frontmatter",
+            "--out-dir",
+            str(out_dir),
+            "--no-cache",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert sorted(path.name for path in out_dir.iterdir()) == [
+        "01-a-first.frontmatter.yaml",
+        "02-b-second.frontmatter.yaml",
+    ]
+    assert len(stub.prompts) == 2
+
+
+@pytest.mark.parametrize("concurrency", ["1", "4"])
+def test_meta_batch_calls_endpoint_for_every_body(
+    openai_server: FakeOpenAIServer, fixtures_dir: Path, brief_path: Path, tmp_path: Path, concurrency: str
+) -> None:
+    openai_server.content = StubLLM().meta.model_dump_json()
+    bodies = tmp_path / "drafts"
+    bodies.mkdir()
+    for name in ("c-third.md", "b-second.md", "a-first.md"):
+        (bodies / name).write_text((fixtures_dir / "body_without_frontmatter.md").read_text(encoding="utf-8"))
+    out_dir = tmp_path / "meta"
+
+    result = runner.invoke(
+        app,
+        [
+            "meta",
+            "--batch",
+            str(bodies),
+            "--brief",
+            str(brief_path),
+            "--overwrite",
+            "all",
+            "--out-dir",
+            str(out_dir),
+            "--no-cache",
+            "--concurrency",
+            concurrency,
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert len(openai_server.requests) == 3
+    assert sorted(path.name for path in out_dir.iterdir()) == ["01-a-first.json", "02-b-second.json", "03-c-third.json"]
+    assert json.loads((out_dir / "01-a-first.json").read_text(encoding="utf-8"))["slug"] == "llm-suggested-title"
+
+
+def test_meta_batch_requires_out_dir(brief_path: Path, tmp_path: Path) -> None:
+    result = runner.invoke(app, ["meta", "--batch", str(tmp_path), "--out", str(tmp_path / "meta.json")])
+
+    assert result.exit_code != 0
+    assert "--out-dir" in result.stderr
+
+
+def test_prepare_contexts_parses_shared_brief_once(
+    monkeypatch: pytest.MonkeyPatch, body_without_frontmatter: Path, body_with_frontmatter: Path, brief_path: Path
+) -> None:
+    import scribae.meta as meta
+
+    calls: list[Path | None] = []
+    original = meta._load_brief
+
+    def _counting_load_brief(path: Path | None) -> Any:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(meta, "_load_brief", _counting_load_brief)
+
+    contexts = meta.prepare_contexts(
+        [body_without_frontmatter, body_with_frontmatter],
+        brief_path=brief_path,
+        project=default_project(),
+        overwrite=OverwriteMode.from_raw("missing"),
+        max_chars=8000,
+        language="en",
+    )
+
+    assert calls == [brief_path]
+    assert [context.body.path for context in contexts] == [body_without_frontmatter, body_with_frontmatter]
+    assert contexts[0].brief is contexts[1].brief
@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 from faker import Faker
 
-from scribae.project import default_project, load_default_project, load_project
+from scribae.project import default_project, keywords_text, load_default_project, load_project
 
 
 def test_load_project_merges_defaults(tmp_path: Path, fake: Faker) -> None:
@@ -48,7 +48,9 @@ def test_load_project_uses_explicit_path(tmp_path: Path, fake: Faker) -> None:
 def test_default_project_returns_copy() -> None:
     config = default_project()
     config["site_name"] = "Changed"
+    config["keywords"].append("changed")
     assert default_project()["site_name"] == "Scribae"
+    assert default_project()["keywords"] == []
 
 
 def test_load_default_project_finds_scribae_yaml(tmp_path: Path, fake: Faker) -> None:
@@ -95,3 +97,26 @@ def test_load_default_project_raises_on_invalid_yaml(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="Invalid YAML"):
         load_default_project(base_dir=tmp_path)
+
+
+def test_load_project_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "site.yaml"
+    path.write_text("site_name: First\nkeywords: [a]\n", encoding="utf-8")
+
+    first = load_project(str(path))
+    first["keywords"].append("mutated")
+    again = load_project(str(path))
+    path.write_text("site_name: Second site\nkeywords: [b]\n", encoding="utf-8")
+    changed = load_project(str(path))
+
+    assert again["keywords"] == ["a"]
+    assert changed["site_name"] == "Second site"
+    assert changed["keywords"] == ["b"]
+
+
+def test_keywords_text_joins_keywords_or_reports_none() -> None:
+    project = default_project()
+    assert keywords_text(project) == "none"
+
+    project["keywords"] = ["seo", "notes"]
+    assert keywords_text(project) == "seo, notes"
@@ -1,11 +1,15 @@
+import pytest
 from faker import Faker
 
 from scribae.brief import FaqItem, SeoBrief
 from scribae.idea import Idea
-from scribae.project import ProjectConfig
+from scribae.project import ProjectConfig, default_project
 from scribae.prompts.brief import SYSTEM_PROMPT, build_prompt_bundle, build_user_prompt
+from scribae.prompts.refine import build_user_prompt as build_refine_prompt
+from scribae.prompts.templating import compile_template
 from scribae.prompts.write import build_faq_prompt
 from scribae.prompts.write import build_user_prompt as build_writer_prompt
+from scribae.refine import EvidenceMode, RefinementIntensity
 
 
 def test_build_user_prompt_includes_project_details(fake: Faker) -> None:
@@ -62,6 +66,30 @@ def test_build_prompt_bundle_uses_system_prompt(fake: Faker) -> None:
     assert "Output directive: write the entire brief in language code" in bundle.user_prompt
 
 
+def test_build_user_prompt_embeds_note_content_between_sections(fake: Faker) -> None:
+    project: ProjectConfig = {
+        "site_name": fake.company(),
+        "domain": fake.url(),
+        "audience": fake.sentence(nb_words=3),
+        "tone": fake.word(),
+        "keywords": [],
+        "language": "en",
+        "allowed_tags": None,
+    }
+    note_content = "\n\n".join(fake.paragraphs(nb=3))
+
+    prompt = build_user_prompt(
+        project=project,
+        note_title=fake.sentence(nb_words=3),
+        note_content=f"\n  {note_content}\n\n",
+        language="en",
+    )
+
+    assert prompt == prompt.strip()
+    assert prompt.startswith("[PROJECT CONTEXT]\n")
+    assert f"[NOTE CONTENT]\n{note_content}\n\n[SCHEMA EXAMPLE]\n" in prompt
+
+
 def test_writer_prompt_contains_language_directive(fake: Faker) -> None:
     project: ProjectConfig = {
         "site_name": fake.company(),
@@ -175,3 +203,91 @@ def test_build_user_prompt_includes_idea_block(fake: Faker) -> None:
     assert "[IDEA]" in prompt
     assert idea.title in prompt
     assert idea.id in prompt
+
+
+def test_build_user_prompt_keeps_idea_block_flush_for_multiline_descriptions(fake: Faker) -> None:
+    project: ProjectConfig = {
+        "site_name": fake.company(),
+        "domain": fake.url(),
+        "audience": fake.sentence(nb_words=3),
+        "tone": fake.word(),
+        "keywords": [],
+        "language": "en",
+        "allowed_tags": None,
+    }
+    idea = Idea(
+        id=fake.slug(),
+        title=fake.sentence(nb_words=6),
+        description=f"{fake.sentence()}\n{fake.sentence()}",
+        why=fake.sentence(),
+    )
+
+    prompt = build_user_prompt(
+        project=project,
+        note_title=fake.sentence(nb_words=3),
+        note_content=fake.paragraph(),
+        language=project["language"],
+        idea=idea,
+    )
+
+    assert f"[IDEA]\nId: {idea.id}\nTitle: {idea.title}\n" in prompt
+    assert f"\nWhy: {idea.why}\n" in prompt
+
+
+def test_compiled_template_matches_str_format() -> None:
+    template = "{{literal}} {name}: {count:>3} [{name}]"
+    render = compile_template(template)
+
+    assert render(name="x", count=7, unused="y") == template.format(name="x", count=7, unused="y")
+    with pytest.raises(KeyError):
+        render(name="x")
+
+
+@pytest.mark.parametrize("template", ["{idea.title}", "{0}", "{}", "{name!r}"])
+def test_compile_template_rejects_unsupported_fields(template: str) -> None:
+    with pytest.raises(ValueError, match="Unsupported template field"):
+        compile_template(template)
+
+
+def test_refine_prompt_style_rules_are_one_flat_block() -> None:
+    brief = SeoBrief(
+        primary_keyword="alpha",
+        secondary_keywords=["beta"],
+        search_intent="informational",
+        audience="Audience text",
+        angle="Angle text",
+        title="Title text",
+        h1="Heading",
+        outline=["One", "Two", "Three", "Four", "Five", "Six"],
+        faq=[
+            FaqItem(question="What is this?", answer="This is a sufficiently long answer for testing."),
+            FaqItem(question="Why now?", answer="Because validation expects at least two entries with real text."),
+        ],
+        meta_description="A sufficiently long meta description for testing refine prompts.",
+    )
+
+    prompt = build_refine_prompt(
+        project=default_project(),
+        brief=brief,
+        section_title="One",
+        draft_body="Draft text.",
+        note_snippets="",
+        feedback=None,
+        evidence_mode=EvidenceMode.REQUIRED,
+        intensity=RefinementIntensity.STRONG,
+        language="en",
+        apply_feedback=False,
+        source_label="NOTE",
+    )
+
+    rules = prompt.split("[STYLE RULES]\n", 1)[1].split("\n\n", 1)[0].splitlines()
+    assert "Intensity: strong" in prompt
+    assert rules == [
+        "- Rewrite more aggressively for clarity and structure.",
+        "- Reorder sentences to improve flow while staying within the brief.",
+        "- Preserve Markdown structure where possible.",
+        "- Keep the original intent and key facts.",
+        "- Do not add new headings.",
+        "- Maintain the brief tone and audience.",
+        '- Evidence is required; if missing write exactly: "(no supporting evidence in the note)".',
+    ]
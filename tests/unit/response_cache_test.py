@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scribae.response_cache import ResponseCache, cache_key, default_cache_dir
+
+
+def _key(**overrides: object) -> str:
+    params: dict[str, object] = {
+        "model_name": "model",
+        "base_url": "http://localhost:11434/v1",
+        "temperature": 0.2,
+        "system_prompt": "system",
+        "user_prompt": "user",
+        "seed": None,
+    }
+    params.update(overrides)
+    return cache_key(**params)  # type: ignore[arg-type]
+
+
+def test_cache_key_covers_prompt_model_endpoint_and_sampling() -> None:
+    assert _key() == _key()
+    assert _key(temperature=0.2000001) == _key()
+    for override in (
+        {"model_name": "other"},
+        {"base_url": "https://api.example.com/v1"},
+        {"temperature": 0.3},
+        {"user_prompt": "changed"},
+        {"seed": 7},
+    ):
+        assert _key(**override) != _key()
+
+
+def test_response_cache_round_trip_and_expiry(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache", ttl_seconds=60)
+
+    assert cache.get("abc") is None
+    cache.put("abc", '{"title": "cached"}')
+    assert cache.get("abc") == '{"title": "cached"}'
+    assert sorted(path.name for path in cache.directory.iterdir()) == ["abc.json"]
+
+    stale = time.time() - 120
+    os.utime(cache.directory / "abc.json", (stale, stale))
+    assert cache.get("abc") is None
+
+
+def test_response_cache_ignores_write_failures(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+
+    ResponseCache(blocker).put("abc", "{}")
+
+    assert ResponseCache(blocker).get("abc") is None
+
+
+def test_default_cache_dir_honours_xdg_cache_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_cache_dir() == tmp_path / "scribae"
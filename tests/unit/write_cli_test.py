@@ -7,6 +7,7 @@ from typer.testing import CliRunner
 
 from scribae.main import app
 from scribae.write import WritingLLMError
+from tests.conftest import FakeOpenAIServer
 
 runner = CliRunner()
 
@@ -306,3 +307,16 @@ def test_write_seed_and_top_p_optional(recording_llm: RecordingLLM, note_path: P
     assert len(recording_llm.kwargs_log) == 1
     assert recording_llm.kwargs_log[0]["seed"] is None
     assert recording_llm.kwargs_log[0]["top_p"] is None
+
+
+def test_write_calls_endpoint_for_every_section(
+    monkeypatch: pytest.MonkeyPatch, openai_server: FakeOpenAIServer, note_path: Path, brief_path: Path
+) -> None:
+    openai_server.content = "Observability starts with good logs."
+    monkeypatch.setattr("scribae.language._default_language_detector", lambda: lambda _text: "en")
+
+    result = runner.invoke(app, ["write", "--note", str(note_path), "--brief", str(brief_path)])
+
+    assert result.exit_code == 0, result.stderr
+    assert len(openai_server.requests) == 6
+    assert result.stdout.count("Observability starts with good logs.") == 6